@@ -75,6 +75,8 @@ setup(
             "IPython",
         ],
         "tests": ["pytest"],
+        "opentelemetry": ["opentelemetry-api"],
+        "zstd": ["zstandard"],
     },
     python_requires=">=3.10.0",
     long_description=long_description,
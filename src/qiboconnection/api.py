@@ -15,33 +15,59 @@
 """Qiboconnection API class."""
 
 import json
+import threading
 import warnings
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
-from time import sleep
-from typing import Any, List, cast
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, cast
 
-from numpy import typing as npt
-from qibo.models.circuit import Circuit  # type: ignore[import-untyped]
-from qibo.result import CircuitResult  # type: ignore[import-untyped]
 from requests import HTTPError, codes
-from typeguard import typechecked
-
-from qiboconnection.api_utils import log_job_status_info, parse_job_responses_to_results
+from requests import Timeout as RequestsTimeout
+
+from qiboconnection.api_utils import (
+    log_job_status_info,
+    merge_circuit_results,
+    parse_job_responses_to_results,
+    split_shots,
+)
+from qiboconnection.circuit_breaker import CircuitBreaker
 from qiboconnection.config import logger
 from qiboconnection.connection import Connection
 from qiboconnection.constants import API_CONSTANTS, REST, REST_ERROR
-from qiboconnection.errors import ConnectionException, RemoteExecutionException
-from qiboconnection.models import Calibration, Job, JobListing, Runcard
+from qiboconnection.deduplication import SubmissionIndex, job_request_hash
+from qiboconnection.device_watcher import DeviceWatcher
+from qiboconnection.errors import (
+    ConnectionException,
+    PartialSubmissionException,
+    RemoteExecutionException,
+    UpdateConflictException,
+)
+from qiboconnection.instrumentation import RequestHook
+from qiboconnection.models import Calibration, Job, JobHistory, JobListing, JobListingItem, JobRecord, Runcard
 from qiboconnection.models.devices import Device, Devices, create_device
+from qiboconnection.scheduling import DeviceScheduler
+from qiboconnection.throttling import RateLimit, Throttle
+from qiboconnection.timeouts import Timeout, TimeoutPolicy, deadline
+from qiboconnection.tracing import span, traced
+from qiboconnection.transport import Transport
+from qiboconnection.typechecking import typechecked
+from qiboconnection.typings.compact import CompactModel, compact_model
 from qiboconnection.typings.connection import ConnectionConfiguration
 from qiboconnection.typings.enums import JobStatus
 from qiboconnection.typings.job_data import JobData
 from qiboconnection.typings.responses import CalibrationResponse, JobListingItemResponse, RuncardResponse
 from qiboconnection.typings.responses.job_response import JobResponse
 from qiboconnection.typings.vqa import VQA
-from qiboconnection.util import unzip
+from qiboconnection.util import is_qibo_circuit, unzip
+
+if TYPE_CHECKING:
+    from numpy import typing as npt
+    from qibo.models.circuit import Circuit  # type: ignore[import-untyped]
+    from qibo.result import CircuitResult  # type: ignore[import-untyped]
 
 
 def warning_on_one_line(message, category, filename, lineno, line=None):
@@ -65,52 +91,119 @@ class API(ABC):
     _CALIBRATIONS_CALL_PATH = "/calibrations"
     _PING_CALL_PATH = "/status"
 
+    _IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+    _BULK_WORKERS = 8
+
     @typechecked
     def __init__(
         self,
         configuration: ConnectionConfiguration,
+        deduplication_ttl: float | None = None,
+        device_refresh_interval: float = 30.0,
+        device_cache_ttl: float = 0.0,
+        job_history_size: int | None = 1000,
+        keep_job_payloads: bool = False,
+        transport: Transport | None = None,
+        rate_limits: Dict[str, RateLimit] | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        timeouts: TimeoutPolicy | None = None,
     ):
-        self._connection = Connection(configuration=configuration, api_path=self._API_PATH)
+        """
+        Args:
+            configuration (ConnectionConfiguration): user info to authenticate with.
+            deduplication_ttl (float, optional): if provided, execute() remembers its submissions for this amount of
+                seconds. Submitting a job identical to a remembered one (same description, device, nshots, name and
+                summary) returns the id of the existing job instead of queuing a duplicate, and the hash of the job is
+                sent as an `Idempotency-Key` header so the server can deduplicate too.
+            device_refresh_interval (float): seconds during which the device listing used for selecting devices
+                automatically is reused before being fetched again.
+            device_cache_ttl (float): seconds during which the info of a device is reused by execute(),
+                select_device_ids() and the device status setters instead of being requested again. Disabled by
+                default, so the device is requested every time. Use `refresh_devices()` to force an update.
+            job_history_size (int, optional): number of submitted jobs kept in `jobs`. Once reached, the oldest ones are
+                discarded. 0 disables the history, and None keeps every job.
+            keep_job_payloads (bool): whether `jobs` keeps the whole submitted `Job` objects, with their circuits or
+                programs. By default only a lightweight `JobRecord` with the id, device and status of each job is kept,
+                so the payloads are released as soon as they are submitted.
+            transport (Transport, optional): if provided, transport making the HTTP calls, e.g. a `RecordingTransport`
+                saving the traffic or a `ReplayTransport` serving a recording back without network. Calls are made with
+                `requests` by default.
+            rate_limits (Dict[str, RateLimit], optional): if provided, the calls are throttled client-side with these
+                limits of rate and concurrency by endpoint class: 'auth', 'submission', 'polling', 'listing' or 'other'.
+                The limits are shared by every thread using this API, and throttled calls, answered with a 429 or a 503
+                with `Retry-After`, wait as asked by the server, slow their endpoint class down and are retried. An empty
+                dict only enables the latter.
+            circuit_breaker (CircuitBreaker, optional): if provided, calls fail fast with `CircuitOpenException` after
+                repeated failures of the server, instead of waiting for each of them to time out, until the server
+                answers to `ping()` again.
+            timeouts (TimeoutPolicy, optional): if provided, timeouts to connect, read and finish the calls by endpoint
+                class. By default, every call waits `QIBOCONNECTION_TIMEOUT` seconds, 10 if not set, to connect and to
+                read, except submissions and result downloads, which wait longer for the server to answer.
+        """
+        self._connection = Connection(
+            configuration=configuration,
+            api_path=self._API_PATH,
+            transport=transport,
+            throttle=Throttle(limits=rate_limits) if rate_limits is not None else None,
+            circuit_breaker=circuit_breaker,
+            timeouts=timeouts,
+        )
+        if circuit_breaker is not None and circuit_breaker.probe is None:
+            circuit_breaker.probe = self._is_alive
+        self._submission_index: SubmissionIndex | None = (
+            SubmissionIndex(ttl=deduplication_ttl) if deduplication_ttl is not None else None
+        )
         self._devices: Devices | None = None
-        self._jobs: List[Job] = []
+        self._device_cache_ttl = device_cache_ttl
+        self._devices_fetched_at: dict[int, float] = {}
+        self._devices_lock = threading.Lock()
+        self._scheduler = DeviceScheduler(fetch_devices=self.list_devices, refresh_interval=device_refresh_interval)
+        self._jobs = JobHistory(max_size=job_history_size)
+        self._keep_job_payloads = keep_job_payloads
         self._jobs_listing: JobListing | None = None
         self._selected_devices: List[Device] | None = None
         self._runcard: Runcard | None = None
         self._calibration: Calibration | None = None
+        self._partial_updates = True
+        self._bulk_job_calls = True
 
     @classmethod
-    def login(cls, username: str, api_key: str):
+    def login(cls, username: str, api_key: str, deduplication_ttl: float | None = None):
         """Log into QaaS using your username and api_key
 
         Args:
             username: username of your account
             api_key: you access key
+            deduplication_ttl: seconds during which identical submissions are deduplicated. Disabled if not provided.
 
         Returns:
             Authenticated API instance
         """
         _configuration = ConnectionConfiguration(username=username, api_key=api_key)
-        return cls(configuration=_configuration)
+        return cls(configuration=_configuration, deduplication_ttl=deduplication_ttl)
 
     # LOCAL INFORMATION
 
     @property
-    def jobs(self) -> List[Job]:
-        """List all jobs launched to the API
+    def jobs(self) -> List[Job | JobRecord]:
+        """List the latest jobs launched to the API, up to `job_history_size` of them
 
         Returns:
-            List[Job]: List of Jobs launched
+            List[Job | JobRecord]: List of Jobs launched, as records unless the API keeps the job payloads
         """
-        return self._jobs
+        return self._jobs.to_list()
 
     @property
-    def last_job(self) -> Job:
+    def last_job(self) -> Job | JobRecord:
         """Returns the last job launched
 
+        Raises:
+            IndexError: No jobs have been launched, or the job history is disabled.
+
         Returns:
-            Job: last Job launched
+            Job | JobRecord: last Job launched
         """
-        return self._jobs[-1]
+        return self._jobs.last()
 
     @property
     def last_runcard(self) -> Runcard | None:
@@ -145,6 +238,26 @@ class API(ABC):
 
         return self._connection.user.user_id
 
+    # INSTRUMENTATION
+
+    def add_request_hook(self, hook: RequestHook) -> None:
+        """Registers a function to call after every HTTP call made to the remote server, with a `RequestEvent`
+        describing its method, endpoint, status, sizes and timings. Register a `LatencyAggregator` to get latency
+        percentiles by endpoint.
+
+        Args:
+            hook (RequestHook): function to call
+        """
+        self._connection.add_request_hook(hook)
+
+    def remove_request_hook(self, hook: RequestHook) -> None:
+        """Unregisters a function added with `add_request_hook`
+
+        Args:
+            hook (RequestHook): function to remove
+        """
+        self._connection.remove_request_hook(hook)
+
     # PING
 
     def ping(self) -> str:
@@ -158,6 +271,14 @@ class API(ABC):
             raise ConnectionException("Error connecting to Qilimanjaro API")
         return response
 
+    def _is_alive(self) -> bool:
+        """Pings the server, returning whether it answered"""
+        try:
+            self.ping()
+        except Exception:  # noqa: BLE001 # any failure means the server is not available
+            return False
+        return True
+
     # DEVICES
 
     @typechecked
@@ -179,8 +300,43 @@ class API(ABC):
 
         items = [item for response in responses for item in response[REST.ITEMS]]
         self._devices = Devices([create_device(device_input=device_input) for device_input in items])
+        fetched_at = monotonic()
+        with self._devices_lock:
+            self._devices_fetched_at = {device.id: fetched_at for device in self._devices}
         return self._devices
 
+    @typechecked
+    def refresh_devices(self, device_ids: List[int] | None = None) -> Devices:
+        """Requests the info of the devices again, regardless of the device cache.
+
+        Args:
+            device_ids (List[int], optional): devices to refresh. If not provided, all the devices are listed again.
+
+        Returns:
+            Devices: updated devices
+        """
+        if device_ids is None:
+            return self.list_devices()
+        for device_id in device_ids:
+            self._devices = self._add_or_update_single_device(device_id=device_id)
+        return cast(Devices, self._devices)
+
+    def _get_cached_devices(self, device_id: int) -> Devices:
+        """Returns the devices, making sure the info of the given device is not older than the device cache ttl.
+        The device is only requested to the public api when it is not cached or its info is stale.
+
+        Args:
+            device_id: id of the device that is going to be used
+
+        Returns:
+            Devices: devices, including an up-to-date entry for `device_id`
+        """
+        with self._devices_lock:
+            fetched_at = self._devices_fetched_at.get(device_id)
+        if self._devices is not None and fetched_at is not None and monotonic() - fetched_at < self._device_cache_ttl:
+            return self._devices
+        return self._add_or_update_single_device(device_id=device_id)
+
     @typechecked
     def _add_or_update_single_device(self, device_id: int) -> Devices:
         """Requests the info of a specific device to the public api and updates its entry in _devices or creates a new
@@ -203,6 +359,8 @@ class API(ABC):
             raise RemoteExecutionException(message="Devices could not be retrieved.", status_code=status_code)
 
         new_device = create_device(device_input=response)
+        with self._devices_lock:
+            self._devices_fetched_at[new_device.id] = monotonic()
 
         if self._devices is None:
             self._devices = Devices([new_device])
@@ -224,7 +382,7 @@ class API(ABC):
             "This method is deprecated and will be removed in the following Qiboconnection release. Use device_id argument in execute() method instead."
         )
         self._selected_devices = []
-        self._devices = self._add_or_update_single_device(device_id=device_id)
+        self._devices = self._get_cached_devices(device_id=device_id)
         try:
             selected_device = self._devices.select_device(device_id=device_id)
             self._selected_devices = [selected_device]
@@ -242,7 +400,7 @@ class API(ABC):
         """
         self._selected_devices = []
         for device_id in device_ids:
-            self._devices = self._add_or_update_single_device(device_id=device_id)
+            self._devices = self._get_cached_devices(device_id=device_id)
             try:
                 self._selected_devices.append(self._devices.select_device(device_id=device_id))
             except HTTPError as ex:
@@ -254,6 +412,53 @@ class API(ABC):
         )
         logger.info(text)
 
+    @property
+    def scheduler(self) -> DeviceScheduler:
+        """Scheduler used for selecting devices automatically
+
+        Returns:
+            DeviceScheduler: device scheduler
+        """
+        return self._scheduler
+
+    @typechecked
+    def select_best_device(self, nqubits: int | None = None, device_type: str | None = None) -> Device:
+        """Returns the online device with the shortest queue among the ones able to run a job. Devices are chosen from
+        a periodically refreshed snapshot of the device listing, so no request is made while it is fresh. Until the next
+        snapshot, the selected device counts as having one more pending job, so consecutive jobs are spread out.
+
+        Args:
+            nqubits (int, optional): number of qubits the job needs
+            device_type (str, optional): type of device the job has to run on, as in `DeviceType`
+
+        Raises:
+            ValueError: No online device is able to run the job.
+
+        Returns:
+            Device: selected device
+        """
+        device = self._scheduler.select_device(nqubits=nqubits, device_type=device_type)
+        logger.info("Device %s selected automatically.", device.name)
+        return device
+
+    @typechecked
+    def watch_devices(self, interval: float = 10.0, max_interval: float = 300.0, start: bool = True) -> DeviceWatcher:
+        """Creates a watcher that polls the devices in the background and notifies their changes to the callbacks
+        registered with `DeviceWatcher.add_callback`. Use `DeviceWatcher.wait_until_online` to wait for a device.
+
+        Args:
+            interval (float): seconds between polls
+            max_interval (float): longest wait between polls when backing off after errors
+            start (bool): whether to start polling right away
+
+        Returns:
+            DeviceWatcher: device watcher. Call `stop()` on it, or use it as a context manager, to stop polling.
+        """
+        watcher = DeviceWatcher(fetch_devices=self.list_devices, interval=interval, max_interval=max_interval)
+        if start:
+            watcher.start()
+        return watcher
+
     @typechecked
     def set_device_to_online(self, device_id: int) -> None:
         """Sets a device into online mode, allowing external traffic and blocking manual manipulation.
@@ -264,7 +469,7 @@ class API(ABC):
         Args:
             device_id (int): Device identifier
         """
-        self._devices = self._add_or_update_single_device(device_id=device_id)
+        self._devices = self._get_cached_devices(device_id=device_id)
         try:
             self._devices.set_device_to_online(connection=self._connection, device_id=device_id)
         except HTTPError as ex:
@@ -283,7 +488,7 @@ class API(ABC):
             device_id (int): Device identifier
 
         """
-        self._devices = self._add_or_update_single_device(device_id=device_id)
+        self._devices = self._get_cached_devices(device_id=device_id)
         try:
             self._devices.set_device_to_maintenance(connection=self._connection, device_id=device_id)
         except HTTPError as ex:
@@ -292,10 +497,11 @@ class API(ABC):
 
     # REMOTE EXECUTIONS
 
+    @traced("qiboconnection.execute")
     @typechecked
     def execute(
         self,
-        circuit: Circuit | List[Circuit] | None = None,
+        circuit: "Circuit | List[Circuit] | None" = None,
         qprogram: str | None = None,
         anneal_program_args: dict | None = None,
         vqa: VQA | None = None,
@@ -304,6 +510,12 @@ class API(ABC):
         device_id: int | None = None,
         name: str = "-",
         summary: str = "-",
+        parameters: "List[List[float]] | npt.NDArray | None" = None,
+        template_sweep: bool = False,
+        split_shots: bool = False,
+        shot_weights: List[float] | None = None,
+        auto_select_device: bool = False,
+        device_type: str | None = None,
     ) -> List[int] | int:
         """Send a Qibo circuit(s) to be executed on the remote service API. User should define either a *circuit* or an
         *experiment*. If both are provided, the function will fail.
@@ -317,6 +529,20 @@ class API(ABC):
             device_ids (List[int]): list of devices where the execution should be performed. If set, any device set
             using API.select_device_id() will not be used. This will not update the selected devices.
             device_id (int): id of the device your job will be executed on
+            parameters (List[List[float]] | npt.NDArray): parameter sweep over a single template `circuit`. Each row is
+            a vector of trainable parameters, in the order of `circuit.get_parameters()`, and one circuit is executed
+            per row. The circuits are bound on the client and sent as a regular list of circuits.
+            template_sweep (bool): if True, the template circuit is serialized only once and sent together with the
+            parameter vectors, for the server to bind them. Only use it with servers supporting template sweeps, as
+            other servers execute the template circuit alone.
+            split_shots (bool): if True, `nshots` are split among the selected devices instead of being executed on
+            each of them, and the jobs are submitted concurrently. Results can be merged back with
+            `qiboconnection.api_utils.merge_circuit_results`, or by `execute_and_return_results`.
+            shot_weights (List[float]): weight of each selected device when splitting the shots. Defaults to favouring
+            the devices with fewer pending jobs.
+            auto_select_device (bool): if True, the job is executed on the online device with the shortest queue among
+            the ones with enough qubits for the circuits, as chosen by `select_best_device`.
+            device_type (str): when selecting the device automatically, type of device to choose, as in `DeviceType`.
 
         Returns:
             List[int]: list of job ids
@@ -324,6 +550,13 @@ class API(ABC):
         Raises:
             ValueError: VQA, circuit, qprogram and anneal_program_args were provided, but execute() only takes one of them.
             ValueError: Neither of circuit, vqa, qprogram or anneal_program_args were provided.
+            ValueError: Parameters can only be provided together with a single template circuit.
+            ValueError: Shots can only be split among devices for circuits.
+            ValueError: Shot weights should be provided for each selected device.
+            ValueError: Devices cannot be provided when selecting the device automatically.
+            ValueError: No online device is able to run the job.
+            PartialSubmissionException: some of the jobs were submitted, but not all of them. Their ids are kept in
+            the exception.
         """
 
         # Ensure provided selected_devices are valid. If not provided, use the ones selected by API.select_device_id.
@@ -343,13 +576,23 @@ class API(ABC):
                 "Use only device_id argument, device_ids is deprecated and will be removed in a following qiboconnection version."
             )
 
+        if split_shots and circuit is None:
+            raise ValueError("Shots can only be split among devices for circuits.")
+
+        if auto_select_device and (device_id is not None or device_ids is not None):
+            raise ValueError("Devices cannot be provided when selecting the device automatically.")
+
         if device_id is not None:
             device_ids = [device_id]
 
-        if device_ids is not None:
+        if auto_select_device:
+            circuits = [circuit] if is_qibo_circuit(circuit) else cast(List["Circuit"], circuit or [])
+            nqubits = max((c.nqubits for c in circuits), default=None)
+            selected_devices = [self.select_best_device(nqubits=nqubits, device_type=device_type)]
+        elif device_ids is not None:
             for device in device_ids:
                 try:
-                    self._devices = self._add_or_update_single_device(device_id=device)
+                    self._devices = self._get_cached_devices(device_id=device)
                     selected_devices.append(self._devices.select_device(device_id=device))
                 except HTTPError as ex:
                     logger.error(json.loads(str(ex))[REST_ERROR.DETAIL])
@@ -358,45 +601,164 @@ class API(ABC):
             selected_devices = cast(List[Device], self._selected_devices)
         if not selected_devices:
             raise ValueError("No devices were selected for execution.")
-        if isinstance(circuit, Circuit):
+        if is_qibo_circuit(circuit):
             circuit = [circuit]
+        shots_per_device = [nshots] * len(selected_devices)
+        if split_shots:
+            shots_per_device = self._split_shots_among_devices(
+                nshots=nshots, devices=selected_devices, shot_weights=shot_weights
+            )
+            selected_devices = [device for device, shots in zip(selected_devices, shots_per_device) if shots > 0]
+            shots_per_device = [shots for shots in shots_per_device if shots > 0]
         jobs = [
             Job(
                 circuit=circuit,
+                parameters=parameters,
+                template_sweep=template_sweep,
                 qprogram=qprogram,
                 anneal_program_args=anneal_program_args,
                 vqa=vqa,
-                nshots=nshots,
+                nshots=device_nshots,
                 name=name,
                 summary=summary,
                 user=self._connection.user,
                 device=cast(Device, device),
             )
-            for device in selected_devices
+            for device, device_nshots in zip(selected_devices, shots_per_device)
         ]
-        job_ids = []
+        # Every job executes the same program, so it is serialized only once and shared among devices.
+        description = jobs[0].description
+        escaped_description = jobs[0].escaped_description if len(jobs) > 1 else None
+        for job in jobs[1:]:
+            job.description = description
+            job.escaped_description = cast(bytes, escaped_description)
         logger.debug("Sending qibo circuits for a remote execution...")
-        for job in jobs:
-            response, status_code = self._connection.send_post_auth_remote_api_call(
-                path=self._CIRCUITS_CALL_PATH, data=asdict(job.job_request)
-            )
-            if status_code != codes.created:
-                raise RemoteExecutionException(
-                    message=f"Circuit {job.job_id} could not be executed.", status_code=status_code
-                )
-            logger.debug("Job circuit queued successfully.")
-            job.id = response[API_CONSTANTS.JOB_ID]
-            self._jobs.append(job)
-            job_ids.append(job.id)
-        if device_id is not None:
+        submissions = self._submit_jobs(jobs=jobs, concurrently=split_shots)
+        errors = [error for _, error in submissions if error is not None]
+        job_ids = []
+        for job, (submission, _) in zip(jobs, submissions):
+            if submission is None:
+                continue
+            job_id, submitted = submission
+            job_ids.append(job_id)
+            if submitted:
+                self._jobs.add(job if self._keep_job_payloads else JobRecord.from_job(job))
+        if errors:
+            if not job_ids:
+                raise errors[0]
+            raise PartialSubmissionException(
+                message=f"{len(errors)} of {len(jobs)} jobs could not be submitted. Jobs {job_ids} were submitted.",
+                status_code=getattr(errors[0], "status_code", None)
+                or getattr(getattr(errors[0], "response", None), "status_code", 0),
+                job_ids=job_ids,
+                errors=errors,
+            ) from errors[0]
+        if device_id is not None or auto_select_device:
             return job_ids[0]
         return job_ids
 
-    def _get_job(self, job_id: int) -> JobResponse:
+    def _submit_jobs(
+        self, jobs: List[Job], concurrently: bool
+    ) -> List[tuple[tuple[int, bool] | None, Exception | None]]:
+        """Submits every job, even if some of them fail, so the ones that were queued are not lost.
+
+        Args:
+            jobs (List[Job]): jobs to submit
+            concurrently (bool): whether to submit the jobs at the same time
+
+        Returns:
+            List[tuple[tuple[int, bool] | None, Exception | None]]: for each job, the outcome of `_submit_job`, or the
+            error that prevented it from being submitted.
+        """
+        if concurrently and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                # Each submission runs in a copy of the current context, so its spans are nested in this one
+                futures = [executor.submit(copy_context().run, self._submit_job, job) for job in jobs]
+            submissions: List[tuple[tuple[int, bool] | None, Exception | None]] = []
+            for future in futures:
+                error = future.exception()
+                if error is None:
+                    submissions.append((future.result(), None))
+                elif isinstance(error, Exception):
+                    submissions.append((None, error))
+                else:
+                    # KeyboardInterrupt and alike are not submission errors
+                    raise error
+            return submissions
+        submissions = []
+        for job in jobs:
+            try:
+                submissions.append((self._submit_job(job), None))
+            except Exception as error:  # noqa: BLE001
+                submissions.append((None, error))
+        return submissions
+
+    @staticmethod
+    def _split_shots_among_devices(nshots: int, devices: List[Device], shot_weights: List[float] | None) -> List[int]:
+        """Splits the shots of a job among the devices it is executed on.
+
+        Args:
+            nshots (int): total number of shots
+            devices (List[Device]): devices the job is executed on
+            shot_weights (List[float] | None): weight of each device. If not provided, each device is weighted by the
+                inverse of the length of its queue.
+
+        Returns:
+            List[int]: number of shots to execute on each device
+        """
+        if shot_weights is None:
+            shot_weights = [1 / (1 + (device.number_pending_jobs or 0)) for device in devices]
+        if len(shot_weights) != len(devices):
+            raise ValueError("Shot weights should be provided for each selected device.")
+        return split_shots(nshots=nshots, weights=shot_weights)
+
+    def _submit_job(self, job: Job) -> tuple[int, bool]:
+        """Posts a job to be queued for execution, or reuses an identical job submitted recently when deduplication
+        is enabled. Sets the id of the job if it gets submitted.
+
+        Args:
+            job (Job): job to submit
+
+        Raises:
+            RemoteExecutionException: the job could not be queued.
+
+        Returns:
+            tuple[int, bool]: id of the queued job, and whether it was submitted or an existing one was reused.
+        """
+        job_request = job.job_request
+        submission_key = None
+        if self._submission_index is not None:
+            submission_key = job_request_hash(job_request, escaped_description=job.escaped_description)
+            existing_job_id = self._submission_index.get(submission_key)
+            if existing_job_id is not None:
+                logger.info("An identical job was recently submitted. Reusing job %i.", existing_job_id)
+                return existing_job_id, False
+
+        with span("qiboconnection.submit", device_id=job.device_id, nshots=job.nshots) as submit_span:
+            body = job.request_body
+            submit_span.set_attribute("bytes", len(body))
+            response, status_code = self._connection.send_post_bytes_auth_remote_api_call(
+                path=self._CIRCUITS_CALL_PATH,
+                body=body,
+                headers={self._IDEMPOTENCY_KEY_HEADER: submission_key} if submission_key is not None else None,
+            )
+        if status_code != codes.created:
+            raise RemoteExecutionException(
+                message=f"Circuit {job.job_id} could not be executed.", status_code=status_code
+            )
+        logger.debug("Job circuit queued successfully.")
+        job.id = response[API_CONSTANTS.JOB_ID]
+        job.job_status = JobStatus.PENDING
+        if submission_key is not None and self._submission_index is not None:
+            self._submission_index.add(key=submission_key, job_id=job.id)
+        return job.id, True
+
+    def _get_job(self, job_id: int, timeout: Timeout | None = None) -> JobResponse:
         """Calls the API to get a job from a remote execution.
 
         Args:
             job_id (int): Job identifier.
+            timeout (Timeout, optional): timeouts of the call. Defaults to the polling ones.
 
         Raises:
             RemoteExecutionException: Job could not be retrieved.
@@ -404,14 +766,20 @@ class API(ABC):
         Returns:
             JobResponse: type-casted backend response with the job info.
         """
-        response, status_code = self._connection.send_get_auth_remote_api_call(path=f"{self._JOBS_CALL_PATH}/{job_id}")
-        if status_code != codes.ok:
-            raise RemoteExecutionException(message="Job could not be retrieved.", status_code=status_code)
+        with span("qiboconnection.get_job", job_id=job_id):
+            response, status_code = self._connection.send_get_auth_remote_api_call(
+                path=f"{self._JOBS_CALL_PATH}/{job_id}", timeout=timeout
+            )
+            if status_code != codes.ok:
+                raise RemoteExecutionException(message="Job could not be retrieved.", status_code=status_code)
 
-        return JobResponse.from_kwargs(**cast(dict, response))
+            job_response = JobResponse.from_kwargs(**cast(dict, response))
+        if job_id in self._jobs:
+            self._jobs.update_status(job_id=job_id, status=job_response.status)
+        return job_response
 
     @typechecked
-    def get_result(self, job_id: int) -> CircuitResult | npt.NDArray | dict | None:
+    def get_result(self, job_id: int) -> "CircuitResult | npt.NDArray | dict | None":
         """Get a Job result from a remote execution
 
         Args:
@@ -430,16 +798,20 @@ class API(ABC):
             "This method is deprecated and will be removed in a future qiboconnection version. Use get_job(job_id).result to retrieve your results instead."
         )
 
-        job_response = self._get_job(job_id=job_id)
+        job_response = self._get_job(job_id=job_id, timeout=self._connection.timeouts.download)
         log_job_status_info(job_response=job_response)
         return parse_job_responses_to_results(job_responses=[job_response])[0]
 
     @typechecked
-    def get_results(self, job_ids: List[int]) -> List[CircuitResult | npt.NDArray | dict | None]:
+    def get_results(
+        self, job_ids: List[int], decoding_workers: int | None = None
+    ) -> "List[CircuitResult | npt.NDArray | dict | None]":
         """Get a Job result from a remote execution
 
         Args:
             job_ids (List[int]): List of Job identifiers
+            decoding_workers (int, optional): number of processes used to decode the results. Worth setting when
+                retrieving many big results. If not provided, results are decoded serially.
 
         Raises:
             RemoteExecutionException: Job could not be retrieved.
@@ -452,13 +824,14 @@ class API(ABC):
             "This method is deprecated and will be removed in a future qiboconnection version. Use get_job(job_id).result to retrieve your results instead."
         )
 
-        job_responses = [self._get_job(job_id) for job_id in job_ids]
+        job_responses = [self._get_job(job_id, timeout=self._connection.timeouts.download) for job_id in job_ids]
         for job_response in job_responses:
             log_job_status_info(job_response=job_response)
-        return parse_job_responses_to_results(job_responses=job_responses)
+        return parse_job_responses_to_results(job_responses=job_responses, max_workers=decoding_workers)
 
+    @traced("qiboconnection.wait_for_results")
     def _wait_and_return_results(
-        self, deadline: datetime, interval: int, job_ids: List[int]
+        self, deadline: datetime, interval: int, job_ids: List[int], decoding_workers: int | None = None
     ) -> List[dict | Any | None]:
         """Try and recover results from the backend until all of them are finished (this is, with status being either
         ERROR or COMPLETED).
@@ -467,6 +840,7 @@ class API(ABC):
             deadline (datetime): date at which this process should be interrupted
             interval (int): seconds to sleep between trials
             job_ids (List[int]): List of jobs to get the status of.
+            decoding_workers (int, optional): number of processes used to decode the results.
 
         Raises:
             TimeoutError: timeout seconds reached
@@ -474,23 +848,36 @@ class API(ABC):
         Returns:
             List[dict | None]: list of the results for each of the
         """
+        iteration = 0
         while datetime.now(timezone.utc) < deadline:
-            job_responses = [self._get_job(job_id) for job_id in job_ids]
+            try:
+                with span("qiboconnection.poll", iteration=iteration, jobs=len(job_ids)):
+                    job_responses = [self._get_job(job_id) for job_id in job_ids]
+            except (TimeoutError, RequestsTimeout) as ex:
+                if datetime.now(timezone.utc) < deadline:
+                    raise
+                raise TimeoutError("Server did not execute the jobs in time.") from ex
             job_responses_status = [job_response.status for job_response in job_responses]
             if set(job_responses_status).issubset({JobStatus.COMPLETED, JobStatus.ERROR}):
-                return parse_job_responses_to_results(job_responses=job_responses)
-            sleep(interval)
+                return parse_job_responses_to_results(job_responses=job_responses, max_workers=decoding_workers)
+            wait = min(interval, max(0.0, (deadline - datetime.now(timezone.utc)).total_seconds()))
+            with span("qiboconnection.wait", seconds=wait):
+                sleep(wait)
+            iteration += 1
         raise TimeoutError("Server did not execute the jobs in time.")
 
     def execute_and_return_results(
         self,
-        circuit: list[Circuit] | None = None,
+        circuit: "list[Circuit] | None" = None,
         qprogram: str | None = None,
         nshots: int = 10,
         device_ids: List[int] | None = None,
         device_id: int | None = None,
-        timeout: int = 3600,
+        timeout: float = 3600,
         interval: int = 60,
+        decoding_workers: int | None = None,
+        split_shots: bool = False,
+        shot_weights: List[float] | None = None,
     ) -> List[dict | Any | None]:
         """Executes a `circuit` or `experiment` the same way as :func:`qiboconnection.API.execute`.
 
@@ -500,9 +887,15 @@ class API(ABC):
             nshots (int): number of times the execution is to be done.
             device_ids (List[int]): list of devices where the execution should be performed. If set, any device set
              using API.select_device_id() will not be used. This will not update the selected
-            timeout (int): seconds passed which the function should be interrupted with an error.
+            timeout (float): seconds passed which the function should be interrupted with an error. Every call made
+              meanwhile, including the submission, is bounded by this deadline too.
             interval (int): seconds to wait between checking with the backend if the results are ready. If the task is
               expected to last for tens of minutes, this should be set to, at least, 60 seconds.
+            decoding_workers (int, optional): number of processes used to decode the results. If not provided, results
+              are decoded serially.
+            split_shots (bool): if True, `nshots` are split among the devices and the partial results are merged back
+              into a single result, with the counts of all the shots.
+            shot_weights (List[float]): weight of each device when splitting the shots.
 
         Raises:
             RemoteExecutionException: Job could not be retrieved.
@@ -510,26 +903,39 @@ class API(ABC):
             TimeoutError: timeout seconds reached
 
         Returns:
-            Union[CircuitResult, None]: The Job result as an Abstract State or None when it is not executed yet.
+            Union[CircuitResult, None]: The Job result as an Abstract State or None when it is not executed yet. When
+            splitting the shots, a single merged result.
 
         """
 
-        deadline = datetime.now(timezone.utc) + timedelta(seconds=timeout)
-        job_ids = self.execute(
-            circuit=circuit,
-            qprogram=qprogram,
-            nshots=nshots,
-            device_id=device_id,
-            device_ids=device_ids,
-        )
-        if isinstance(job_ids, int):
-            job_ids = [job_ids]
-        return self._wait_and_return_results(deadline=deadline, interval=interval, job_ids=job_ids)
-
-    def _get_list_jobs_response(self, favourites: bool = False) -> List[JobListingItemResponse]:
+        ends_at = datetime.now(timezone.utc) + timedelta(seconds=timeout)
+        with deadline(timeout):
+            job_ids = self.execute(
+                circuit=circuit,
+                qprogram=qprogram,
+                nshots=nshots,
+                device_id=device_id,
+                device_ids=device_ids,
+                split_shots=split_shots,
+                shot_weights=shot_weights,
+            )
+            if isinstance(job_ids, int):
+                job_ids = [job_ids]
+            results = self._wait_and_return_results(
+                deadline=ends_at, interval=interval, job_ids=job_ids, decoding_workers=decoding_workers
+            )
+        if split_shots:
+            # Shots are only split for circuits, whose results hold one dict per circuit
+            return [merge_circuit_results(results=cast(List[List[dict] | None], results))]
+        return results
+
+    def _get_list_jobs_response(
+        self, favourites: bool = False, compact: bool = False
+    ) -> List[JobListingItemResponse] | List[CompactModel]:
         """Performs the actual jobs listing request
         Returns
-            List[JobListingItemResponse]: list of objects encoding the expected response structure"""
+            List[JobListingItemResponse]: list of objects encoding the expected response structure. Slotted variants of
+            them if `compact` is True."""
         responses, status_codes = unzip(
             self._connection.send_get_auth_remote_api_call_all_pages(
                 path=self._JOBS_CALL_PATH, params={API_CONSTANTS.FAVOURITES: favourites}
@@ -540,19 +946,27 @@ class API(ABC):
                 raise RemoteExecutionException(message="Job could not be listed.", status_code=status_code)
 
         items = [item for response in responses for item in response[REST.ITEMS]]
+        if compact:
+            compact_response = compact_model(JobListingItemResponse)
+            return [compact_response.from_kwargs(**item) for item in items]
         return [JobListingItemResponse.from_kwargs(**item) for item in items]
 
     @typechecked
-    def list_jobs(self, favourites: bool = False) -> JobListing:
+    def list_jobs(self, favourites: bool = False, compact: bool = False) -> JobListing:
         """List all jobs metadata
 
+        Args:
+            favourites (bool): whether to list only the favourite jobs
+            compact (bool): whether to build the listing items as slotted objects, which are faster to build and take
+                less memory. Worth using for listings with many jobs. Unknown fields are kept in their `extra` dict.
+
         Raises:
             RemoteExecutionException: Devices could not be retrieved
 
         Returns:
             Devices: All Jobs
         """
-        jobs_list_response = self._get_list_jobs_response(favourites=favourites)
+        jobs_list_response = self._get_list_jobs_response(favourites=favourites, compact=compact)
         jobs_listing = JobListing.from_response(jobs_list_response)
         self._jobs_listing = jobs_listing
         return jobs_listing
@@ -573,7 +987,7 @@ class API(ABC):
             JobData
         """
 
-        job_response = self._get_job(job_id=job_id)
+        job_response = self._get_job(job_id=job_id, timeout=self._connection.timeouts.download)
         log_job_status_info(job_response=job_response)
         return JobData(**vars(job_response))
 
@@ -599,6 +1013,7 @@ class API(ABC):
         device_id: int,
         user_id: int,
         qililab_version: str,
+        compression: str | None = None,
     ):
         """Save a runcard into the database af our servers, for it to be easily recovered when needed.
 
@@ -613,6 +1028,8 @@ class API(ABC):
             device_id: Id of the device the experiment was executed in
             user_id: Id of the user that is executing the experiment
             qililab_version: version of qililab the experiment was executed with
+            compression: if provided, 'gzip' or 'zstd', the runcard is uploaded compressed. Worth using for big chips.
+                'zstd' requires the `zstandard` package before Python 3.14.
 
         Returns:
             new saved runcard
@@ -627,6 +1044,7 @@ class API(ABC):
             device_id=device_id,
             user_id=user_id,
             qililab_version=qililab_version,
+            compression=compression,
         )
 
         runcard_response = self._create_runcard_response(runcard=runcard)
@@ -690,9 +1108,11 @@ class API(ABC):
         if runcard_id is not None and runcard_name is not None:
             raise ValueError("Both of of id and name cannot be simultaneously provided")
         if runcard_id is not None:
-            return Runcard.from_response(self._get_runcard_response(runcard_id=runcard_id))
+            return Runcard.from_response(self._get_runcard_response(runcard_id=runcard_id), track_changes=True)
         if runcard_name is not None:
-            return Runcard.from_response(self._get_runcard_by_name_response(runcard_name=runcard_name))
+            return Runcard.from_response(
+                self._get_runcard_by_name_response(runcard_name=runcard_name), track_changes=True
+            )
         raise ValueError("At least one of id and name must be provided")
 
     def _get_list_runcard_response(
@@ -732,8 +1152,17 @@ class API(ABC):
 
             This method is only available for Qilimanjaro members.
 
+        The runcard is uploaded with its `compression`, which runcards retrieved from the server keep, if any. Set it to
+        'gzip' or 'zstd' to upload it compressed.
+
+        Runcards retrieved with `get_runcard`, or already updated, only send the changes made since then as a JSON patch,
+        with an operation for each value changed in the runcard under `/runcard/...`, as long as it was not modified in the
+        server meanwhile. The whole runcard is sent otherwise, when the patch would not be smaller, or if the server does
+        not support partial updates or does not accept the paths of the changes.
+
         Raises:
             RemoteExecutionException: Runcard could not be retrieved
+            UpdateConflictException: Runcard was modified in the server since it was retrieved
 
         Returns:
             Runcard: serialized runcard dictionary
@@ -741,12 +1170,59 @@ class API(ABC):
         if runcard.id is None:  # type: ignore[attr-defined]
             raise ValueError("Runcard id must be defined for updating its info in the database.")
 
-        runcard_response = self._update_runcard_response(runcard=runcard)
-        updated_runcard = Runcard.from_response(response=runcard_response)
+        response = self._patch_response(
+            path=f"{self._RUNCARDS_CALL_PATH}/{runcard.id}",  # type: ignore[attr-defined]
+            patch=runcard.changes_patch(),
+            version=runcard.server_version,
+            kind="runcard",
+        )
+        runcard_response = (
+            RuncardResponse.from_kwargs(**response)
+            if response is not None
+            else self._update_runcard_response(runcard=runcard)
+        )
+        updated_runcard = Runcard.from_response(response=runcard_response, track_changes=True)
+        runcard.track_changes(runcard_response)
 
         self._runcard = updated_runcard
         return updated_runcard
 
+    def _patch_response(self, path: str, patch: List[dict] | None, version: str | None, kind: str) -> dict | None:
+        """Sends the changes made to a runcard or calibration as a JSON patch, which the server only applies if the
+        resource is still at `version`
+
+        Returns:
+            dict | None: response of the server, or None if the whole resource has to be sent instead, because its
+            version in the server is not known, the server does not support partial updates or it does not accept the
+            paths of the changes
+        """
+        if patch is None or not self._partial_updates:
+            return None
+        try:
+            response, status_code = self._connection.send_patch_auth_remote_api_call(
+                path=path, data=patch, version=version
+            )
+        except HTTPError as ex:
+            status_code = getattr(ex.response, "status_code", None)
+            if status_code in {codes.conflict, codes.precondition_failed}:
+                raise UpdateConflictException(
+                    message=f"The {kind} was modified in the server since it was retrieved. Retrieve it again and "
+                    + "reapply the changes.",
+                    status_code=status_code,
+                ) from ex
+            if status_code in {codes.method_not_allowed, codes.unsupported_media_type, codes.not_implemented}:
+                logger.info("The server does not support partial updates. Sending whole %ss instead.", kind)
+                self._partial_updates = False
+                return None
+            if status_code in {codes.bad_request, codes.unprocessable_entity}:
+                logger.info("The server did not accept the paths of the changes. Sending the whole %s instead.", kind)
+                return None
+            raise
+        if status_code not in {codes.ok, codes.created}:
+            raise RemoteExecutionException(message=f"The {kind} could not be saved.", status_code=status_code)
+        logger.debug("The %s was patched with %i operations.", kind, len(patch))
+        return cast(dict, response)
+
     def _update_runcard_response(self, runcard: Runcard):
         """Make the runcard update request and parse the response"""
         response, status_code = self._connection.send_put_auth_remote_api_call(
@@ -798,6 +1274,7 @@ class API(ABC):
         device_id: int,
         user_id: int,
         qililab_version: str,
+        compression: str | None = None,
     ):
         """Save a calibration into the database af our servers, for it to be easily recovered when needed.
 
@@ -812,6 +1289,8 @@ class API(ABC):
             device_id: Id of the device the experiment was executed in
             user_id: Id of the user that is executing the experiment
             qililab_version: version of qililab the experiment was executed with
+            compression: if provided, 'gzip' or 'zstd', the calibration is uploaded compressed. 'zstd' requires the
+                `zstandard` package before Python 3.14.
 
         Returns:
             new saved calibration
@@ -826,6 +1305,7 @@ class API(ABC):
             device_id=device_id,
             user_id=user_id,
             qililab_version=qililab_version,
+            compression=compression,
         )
 
         calibration_response = self._create_calibration_response(calibration=calibration)
@@ -888,9 +1368,13 @@ class API(ABC):
         if calibration_id is not None and calibration_name is not None:
             raise ValueError("Both of of id and name cannot be simultaneously provided")
         if calibration_id is not None:
-            return Calibration.from_response(self._get_calibration_response(calibration_id=calibration_id))
+            return Calibration.from_response(
+                self._get_calibration_response(calibration_id=calibration_id), track_changes=True
+            )
         if calibration_name is not None:
-            return Calibration.from_response(self._get_calibration_by_name_response(calibration_name=calibration_name))
+            return Calibration.from_response(
+                self._get_calibration_by_name_response(calibration_name=calibration_name), track_changes=True
+            )
         raise ValueError("At least one of id and name must be provided")
 
     def _get_list_calibration_response(
@@ -930,8 +1414,17 @@ class API(ABC):
 
             This method is only available for Qilimanjaro members.
 
+        The calibration is uploaded with its `compression`, which calibrations retrieved from the server keep, if any. Set it to
+        'gzip' or 'zstd' to upload it compressed.
+
+        Calibrations retrieved with `get_calibration`, or already updated, only send the changes made since then as a JSON patch,
+        with an operation for each value changed in the calibration under `/calibration/...`, as long as it was not modified in the
+        server meanwhile. The whole calibration is sent otherwise, when the patch would not be smaller, or if the server does
+        not support partial updates or does not accept the paths of the changes.
+
         Raises:
             RemoteExecutionException: Calibration could not be retrieved
+            UpdateConflictException: Calibration was modified in the server since it was retrieved
 
         Returns:
             Calibration: serialized calibration dictionary
@@ -939,8 +1432,19 @@ class API(ABC):
         if calibration.id is None:  # type: ignore[attr-defined]
             raise ValueError("Calibration id must be defined for updating its info in the database.")
 
-        calibration_response = self._update_calibration_response(calibration=calibration)
-        updated_calibration = Calibration.from_response(response=calibration_response)
+        response = self._patch_response(
+            path=f"{self._CALIBRATIONS_CALL_PATH}/{calibration.id}",  # type: ignore[attr-defined]
+            patch=calibration.changes_patch(),
+            version=calibration.server_version,
+            kind="calibration",
+        )
+        calibration_response = (
+            CalibrationResponse.from_kwargs(**response)
+            if response is not None
+            else self._update_calibration_response(calibration=calibration)
+        )
+        updated_calibration = Calibration.from_response(response=calibration_response, track_changes=True)
+        calibration.track_changes(calibration_response)
 
         self._calibration = updated_calibration
         return updated_calibration
@@ -988,6 +1492,8 @@ class API(ABC):
         _, status_code = self._connection.send_delete_auth_remote_api_call(path=f"{self._JOBS_CALL_PATH}/{job_id}")
         if status_code != codes.no_content:
             raise RemoteExecutionException(message="Job could not be removed.", status_code=status_code)
+        if self._submission_index is not None:
+            self._submission_index.discard_job(job_id=job_id)
         logger.info(f"Job {job_id} deleted successfully")
 
     @typechecked
@@ -998,4 +1504,154 @@ class API(ABC):
         )
         if status_code != codes.no_content:
             raise RemoteExecutionException(message=f"Job {job_id} could not be cancelled.", status_code=status_code)
+        if self._submission_index is not None:
+            self._submission_index.discard_job(job_id=job_id)
         logger.info(f"Job {job_id} cancelled successfully")
+
+    @staticmethod
+    def _run_for_each_job(
+        operation: Callable[[int], None], job_ids: List[int], max_workers: int
+    ) -> Dict[int, Exception | None]:
+        """Runs an operation on many jobs in a pool of threads, collecting the error of each of them instead of
+        stopping at the first one"""
+        if max_workers < 1:
+            raise ValueError("Max workers should be at least 1.")
+
+        def run(job_id: int) -> Exception | None:
+            try:
+                operation(job_id)
+            except Exception as ex:  # noqa: BLE001 # the error is returned as the outcome of the job
+                return ex
+            return None
+
+        job_ids = list(dict.fromkeys(job_ids))
+        if not job_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(job_ids))) as executor:
+            # Each call runs in a copy of the current context, so it keeps the spans and deadline of this one
+            futures = [executor.submit(copy_context().run, run, job_id) for job_id in job_ids]
+            outcomes = {job_id: future.result() for job_id, future in zip(job_ids, futures)}
+        failed = sum(outcome is not None for outcome in outcomes.values())
+        if failed:
+            logger.warning("%i of %i jobs failed. Check their outcomes for the errors.", failed, len(outcomes))
+        return outcomes
+
+    def _run_in_bulk(
+        self, send: Callable[..., tuple[Any, int]], path: str, job_ids: List[int], action: str
+    ) -> Dict[int, Exception | None] | None:
+        """Runs an operation on many jobs with a single call to a bulk endpoint, which answers with the errors of the
+        jobs it could not handle, if any
+
+        Returns:
+            Dict[int, Exception | None] | None: outcome of every job, or None if the jobs have to be handled one by one
+            instead, because the server does not support bulk calls
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        if not job_ids or not self._bulk_job_calls:
+            return None
+        try:
+            response, status_code = send(path=path, data={"job_ids": job_ids})
+        except HTTPError as ex:
+            status_code = getattr(ex.response, "status_code", None)
+            if status_code in {codes.not_found, codes.method_not_allowed, codes.not_implemented}:
+                logger.info("The server does not support bulk job calls. Making one call per job instead.")
+                self._bulk_job_calls = False
+                return None
+            return dict.fromkeys(job_ids, ex)
+        if status_code not in {codes.ok, codes.no_content}:
+            error = RemoteExecutionException(message=f"Jobs could not be {action}.", status_code=status_code)
+            return dict.fromkeys(job_ids, error)
+        errors = (response.get("errors") or {}) if isinstance(response, dict) else {}
+        outcomes: Dict[int, Exception | None] = {
+            job_id: (
+                RemoteExecutionException(
+                    message=f"Job {job_id} could not be {action}: {errors[str(job_id)]}", status_code=status_code
+                )
+                if str(job_id) in errors
+                else None
+            )
+            for job_id in job_ids
+        }
+        if self._submission_index is not None:
+            for job_id, outcome in outcomes.items():
+                if outcome is None:
+                    self._submission_index.discard_job(job_id=job_id)
+        if errors:
+            logger.warning("%i of %i jobs failed. Check their outcomes for the errors.", len(errors), len(outcomes))
+        return outcomes
+
+    @typechecked
+    def cancel_jobs(self, job_ids: List[int], max_workers: int = _BULK_WORKERS) -> Dict[int, Exception | None]:
+        """Cancels many jobs. They are cancelled with a single call if the server supports it, or making up to
+        `max_workers` calls at the same time otherwise.
+
+        Args:
+            job_ids (List[int]): Job identifiers. Repeated ones are cancelled once.
+            max_workers (int): maximum number of calls in flight
+
+        Returns:
+            Dict[int, Exception | None]: outcome of every job: None if it was cancelled, or the error raised otherwise
+        """
+        if max_workers < 1:
+            raise ValueError("Max workers should be at least 1.")
+        outcomes = self._run_in_bulk(
+            send=self._connection.send_put_auth_remote_api_call,
+            path=f"{self._JOBS_CALL_PATH}/cancel",
+            job_ids=job_ids,
+            action="cancelled",
+        )
+        if outcomes is not None:
+            return outcomes
+        return self._run_for_each_job(operation=self.cancel_job, job_ids=job_ids, max_workers=max_workers)
+
+    @typechecked
+    def delete_jobs(self, job_ids: List[int], max_workers: int = _BULK_WORKERS) -> Dict[int, Exception | None]:
+        """Deletes many jobs from the database. They are deleted with a single call if the server supports it, or making
+        up to `max_workers` calls at the same time otherwise.
+
+        .. warning::
+
+            This method is only available for admin members.
+
+        Args:
+            job_ids (List[int]): Job identifiers. Repeated ones are deleted once.
+            max_workers (int): maximum number of calls in flight
+
+        Returns:
+            Dict[int, Exception | None]: outcome of every job: None if it was deleted, or the error raised otherwise
+        """
+        if max_workers < 1:
+            raise ValueError("Max workers should be at least 1.")
+        outcomes = self._run_in_bulk(
+            send=self._connection.send_post_auth_remote_api_call,
+            path=f"{self._JOBS_CALL_PATH}/delete",
+            job_ids=job_ids,
+            action="deleted",
+        )
+        if outcomes is not None:
+            return outcomes
+        return self._run_for_each_job(operation=self.delete_job, job_ids=job_ids, max_workers=max_workers)
+
+    @typechecked
+    def cancel_all(
+        self, job_filter: Callable[[JobListingItem], bool] | None = None, max_workers: int = _BULK_WORKERS
+    ) -> Dict[int, Exception | None]:
+        """Cancels the jobs of the user still waiting to be executed, i.e. pending or queued.
+
+        Args:
+            job_filter (Callable[[JobListingItem], bool], optional): if provided, only the waiting jobs for which it
+                returns True are cancelled, e.g. `lambda job: job.device_id == 9`.
+            max_workers (int): maximum number of calls in flight
+
+        Returns:
+            Dict[int, Exception | None]: outcome of every job: None if it was cancelled, or the error raised otherwise
+        """
+        job_ids = [
+            cast(int, job.id)
+            for job in self.list_jobs(compact=True).items
+            if job.user_id == self.user_id
+            and job.status in {JobStatus.PENDING, JobStatus.QUEUED}
+            and (job_filter is None or job_filter(job))
+        ]
+        logger.info("Cancelling %i waiting jobs.", len(job_ids))
+        return self.cancel_jobs(job_ids=job_ids, max_workers=max_workers)
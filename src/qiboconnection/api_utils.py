@@ -15,36 +15,55 @@
 """Util Functions used by the API module"""
 
 import json
-from typing import Any, List
-
-from qibo.models.circuit import Circuit  # type: ignore[import-untyped]
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, cast
 
 from qiboconnection.config import logger
 from qiboconnection.models import JobResult
+from qiboconnection.serialization import bind_circuit_template, decompress_array
+from qiboconnection.tracing import traced
 from qiboconnection.typings.enums import JobStatus, JobType
 from qiboconnection.typings.responses.job_response import JobResponse
 from qiboconnection.util import decompress_any
 
 
-def parse_job_responses_to_results(job_responses: List[JobResponse]) -> List[dict | Any | None]:
+@traced("qiboconnection.decode_results")
+def parse_job_responses_to_results(
+    job_responses: List[JobResponse], max_workers: int | None = None
+) -> List[dict | Any | None]:
     """Parse a list of job_responses to a list of dict with the content of each job. If the job is not COMPLETED,
     put a None in its place. For this, we build a JobResult instance for each COMPLETED job, and then we keep its
     `.data`.
 
+    Decompressing and deserializing results is CPU-bound, so when many big results are fetched at once they can be
+    decoded in a pool of processes by providing `max_workers`.
+
     Args:
         job_responses: list of JobResponse instances from which we'll
+        max_workers: number of processes used to decode the results. If None or lower than 2, results are decoded
+            serially in the current process.
 
     Returns:
 
     """
-    raw_results = [parse_job_response_to_result(job_response=job_response) for job_response in job_responses]
-    return list(raw_results)
+    completed_responses = [job_response for job_response in job_responses if job_response.status == JobStatus.COMPLETED]
+    if max_workers is None or max_workers < 2 or len(completed_responses) < 2:  # noqa: PLR2004
+        return [parse_job_response_to_result(job_response=job_response) for job_response in job_responses]
+
+    chunksize = max(1, len(completed_responses) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(completed_responses))) as executor:
+        decoded_results = iter(
+            list(executor.map(parse_job_response_to_result, completed_responses, chunksize=chunksize))
+        )
+    return [
+        next(decoded_results) if job_response.status == JobStatus.COMPLETED else None for job_response in job_responses
+    ]
 
 
 def parse_job_response_to_result(job_response: JobResponse):
     """Parse a single job_response to a single dict with the content of a job. If the job is not COMPLETED,
     put a None in its place. For this, we build a JobResult instance for each COMPLETED job, and then we keep its
-    `.data`.
+    `.data`. Defined at module level so it can be sent to the workers of a process pool.
 
     Args:
         job_response: JobResponse instance from which we'll get the results
@@ -59,6 +78,75 @@ def parse_job_response_to_result(job_response: JobResponse):
     )
 
 
+def split_shots(nshots: int, weights: List[float]) -> List[int]:
+    """Splits `nshots` into one share per weight, proportionally to the weights. Shares are integers that add up to
+    `nshots`: the shots left after rounding down go to the shares with the largest remainders.
+
+    Args:
+        nshots (int): number of shots to split
+        weights (List[float]): non-negative weight of each share
+
+    Raises:
+        ValueError: Weights should be non-negative and not all zero.
+
+    Returns:
+        List[int]: number of shots of each share
+    """
+    import numpy as np  # noqa: PLC0415
+
+    weights_array = np.asarray(weights, dtype=np.float64)
+    if weights_array.size == 0 or np.any(weights_array < 0) or not np.any(weights_array > 0):
+        raise ValueError("Weights should be non-negative and not all zero.")
+    exact_shares = nshots * weights_array / weights_array.sum()
+    shares = np.floor(exact_shares).astype(int)
+    remaining_shots = nshots - int(shares.sum())
+    shares[np.argsort(shares - exact_shares, kind="stable")[:remaining_shots]] += 1
+    return shares.tolist()
+
+
+def merge_circuit_results(results: List[List[dict] | None]) -> List[dict]:
+    """Merges the results of several executions of the same circuits, each with part of the shots, into the result
+    of a single execution with all of them. Counts are added up, samples concatenated and probabilities recomputed
+    from the merged counts. Final states only exist for simulations, so they are taken from the first result.
+
+    Args:
+        results (List[List[dict] | None]): result of each execution, with one dict per circuit
+
+    Raises:
+        ValueError: Results could not be merged because some job did not complete.
+        ValueError: Results could not be merged because they hold a different number of circuits.
+
+    Returns:
+        List[dict]: merged result, with one dict per circuit
+    """
+    if any(result is None for result in results):
+        raise ValueError("Results could not be merged because some job did not complete.")
+    import numpy as np  # noqa: PLC0415
+
+    completed_results = cast(List[List[dict]], results)
+    if len({len(result) for result in completed_results}) > 1:
+        raise ValueError("Results could not be merged because they hold a different number of circuits.")
+
+    merged_results = []
+    for circuit_results in zip(*completed_results):
+        states = sorted({state for circuit_result in circuit_results for state in circuit_result["counts"]})
+        counts = np.array(
+            [[circuit_result["counts"].get(state, 0) for state in states] for circuit_result in circuit_results]
+        ).sum(axis=0)
+        probabilities = counts / counts.sum() if counts.sum() else counts.astype(np.float64)
+        merged_result = {
+            **circuit_results[0],
+            "probabilities": dict(zip(states, probabilities.tolist())),
+            "counts": dict(zip(states, counts.tolist())),
+        }
+        if all("samples" in circuit_result for circuit_result in circuit_results):
+            merged_result["samples"] = [
+                sample for circuit_result in circuit_results for sample in circuit_result["samples"]
+            ]
+        merged_results.append(merged_result)
+    return merged_results
+
+
 def deserialize_job_description(raw_description: str, job_type: str) -> dict:
     """Convert base64 job description to its corresponding Qibo Circuit or Qililab experiment
 
@@ -76,7 +164,16 @@ def deserialize_job_description(raw_description: str, job_type: str) -> dict:
     description_dict = json.loads(raw_description)
     decompressed_data = decompress_any(**description_dict)
     compressed_data = description_dict.pop("data")
+    if job_type == JobType.CIRCUIT and "parameters" in description_dict:
+        parameters = decompress_array(**description_dict["parameters"])
+        return {
+            **description_dict,
+            "parameters": parameters,
+            "data": bind_circuit_template(skeleton=decompressed_data[0], parameters=parameters),
+        }
     if job_type == JobType.CIRCUIT:
+        from qibo.models.circuit import Circuit  # type: ignore[import-untyped]  # noqa: PLC0415
+
         return {
             **description_dict,
             "data": [Circuit.from_qasm(decom_data) for decom_data in decompressed_data],
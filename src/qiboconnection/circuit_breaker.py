@@ -0,0 +1,195 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Circuit breaker failing fast the calls to the remote server while it is down"""
+
+import threading
+from time import monotonic, sleep
+from typing import Callable, Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests import codes
+
+from qiboconnection.config import logger
+from qiboconnection.errors import CircuitOpenException
+from qiboconnection.throttling import endpoint_class
+from qiboconnection.typings.enums import CircuitState
+
+
+def circuit_name(method: str, url: str) -> str:
+    """Name of the circuit a call belongs to: its host and endpoint class, e.g. `qaas.com:8080 polling`
+
+    Args:
+        method (str): HTTP method
+        url (str): called url
+
+    Returns:
+        str: circuit name
+    """
+    return f"{urlsplit(url).netloc} {endpoint_class(method=method, url=url).value}"
+
+
+class _Circuit:
+    """State of the calls to a host and endpoint class"""
+
+    __slots__ = ("failures", "opened_at", "state", "trial")
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial = False
+
+
+class CircuitBreaker:
+    """Circuit breaker of the calls of a `Connection`, with a circuit per host and endpoint class.
+
+    Circuits start closed, letting calls through. After `failure_threshold` consecutive failures, i.e. connection errors,
+    timeouts or 5xx responses, a circuit opens, and its calls raise `CircuitOpenException` right away instead of waiting
+    for the server. While any circuit is open, `probe` is called every `probe_interval` seconds from a background
+    thread, and once it succeeds the open circuits become half-open: a single trial call is let through, closing the
+    circuit if it succeeds or opening it again otherwise. Circuits also become half-open `recovery_timeout` seconds
+    after opening, whether they were probed or not.
+
+    Args:
+        failure_threshold (int): consecutive failures opening a circuit
+        recovery_timeout (float): seconds after which an open circuit becomes half-open
+        probe_interval (float): seconds between probes while a circuit is open
+        probe (Callable[[], bool], optional): returns whether the server is back. `API` sets it to `API.ping` if not
+            provided.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        probe_interval: float = 2.0,
+        probe: Callable[[], bool] | None = None,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("Failure threshold should be at least 1.")
+        if recovery_timeout <= 0 or probe_interval <= 0:
+            raise ValueError("Recovery timeout and probe interval should be positive.")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.probe_interval = probe_interval
+        self.probe = probe
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+        self._prober: threading.Thread | None = None
+        self._local = threading.local()
+
+    @property
+    def circuits(self) -> Dict[str, CircuitState]:
+        """State of every circuit called so far
+
+        Returns:
+            Dict[str, CircuitState]: states by circuit name
+        """
+        with self._lock:
+            return {name: circuit.state for name, circuit in self._circuits.items()}
+
+    def call(self, circuit: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """Makes a call unless its circuit is open, keeping track of its outcome
+
+        Args:
+            circuit (str): name of the circuit, as returned by `circuit_name`
+            send (Callable[[], requests.Response]): function making the call
+
+        Raises:
+            CircuitOpenException: The circuit is open, so the call was not made.
+
+        Returns:
+            requests.Response: response of the call
+        """
+        if getattr(self._local, "probing", False):
+            return send()
+        self._before_call(circuit)
+        outcome = None
+        try:
+            response = send()
+            outcome = response.status_code < codes.internal_server_error
+            return response
+        except requests.RequestException:
+            outcome = False
+            raise
+        finally:
+            self._after_call(name=circuit, success=outcome)
+
+    def _before_call(self, name: str) -> None:
+        """Lets a call through if its circuit is closed, or as the trial call of a half-open one"""
+        with self._lock:
+            circuit = self._circuits.get(name)
+            if circuit is None:
+                circuit = self._circuits[name] = _Circuit()
+            if circuit.state == CircuitState.CLOSED:
+                return
+            now = monotonic()
+            if circuit.state == CircuitState.OPEN and now - circuit.opened_at >= self.recovery_timeout:
+                circuit.state = CircuitState.HALF_OPEN
+            if circuit.state == CircuitState.HALF_OPEN and not circuit.trial:
+                circuit.trial = True
+                return
+            retry_in = max(0.0, circuit.opened_at + self.recovery_timeout - now)
+        raise CircuitOpenException(
+            f"Calls to {name} are failing, so they are not made for now. Retrying in {retry_in:.1f}s at most.",
+            circuit=name,
+            retry_in=retry_in,
+        )
+
+    def _after_call(self, name: str, success: bool | None) -> None:
+        """Updates the state of a circuit with the outcome of a call. None means the call did not reach the server"""
+        with self._lock:
+            circuit = self._circuits[name]
+            circuit.trial = False
+            if success is None:
+                return
+            if success:
+                if circuit.state != CircuitState.CLOSED:
+                    logger.warning("Calls to %s are succeeding again.", name)
+                circuit.state, circuit.failures = CircuitState.CLOSED, 0
+                return
+            circuit.failures += 1
+            if circuit.state == CircuitState.HALF_OPEN or circuit.failures >= self.failure_threshold:
+                if circuit.state == CircuitState.CLOSED:
+                    logger.error("Calls to %s failed %i times in a row. Failing fast.", name, circuit.failures)
+                circuit.state, circuit.opened_at = CircuitState.OPEN, monotonic()
+                self._start_prober()
+
+    def _start_prober(self) -> None:
+        """Starts probing the server in the background, if it is not being probed already. Called with the lock held"""
+        if self.probe is None or self._prober is not None:
+            return
+        self._prober = threading.Thread(target=self._probe_while_open, name="qiboconnection-prober", daemon=True)
+        self._prober.start()
+
+    def _probe_while_open(self) -> None:
+        """Probes the server until no circuit is open, letting trial calls through once it answers"""
+        self._local.probing = True
+        while True:
+            sleep(self.probe_interval)
+            with self._lock:
+                if all(circuit.state != CircuitState.OPEN for circuit in self._circuits.values()):
+                    self._prober = None
+                    return
+            try:
+                healthy = self.probe() if self.probe is not None else False
+            except Exception:  # noqa: BLE001 # a failing probe means the server is still down
+                healthy = False
+            if healthy:
+                with self._lock:
+                    for circuit in self._circuits.values():
+                        if circuit.state == CircuitState.OPEN:
+                            circuit.state = CircuitState.HALF_OPEN
@@ -15,31 +15,53 @@
 """Remote Connection"""
 
 import json
-import os
+import threading
+import warnings
 from abc import ABC
 from dataclasses import asdict, dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from io import TextIOWrapper
+from time import perf_counter
 from typing import Any, List, Optional, TextIO, Tuple, Union
 
-import jwt
 import requests
 from requests import codes
-from typeguard import typechecked
 
 from qiboconnection import __version__ as VERSION
+from qiboconnection.circuit_breaker import CircuitBreaker, circuit_name
 from qiboconnection.config import get_environment, logger
 from qiboconnection.errors import ConnectionException, HTTPError, RemoteExecutionException
+from qiboconnection.instrumentation import RequestEvent, RequestHook, endpoint_template
 from qiboconnection.models.user import User
+from qiboconnection.throttling import Throttle, endpoint_class
+from qiboconnection.timeouts import Timeout, TimeoutPolicy, deadline
+from qiboconnection.transport import RequestsTransport, Transport
+from qiboconnection.typechecking import typechecked
 from qiboconnection.typings.connection import ConnectionConfiguration, ConnectionEstablished
 from qiboconnection.typings.requests import AssertionPayload
 from qiboconnection.typings.responses import AccessTokenResponse
 from qiboconnection.util import base64url_encode, process_response
 
+_retries = threading.local()
 
-def TIMEOUT():
-    """Returns always the last TIMEOUT env var that the user might have set."""
-    return int(os.getenv("QIBOCONNECTION_TIMEOUT", "10"))
+
+def _default_timeout() -> float | None:
+    """Default timeout of the calls, as set through the `QIBOCONNECTION_TIMEOUT` environment variable"""
+    return TimeoutPolicy().default.read
+
+
+def __getattr__(name: str) -> Any:
+    """Deprecated attributes of the module"""
+    if name == "TIMEOUT":
+        warnings.warn(
+            "connection.TIMEOUT is deprecated and will be removed in a future release. Use Connection.timeouts, or "
+            + "API(timeouts=TimeoutPolicy(...)) to set them.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return _default_timeout
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def refresh_token_if_unauthorised(func):
@@ -58,11 +80,29 @@ def refresh_token_if_unauthorised(func):
             if ex.response.status_code not in {codes.bad_request, codes.unauthorized}:
                 raise ex
             self.update_authorisation_using_refresh_token()
-            return func(self, *args, **kwargs)
+            _retries.count = getattr(_retries, "count", 0) + 1
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                _retries.count -= 1
 
     return decorated
 
 
+def _body_size(body: Any) -> int:
+    """Size in bytes of a request or response body, or 0 when it is not known"""
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    return 0
+
+
+def _seconds(elapsed: Any) -> float | None:
+    """Converts the elapsed time of a response into seconds"""
+    return elapsed.total_seconds() if isinstance(elapsed, timedelta) else None
+
+
 @dataclass
 class Connection(ABC):
     """Class to create a remote connection to a Qibo server"""
@@ -72,8 +112,16 @@ class Connection(ABC):
         self,
         configuration: ConnectionConfiguration,
         api_path: Optional[str] = None,
+        transport: Transport | None = None,
+        throttle: Throttle | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        timeouts: TimeoutPolicy | None = None,
     ):
         self._environment = get_environment()
+        self._timeouts = timeouts or TimeoutPolicy()
+        self._transport = transport or RequestsTransport()
+        self._throttle = throttle
+        self._circuit_breaker = circuit_breaker
         self._api_path = api_path
         self._remote_server_api_url: str | None = None
         self._remote_server_base_url: str | None = None
@@ -84,8 +132,18 @@ class Connection(ABC):
         self._user: User | None = None
         self._authorisation_access_token: str | None = None
         self._authorisation_refresh_token: str | None = None
+        self._request_hooks: List[RequestHook] = []
         self._load_configuration(configuration, api_path)
 
+    @property
+    def timeouts(self) -> TimeoutPolicy:
+        """Gets the timeout policy
+
+        Returns:
+            TimeoutPolicy: timeouts of the calls by endpoint class
+        """
+        return self._timeouts
+
     @property
     def user(self) -> User:
         """Gets User
@@ -131,6 +189,8 @@ class Connection(ABC):
         self._user.user_id = new_id
 
     def _load_user_id_from_token(self, access_token):
+        import jwt  # noqa: PLC0415
+
         self._user_id = jwt.decode(access_token, options={"verify_signature": False})["user_id"]
 
     @property
@@ -158,6 +218,104 @@ class Connection(ABC):
             return ""
         return user_response["slack_id"]
 
+    def add_request_hook(self, hook: RequestHook) -> None:
+        """Registers a function to call after every HTTP call made to the remote server. It receives a `RequestEvent`
+        with the method, endpoint, status, sizes and timings of the call. Hooks run in the thread that made the call,
+        so they should be quick.
+
+        Args:
+            hook (RequestHook): function to call, e.g. a `LatencyAggregator`
+        """
+        self._request_hooks.append(hook)
+
+    def remove_request_hook(self, hook: RequestHook) -> None:
+        """Unregisters a function added with `add_request_hook`
+
+        Args:
+            hook (RequestHook): function to remove
+        """
+        self._request_hooks.remove(hook)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Makes an HTTP call through the transport, within the limits of the throttle and the circuit breaker if any,
+        notifying the request hooks once it finishes.
+
+        Args:
+            method (str): lowercase HTTP method, e.g. `get`
+            url (str): url to call
+
+        Returns:
+            requests.Response: response
+        """
+        if not self._request_hooks:
+            return self._send(method, url, **kwargs)
+        start = perf_counter()
+        response, error = None, None
+        attempts: List[int] = []
+        try:
+            response = self._send(method, url, attempts=attempts, **kwargs)
+            return response
+        except Exception as ex:
+            error = ex
+            raise
+        finally:
+            self._notify_request_hooks(
+                RequestEvent(
+                    method=method.upper(),
+                    url=url,
+                    endpoint=endpoint_template(url),
+                    status_code=getattr(response, "status_code", None),
+                    bytes_sent=_body_size(getattr(getattr(response, "request", None), "body", None)),
+                    bytes_received=_body_size(getattr(response, "content", None)),
+                    elapsed=perf_counter() - start,
+                    time_to_first_byte=_seconds(getattr(response, "elapsed", None)),
+                    # retries after refreshing the access token, plus the ones made while throttled
+                    retries=getattr(_retries, "count", 0) + max(len(attempts) - 1, 0),
+                    error=error,
+                )
+            )
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        timeout: float | Timeout | None = None,
+        attempts: List[int] | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Makes an HTTP call through the transport, throttling it and failing fast while its circuit is open. Every
+        attempt gets what is left of the total timeout of the call, and is appended to `attempts` if provided"""
+        timeout = self._call_timeout(method=method, url=url, timeout=timeout)
+
+        def attempt() -> requests.Response:
+            if attempts is not None:
+                attempts.append(1)
+            return self._transport.request(method, url, timeout=timeout.for_requests(), **kwargs)
+
+        send = attempt
+        if self._throttle is not None:
+            send = partial(self._throttle.call, method=method, url=url, send=send)
+        with deadline(timeout.total):
+            if self._circuit_breaker is not None:
+                return self._circuit_breaker.call(circuit=circuit_name(method=method, url=url), send=send)
+            return send()
+
+    def _call_timeout(self, method: str, url: str, timeout: float | Timeout | None) -> Timeout:
+        """Timeouts of a call: the ones given, the same seconds to connect and read, or the ones of its endpoint class"""
+        if isinstance(timeout, Timeout):
+            return timeout
+        if timeout is not None:
+            return Timeout(connect=timeout, read=timeout)
+        return self._timeouts.get(endpoint_class(method=method, url=url))
+
+    def _notify_request_hooks(self, event: RequestEvent) -> None:
+        """Calls every request hook with the event of a finished call"""
+        for hook in list(self._request_hooks):
+            try:
+                hook(event)
+            except Exception as ex:  # noqa: BLE001 # a faulty hook must not break the calls
+                logger.error("Request hook %s failed: %s", hook, ex)
+
     def _set_api_calls(self, api_path: str):
         """
         Builds api path, remote server urls and auth server url from env info and api_path kwarg.
@@ -252,27 +410,67 @@ class Connection(ABC):
 
     @refresh_token_if_unauthorised
     @typechecked
-    def send_post_auth_remote_api_call(self, path: str, data: Any, timeout: int | None = None) -> Tuple[Any, int]:
+    def send_post_auth_remote_api_call(
+        self, path: str, data: Any, timeout: float | Timeout | None = None, headers: dict | None = None
+    ) -> Tuple[Any, int]:
         """HTTP POST REST API authenticated call to remote server
 
         Args:
             path (str): path to add to the remote server api url
             data (Any): data to send
-            timeout (int): time to wait. If not provided, a default will be used.
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
+            headers (dict): extra headers to send along with the request.
 
         Returns:
             Tuple[Any, int]: Http response
         """
-        timeout = timeout or TIMEOUT()
         logger.debug("Calling: %s%s", self._remote_server_api_url, path)
-        header = self._add_version_header({"Authorization": f"Bearer {self._authorisation_access_token}"})
-        response = requests.post(
-            f"{self._remote_server_api_url}{path}", json=data.copy(), headers=header, timeout=timeout
+        header = self._add_version_header(
+            {**(headers or {}), "Authorization": f"Bearer {self._authorisation_access_token}"}
+        )
+        response = self._request(
+            "post", f"{self._remote_server_api_url}{path}", json=data.copy(), headers=header, timeout=timeout
+        )
+        return process_response(response)
+
+    @refresh_token_if_unauthorised
+    @typechecked
+    def send_post_bytes_auth_remote_api_call(
+        self,
+        path: str,
+        body: bytes,
+        timeout: float | Timeout | None = None,
+        headers: dict | None = None,
+        content_type: str = "application/json",
+    ) -> Tuple[Any, int]:
+        """HTTP POST REST API authenticated call to remote server, sending an already encoded body as is. Unlike
+        `send_post_auth_remote_api_call`, the body is neither copied nor serialized again.
+
+        Args:
+            path (str): path to add to the remote server api url
+            body (bytes): encoded body to send
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
+            headers (dict): extra headers to send along with the request.
+            content_type (str): media type of the body
+
+        Returns:
+            Tuple[Any, int]: Http response
+        """
+        logger.debug("Calling: %s%s", self._remote_server_api_url, path)
+        header = self._add_version_header(
+            {
+                **(headers or {}),
+                "Authorization": f"Bearer {self._authorisation_access_token}",
+                "Content-Type": content_type,
+            }
+        )
+        response = self._request(
+            "post", f"{self._remote_server_api_url}{path}", data=body, headers=header, timeout=timeout
         )
         return process_response(response)
 
     def send_file(
-        self, channel_id: int, file: TextIOWrapper, filename: str, timeout: int | None = None
+        self, channel_id: int, file: TextIOWrapper, filename: str, timeout: float | Timeout | None = None
     ) -> Tuple[Any, int]:
         """Sends a file to a channel registered in the system
 
@@ -280,7 +478,7 @@ class Connection(ABC):
             channel_id (int): channel identifier
             file (TextIOWrapper): file to send
             filename (str): file name
-            timeout (int): time to wait. If not provided, a default will be used.
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
 
         Returns:
             Tuple[Any, int]: Http response
@@ -291,29 +489,61 @@ class Connection(ABC):
 
     @refresh_token_if_unauthorised
     @typechecked
-    def send_put_auth_remote_api_call(self, path: str, data: Any, timeout: int | None = None) -> Tuple[Any, int]:
+    def send_put_auth_remote_api_call(
+        self, path: str, data: Any, timeout: float | Timeout | None = None
+    ) -> Tuple[Any, int]:
         """HTTP PUT REST API authenticated call to remote server
 
         Args:
             path (str): path to add to the remote server api url
             data (Any): data to send
-            timeout (int): time to wait. If not provided, a default will be used.
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
 
         Returns:
             Tuple[Any, int]: Http response
         """
-        timeout = timeout or TIMEOUT()
         logger.debug("Calling: %s%s", self._remote_server_api_url, path)
         header = self._add_version_header({"Authorization": f"Bearer {self._authorisation_access_token}"})
-        response = requests.put(
-            f"{self._remote_server_api_url}{path}", json=data.copy(), headers=header, timeout=timeout
+        response = self._request(
+            "put", f"{self._remote_server_api_url}{path}", json=data.copy(), headers=header, timeout=timeout
+        )
+        return process_response(response)
+
+    @refresh_token_if_unauthorised
+    @typechecked
+    def send_patch_auth_remote_api_call(
+        self, path: str, data: List[dict], version: str | None = None, timeout: float | Timeout | None = None
+    ) -> Tuple[Any, int]:
+        """HTTP PATCH REST API authenticated call to remote server, sending a JSON patch
+
+        Args:
+            path (str): path to add to the remote server api url
+            data (List[dict]): JSON patch operations
+            version (str, optional): if provided, the resource is only patched if it is still at this version in the
+                server, which otherwise answers with 412 Precondition Failed
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
+
+        Returns:
+            Tuple[Any, int]: Http response
+        """
+        logger.debug("Calling: %s%s", self._remote_server_api_url, path)
+        header = self._add_version_header(
+            {
+                "Authorization": f"Bearer {self._authorisation_access_token}",
+                "Content-Type": "application/json-patch+json",
+            }
+        )
+        if version is not None:
+            header["If-Match"] = f'"{version}"'
+        response = self._request(
+            "patch", f"{self._remote_server_api_url}{path}", json=data, headers=header, timeout=timeout
         )
         return process_response(response)
 
     @refresh_token_if_unauthorised
     @typechecked
     def send_post_file_auth_remote_api_call(
-        self, path: str, file: Union[TextIOWrapper, TextIO], filename: str, timeout: int | None = None
+        self, path: str, file: Union[TextIOWrapper, TextIO], filename: str, timeout: float | Timeout | None = None
     ) -> Tuple[Any, int]:
         """HTTP POST REST API authenticated call to send a file to remote server
 
@@ -321,39 +551,39 @@ class Connection(ABC):
             path (str): path to add to the remote server api url
             file (Union[TextIOWrapper, TextIO]): file to send
             filename (str): file to send
-            timeout (int): time to wait. If not provided, a default will be used.
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
 
         Returns:
             Tuple[Any, int]: Http response
         """
-        timeout = timeout or TIMEOUT()
         logger.debug("Calling: %s%s", self._remote_server_api_url, path)
         header = self._add_version_header({"Authorization": f"Bearer {self._authorisation_access_token}"})
         packed_file = {"file": (filename, file)}
-        response = requests.post(
-            f"{self._remote_server_api_url}{path}", files=packed_file, headers=header, timeout=timeout
+        response = self._request(
+            "post", f"{self._remote_server_api_url}{path}", files=packed_file, headers=header, timeout=timeout
         )
         return process_response(response)
 
     @refresh_token_if_unauthorised
     @typechecked
     def send_get_auth_remote_api_call(
-        self, path: str, params: dict | None = None, timeout: int | None = None
+        self, path: str, params: dict | None = None, timeout: float | Timeout | None = None
     ) -> Tuple[Any, int]:
         """HTTP GET REST API authenticated call to remote server
 
         Args:
             path (str): path to add to the remote server api url
             params (str): dict of parameters to be encoded as url query params
-            timeout (int): time to wait. If not provided, a default will be used.
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
 
         Returns:
             Tuple[Any, int]: Http response
         """
-        timeout = timeout or TIMEOUT()
         logger.debug("Calling: %s%s", self._remote_server_api_url, path)
         header = self._add_version_header({"Authorization": f"Bearer {self._authorisation_access_token}"})
-        response = requests.get(f"{self._remote_server_api_url}{path}", headers=header, params=params, timeout=timeout)
+        response = self._request(
+            "get", f"{self._remote_server_api_url}{path}", headers=header, params=params, timeout=timeout
+        )
 
         if response.status_code != codes.ok:
             error_details = response.json()
@@ -365,25 +595,24 @@ class Connection(ABC):
     @refresh_token_if_unauthorised
     @typechecked
     def send_get_auth_remote_api_call_all_pages(
-        self, path: str, params: dict | None = None, timeout: int | None = None
+        self, path: str, params: dict | None = None, timeout: float | Timeout | None = None
     ) -> List[Tuple[Any, int]]:
         """HTTP GET REST API authenticated call to remote server
 
         Args:
             path (str): path to add to the remote server api url
             params (str): dict of parameters to be encoded as url query params
-            timeout (int): time to wait. If not provided, a default will be used.
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
 
         Returns:
             Tuple[Any, int]: Http response
         """
-        timeout = timeout or TIMEOUT()
         logger.debug("Calling: %s%s", self._remote_server_api_url, path)
         header = self._add_version_header({"Authorization": f"Bearer {self._authorisation_access_token}"})
         next_url = f"{self._remote_server_api_url}{path}"
         responses = []
         while "None" not in next_url:
-            response = requests.get(next_url, headers=header, params=params, timeout=timeout)
+            response = self._request("get", next_url, headers=header, params=params, timeout=timeout)
             json_content, status_code = process_response(response)
             next_url = json_content["links"]["next"]
             responses.append((json_content, status_code))
@@ -391,20 +620,19 @@ class Connection(ABC):
 
     @refresh_token_if_unauthorised
     @typechecked
-    def send_delete_auth_remote_api_call(self, path: str, timeout: int | None = None) -> Tuple[Any, int]:
+    def send_delete_auth_remote_api_call(self, path: str, timeout: float | Timeout | None = None) -> Tuple[Any, int]:
         """HTTP DELETE REST API authenticated call to remote server
 
         Args:
             path (str): path to add to the remote server api url
-            timeout (int): time to wait. If not provided, a default will be used.
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
 
         Returns:
             Tuple[Any, int]: Http response
         """
-        timeout = timeout or TIMEOUT()
         logger.debug("Calling: %s%s", self._remote_server_api_url, path)
         header = self._add_version_header({"Authorization": f"Bearer {self._authorisation_access_token}"})
-        response = requests.delete(f"{self._remote_server_api_url}{path}", headers=header, timeout=timeout)
+        response = self._request("delete", f"{self._remote_server_api_url}{path}", headers=header, timeout=timeout)
 
         if response.status_code != codes.no_content:
             error_details = response.json()
@@ -416,31 +644,29 @@ class Connection(ABC):
 
     @refresh_token_if_unauthorised
     @typechecked
-    def send_get_remote_call(self, path: str, timeout: int | None = None) -> Tuple[Any, int]:
+    def send_get_remote_call(self, path: str, timeout: float | Timeout | None = None) -> Tuple[Any, int]:
         """HTTP GET REST API call to remote server (without authentication)
 
         Args:
             path (str): path to add to the remote server api url
-            timeout (int): time to wait. If not provided, a default will be used.
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
 
         Returns:
             Tuple[Any, int]: Http response
         """
-        timeout = timeout or TIMEOUT()
         logger.debug("Calling: %s%s", self._remote_server_api_url, path)
-        response = requests.get(
-            f"{self._remote_server_base_url}{path}", timeout=timeout, headers=self._add_version_header({})
+        response = self._request(
+            "get", f"{self._remote_server_base_url}{path}", timeout=timeout, headers=self._add_version_header({})
         )
         return process_response(response)
 
-    def _request_authorisation_token(self, timeout: int | None = None):
+    def _request_authorisation_token(self, timeout: float | Timeout | None = None):
         """
         Builds assertion payload with user info, encodes it and uses it to POST the server for a new Access Token.
         Args:
-            timeout (int): time to wait. If not provided, a default will be used.
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
         Returns: str tuple with new Access  and Refresh Tokens.
         """
-        timeout = timeout or TIMEOUT()
         assertion_payload = AssertionPayload(
             **self._user.__dict__,  # type: ignore
             audience=self._audience_url,
@@ -458,7 +684,8 @@ class Connection(ABC):
         if self._authorisation_server_api_call is None:
             raise ValueError("Authorisation server api call is required")
         logger.debug("Calling: %s", self._authorisation_server_api_call)
-        response: requests.Response = requests.post(
+        response: requests.Response = self._request(
+            "post",
             self._authorisation_server_api_call,
             json=authorisation_request_payload,
             timeout=timeout,
@@ -479,20 +706,20 @@ class Connection(ABC):
 
         return access_token_response.accessToken, access_token_response.refreshToken
 
-    def update_authorisation_using_refresh_token(self, timeout: int | None = None):
+    def update_authorisation_using_refresh_token(self, timeout: float | Timeout | None = None):
         """Updates the saved access token sending the request token. For this, it
         builds assertion payload with user info, encodes it and uses it to POST the server for a new Access Token.
         Args:
-            timeout (int): time to wait. If not provided, a default will be used.
+            timeout (float | Timeout): seconds to wait, or timeouts of the call. Defaults to the timeout policy.
         Returns:
             str with a new Access Token
         """
-        timeout = timeout or TIMEOUT()
 
         if self._authorisation_server_refresh_api_call is None:
             raise ValueError("Authorisation server api call is required")
         logger.debug("Calling: %s", self._authorisation_server_refresh_api_call)
-        response: requests.Response = requests.post(
+        response: requests.Response = self._request(
+            "post",
             self._authorisation_server_refresh_api_call,
             json={},
             headers=self._add_version_header({"Authorization": f"Bearer {self._authorisation_refresh_token}"}),
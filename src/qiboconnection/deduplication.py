@@ -0,0 +1,113 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side deduplication of identical job submissions"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from time import monotonic
+
+from qiboconnection.serialization import escape_json_string
+from qiboconnection.typings.requests import JobRequest
+
+
+def job_request_hash(job_request: JobRequest, escaped_description: bytes | None = None) -> str:
+    """Computes a content hash of a job request. Requests with the same user, device, number of shots, type, name,
+    summary and description share the same hash.
+
+    The description, which holds the whole payload of the job, is hashed as the escaped bytes embedded in the body of
+    the submission, so it is not serialized again.
+
+    Args:
+        job_request (JobRequest): request to hash
+        escaped_description (bytes, optional): description already escaped with `escape_json_string`, e.g. the one of
+            the job being submitted. Escaped from the request if not provided.
+
+    Returns:
+        str: hex digest identifying the request
+    """
+    fields = asdict(job_request)
+    description = fields.pop("description")
+    if escaped_description is None:
+        escaped_description = escape_json_string(description)
+    request_hash = hashlib.sha256(json.dumps(fields, sort_keys=True).encode("utf-8"))
+    request_hash.update(escaped_description)
+    return request_hash.hexdigest()
+
+
+class SubmissionIndex:
+    """Thread-safe index of the job ids of recent submissions, by the hash of their job request. Entries expire once
+    they are older than the time-to-live.
+
+    Args:
+        ttl (float): seconds during which a submission is remembered
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> int | None:
+        """Returns the id of the job submitted with the given hash, if it was submitted less than `ttl` seconds ago.
+
+        Args:
+            key (str): hash of the job request
+
+        Returns:
+            int | None: id of the job, or None if there is no recent submission with that hash
+        """
+        with self._lock:
+            self._purge_expired()
+            entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def add(self, key: str, job_id: int) -> None:
+        """Remembers that a job request with the given hash was submitted as `job_id`.
+
+        Args:
+            key (str): hash of the job request
+            job_id (int): id of the submitted job
+        """
+        with self._lock:
+            self._entries[key] = (job_id, monotonic())
+            self._entries.move_to_end(key)
+
+    def discard_job(self, job_id: int) -> None:
+        """Forgets the submission of the given job, so that an identical request is submitted again.
+
+        Args:
+            job_id (int): id of the job to forget
+        """
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[0] == job_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Forgets all the submissions"""
+        with self._lock:
+            self._entries.clear()
+
+    def _purge_expired(self) -> None:
+        """Drops the entries older than `ttl` seconds. Entries are kept in submission order, so only the oldest ones
+        need to be checked."""
+        oldest_valid = monotonic() - self.ttl
+        while self._entries and next(iter(self._entries.values()))[1] < oldest_valid:
+            self._entries.popitem(last=False)
@@ -0,0 +1,200 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Background watch of the status of the devices"""
+
+import threading
+from time import monotonic
+from typing import Any, Callable, Dict, List, Tuple
+
+from qiboconnection.config import logger
+from qiboconnection.models.devices import Device, Devices
+from qiboconnection.typings.enums import DeviceStatus
+
+DeviceChanges = Dict[str, Tuple[Any, Any]]
+DeviceChangeCallback = Callable[[int, DeviceChanges], None]
+
+_IGNORED_FIELDS = {"str"}
+
+
+def _device_fields(device: Device) -> Dict[str, Any]:
+    """Returns the json-serializable fields of a device that are worth comparing"""
+    return {key: value for key, value in device.to_dict(expand=True).items() if key not in _IGNORED_FIELDS}
+
+
+def diff_devices(previous: Devices, current: Devices) -> Dict[int, DeviceChanges]:
+    """Compares two snapshots of the devices.
+
+    Args:
+        previous (Devices): older snapshot
+        current (Devices): newer snapshot
+
+    Returns:
+        Dict[int, DeviceChanges]: for each device that changed, the fields that changed with their old and new values.
+        Fields of devices that appear or disappear are reported as changing from or to None.
+    """
+    previous_fields = {device.id: _device_fields(device) for device in previous}
+    current_fields = {device.id: _device_fields(device) for device in current}
+    changes = {}
+    for device_id in previous_fields.keys() | current_fields.keys():
+        old_fields, new_fields = previous_fields.get(device_id, {}), current_fields.get(device_id, {})
+        device_changes = {
+            key: (old_fields.get(key), new_fields.get(key))
+            for key in old_fields.keys() | new_fields.keys()
+            if old_fields.get(key) != new_fields.get(key)
+        }
+        if device_changes:
+            changes[device_id] = device_changes
+    return changes
+
+
+class DeviceWatcher:
+    """Keeps a snapshot of the devices up to date in a background thread and notifies the changes.
+
+    The devices are polled every `interval` seconds. When polling fails, the wait before the next poll is doubled, up to
+    `max_interval` seconds, and it goes back to `interval` after the next successful poll.
+
+    Args:
+        fetch_devices (Callable[[], Devices]): function that retrieves all the devices, usually `API.list_devices`
+        interval (float): seconds between polls
+        max_interval (float): longest wait between polls when backing off after errors
+    """
+
+    def __init__(self, fetch_devices: Callable[[], Devices], interval: float = 10.0, max_interval: float = 300.0):
+        self.interval = interval
+        self.max_interval = max_interval
+        self._fetch_devices = fetch_devices
+        self._devices = Devices()
+        self._callbacks: List[DeviceChangeCallback] = []
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "DeviceWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    @property
+    def devices(self) -> Devices:
+        """Latest snapshot of the devices
+
+        Returns:
+            Devices: devices
+        """
+        with self._condition:
+            return self._devices
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is polling the devices
+
+        Returns:
+            bool: True if the watcher is running
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_callback(self, callback: DeviceChangeCallback) -> None:
+        """Registers a function to call whenever a device changes. It receives the id of the device and the changed
+        fields, mapped to their old and new values, e.g. `{"status": ("maintenance", "online")}`.
+
+        Args:
+            callback (DeviceChangeCallback): function to call
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: DeviceChangeCallback) -> None:
+        """Unregisters a function added with `add_callback`
+
+        Args:
+            callback (DeviceChangeCallback): function to remove
+        """
+        self._callbacks.remove(callback)
+
+    def poll(self) -> Dict[int, DeviceChanges]:
+        """Fetches the devices once, updates the snapshot and notifies the changes to the callbacks.
+
+        Returns:
+            Dict[int, DeviceChanges]: changed fields of each device that changed
+        """
+        devices = self._fetch_devices()
+        with self._condition:
+            changes = diff_devices(previous=self._devices, current=devices)
+            self._devices = devices
+            self._condition.notify_all()
+        for device_id, device_changes in changes.items():
+            for callback in list(self._callbacks):
+                try:
+                    callback(device_id, device_changes)
+                except Exception as ex:  # noqa: BLE001 # a faulty callback must not stop the watcher
+                    logger.error("Device change callback %s failed: %s", callback, ex)
+        return changes
+
+    def start(self) -> None:
+        """Starts polling the devices in a background thread"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="qiboconnection-device-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops polling the devices
+
+        Args:
+            timeout (float, optional): seconds to wait for the background thread to finish
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def wait_until_online(self, device_id: int, timeout: float | None = None) -> bool:
+        """Blocks until the device is online in the snapshot. It wakes up on each poll instead of fetching the device.
+
+        Args:
+            device_id (int): device identifier
+            timeout (float, optional): maximum seconds to wait. Waits forever if not provided.
+
+        Returns:
+            bool: True if the device is online, False if the timeout expired before
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._condition:
+            while not self._is_online(device_id=device_id):
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(timeout=remaining)
+            return True
+
+    def _is_online(self, device_id: int) -> bool:
+        """Whether the device is online in the current snapshot"""
+        if device_id not in self._devices:
+            return False
+        return self._devices.select_device(device_id=device_id).status == DeviceStatus.ONLINE
+
+    def _run(self) -> None:
+        """Polls the devices until stopped, backing off after errors"""
+        wait = self.interval
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+                wait = self.interval
+            except Exception as ex:  # noqa: BLE001 # keep watching after transient errors
+                wait = min(wait * 2, self.max_interval)
+                logger.warning("Devices could not be polled (%s). Retrying in %s seconds.", ex, wait)
+            self._stop_event.wait(wait)
@@ -15,7 +15,7 @@
 """Handling Error Utility Functions"""
 
 import json
-from typing import Union
+from typing import List, Union
 
 from requests import codes
 from requests.models import HTTPError, Response
@@ -36,6 +36,27 @@ class RemoteExecutionException(Exception):
         logger.error("RemoteExecutionException: %s, %i", message, status_code)
 
 
+class UpdateConflictException(RemoteExecutionException):
+    """Exception raised when updating a resource that was modified in the remote server since it was retrieved
+
+    Args:
+        RemoteExecutionException (RemoteExecutionException): Inherit from RemoteExecutionException
+    """
+
+
+class PartialSubmissionException(RemoteExecutionException):
+    """Exception raised when some of the jobs of an execution could not be submitted while others were
+
+    Args:
+        RemoteExecutionException (RemoteExecutionException): Inherit from RemoteExecutionException
+    """
+
+    def __init__(self, message: str, status_code: int, job_ids: List[int], errors: List[Exception]):
+        super().__init__(message=message, status_code=status_code)
+        self.job_ids = job_ids
+        self.errors = errors
+
+
 class ConnectionException(Exception):
     """Exception raised when establishing the connection to a remote server
 
@@ -44,6 +65,19 @@ class ConnectionException(Exception):
     """
 
 
+class CircuitOpenException(ConnectionException):
+    """Exception raised instead of calling the remote server while its circuit breaker is open, after repeated failures
+
+    Args:
+        ConnectionException (ConnectionException): Inherit from ConnectionException
+    """
+
+    def __init__(self, message: str, circuit: str, retry_in: float):
+        super().__init__(message)
+        self.circuit = circuit
+        self.retry_in = retry_in
+
+
 def custom_raise_for_status(response: Response):
     """Raises :class:`HTTPError`, if one occurred."""
 
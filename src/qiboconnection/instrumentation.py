@@ -0,0 +1,195 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Instrumentation of the HTTP calls made to the remote server"""
+
+import bisect
+import re
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from requests import codes
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_MAX_PERCENTILE = 100
+
+
+def endpoint_template(url: str) -> str:
+    """Returns the path of a url with its numeric identifiers replaced by `{id}`, so calls to the same endpoint are
+    grouped together, e.g. `https://host/api/v1/jobs/42?x=1` becomes `/api/v1/jobs/{id}`.
+
+    Args:
+        url (str): called url
+
+    Returns:
+        str: endpoint path template
+    """
+    return _ID_SEGMENT.sub("/{id}", urlsplit(url).path)
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """Description of an HTTP call made to the remote server, passed to the request hooks once it finishes.
+
+    `requests` does not expose the time spent resolving names, connecting and negotiating TLS, so the timings are the
+    total time of the call and the time until the response headers arrived.
+
+    Attributes:
+        method (str): HTTP method
+        url (str): called url
+        endpoint (str): path template of the url, as returned by `endpoint_template`
+        status_code (int | None): status of the response, None if no response was received
+        bytes_sent (int): size of the request body
+        bytes_received (int): size of the response body
+        elapsed (float): seconds since the call was made until the whole response was received
+        time_to_first_byte (float | None): seconds since the request was sent until the response headers were parsed
+        retries (int): number of times the call was retried, after refreshing the access token or when throttled
+        error (Exception | None): exception raised by the call, if any
+    """
+
+    method: str
+    url: str
+    endpoint: str
+    status_code: int | None
+    bytes_sent: int
+    bytes_received: int
+    elapsed: float
+    time_to_first_byte: float | None = None
+    retries: int = 0
+    error: Exception | None = None
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+def _histogram_bounds(lowest: float = 0.001, highest: float = 300.0, growth: float = 1.1) -> Tuple[float, ...]:
+    """Upper bounds of exponentially growing histogram buckets"""
+    bounds = [lowest]
+    while bounds[-1] < highest:
+        bounds.append(bounds[-1] * growth)
+    return tuple(bounds)
+
+
+class _EndpointLatencies:
+    """Latency histogram of a single endpoint"""
+
+    __slots__ = ("count", "counts", "errors", "max", "total")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * buckets
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class LatencyAggregator:
+    """Request hook that aggregates the latency of the calls by endpoint in histograms, from which percentiles are
+    estimated. Memory use does not grow with the number of calls, so it can be kept running in production:
+
+        metrics = LatencyAggregator()
+        api.add_request_hook(metrics)
+        ...
+        metrics.summary()  # {"GET /api/v1/jobs/{id}": {"count": 120, "p50": 0.081, "p95": 0.2, ...}, ...}
+
+    Latencies are sorted into exponentially growing buckets, 10% wider each, so estimated percentiles are at most 10%
+    above the actual ones.
+    """
+
+    def __init__(self):
+        self._bounds = _histogram_bounds()
+        self._endpoints: Dict[str, _EndpointLatencies] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        key = f"{event.method} {event.endpoint}"
+        bucket = min(bisect.bisect_left(self._bounds, event.elapsed), len(self._bounds) - 1)
+        with self._lock:
+            latencies = self._endpoints.get(key)
+            if latencies is None:
+                latencies = self._endpoints[key] = _EndpointLatencies(buckets=len(self._bounds))
+            latencies.counts[bucket] += 1
+            latencies.count += 1
+            latencies.total += event.elapsed
+            latencies.max = max(latencies.max, event.elapsed)
+            if event.error is not None or (event.status_code is not None and event.status_code >= codes.bad_request):
+                latencies.errors += 1
+
+    @property
+    def endpoints(self) -> List[str]:
+        """Endpoints called so far, as `<method> <path template>`
+
+        Returns:
+            List[str]: endpoints
+        """
+        with self._lock:
+            return list(self._endpoints)
+
+    def percentile(self, endpoint: str, percentile: float) -> float:
+        """Estimates a percentile of the latency of an endpoint.
+
+        Args:
+            endpoint (str): endpoint, as `<method> <path template>`, e.g. `GET /api/v1/jobs/{id}`
+            percentile (float): percentile to estimate, between 0 and 100
+
+        Raises:
+            ValueError: The percentile is out of range, or the endpoint was not called.
+
+        Returns:
+            float: estimated latency, in seconds
+        """
+        if not 0 <= percentile <= _MAX_PERCENTILE:
+            raise ValueError("Percentiles should be between 0 and 100.")
+        with self._lock:
+            latencies = self._endpoints.get(endpoint)
+            if latencies is None:
+                raise ValueError(f"Endpoint {endpoint} has not been called.")
+            return self._percentile(latencies=latencies, percentile=percentile)
+
+    def _percentile(self, latencies: _EndpointLatencies, percentile: float) -> float:
+        """Upper bound of the bucket holding the percentile, capped at the slowest call"""
+        rank = percentile / 100 * latencies.count
+        accumulated = 0
+        for bound, count in zip(self._bounds, latencies.counts):
+            accumulated += count
+            if count and accumulated >= rank:
+                return min(bound, latencies.max)
+        return latencies.max
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Returns the number of calls, errors and the mean, p50, p95, p99 and max latency of each endpoint
+
+        Returns:
+            Dict[str, Dict[str, float]]: statistics by endpoint, with latencies in seconds
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "count": latencies.count,
+                    "errors": latencies.errors,
+                    "mean": latencies.total / latencies.count,
+                    "p50": self._percentile(latencies=latencies, percentile=50),
+                    "p95": self._percentile(latencies=latencies, percentile=95),
+                    "p99": self._percentile(latencies=latencies, percentile=99),
+                    "max": latencies.max,
+                }
+                for endpoint, latencies in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        """Forgets every call aggregated so far"""
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,112 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""JSON patches (RFC 6902) describing the changes between two JSON documents, used to update them partially"""
+
+from copy import deepcopy
+from typing import Any, Dict, List
+
+
+def _escape(key: str) -> str:
+    """Escapes a key to be used as a JSON pointer segment"""
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(segment: str) -> str:
+    """Unescapes a JSON pointer segment back into its key"""
+    return segment.replace("~1", "/").replace("~0", "~")
+
+
+def diff(source: Any, target: Any, path: str = "") -> List[Dict[str, Any]]:
+    """JSON patch turning a document into another one. Objects are compared key by key and lists of the same length
+    item by item, so changing a value deep in a big document only produces an operation for that value.
+
+    Args:
+        source (Any): original document
+        target (Any): modified document
+        path (str): JSON pointer of the documents within the whole one
+
+    Returns:
+        List[Dict[str, Any]]: `add`, `remove` and `replace` operations, empty if the documents are equal
+    """
+    if isinstance(source, dict) and isinstance(target, dict):
+        operations: List[Dict[str, Any]] = []
+        for key, value in source.items():
+            if key not in target:
+                operations.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+            else:
+                operations.extend(diff(value, target[key], path=f"{path}/{_escape(key)}"))
+        operations.extend(
+            {"op": "add", "path": f"{path}/{_escape(key)}", "value": value}
+            for key, value in target.items()
+            if key not in source
+        )
+        return operations
+    if isinstance(source, list) and isinstance(target, list) and len(source) == len(target):
+        return [
+            operation
+            for index, (old, new) in enumerate(zip(source, target))
+            for operation in diff(old, new, path=f"{path}/{index}")
+        ]
+    # bool is a subclass of int, so 1 and True are told apart by their type
+    if type(source) is type(target) and source == target:
+        return []
+    return [{"op": "replace", "path": path, "value": target}]
+
+
+def apply_patch(document: Any, operations: List[Dict[str, Any]]) -> Any:
+    """Applies the `add`, `remove` and `replace` operations of a JSON patch to a copy of a document
+
+    Args:
+        document (Any): document to patch, which is not modified
+        operations (List[Dict[str, Any]]): JSON patch
+
+    Raises:
+        ValueError: An operation is not supported or its path does not exist.
+
+    Returns:
+        Any: patched document
+    """
+    document = deepcopy(document)
+    for operation in operations:
+        op, path = operation["op"], operation["path"]
+        if op not in {"add", "remove", "replace"}:
+            raise ValueError(f"Unsupported JSON patch operation {op}.")
+        if not path:
+            if op == "remove":
+                raise ValueError("The whole document cannot be removed.")
+            document = deepcopy(operation["value"])
+            continue
+        *parents, last = [_unescape(segment) for segment in path.split("/")[1:]]
+        try:
+            parent = document
+            for segment in parents:
+                parent = parent[int(segment)] if isinstance(parent, list) else parent[segment]
+            if isinstance(parent, list):
+                index = len(parent) if last == "-" else int(last)
+                if op == "add":
+                    parent.insert(index, deepcopy(operation["value"]))
+                elif op == "remove":
+                    del parent[index]
+                else:
+                    parent[index] = deepcopy(operation["value"])
+            elif op == "remove":
+                del parent[last]
+            elif op == "replace" and last not in parent:
+                raise KeyError(last)
+            else:
+                parent[last] = deepcopy(operation["value"])
+        except (KeyError, IndexError, TypeError, ValueError) as ex:
+            raise ValueError(f"Path {path} of the {op} operation does not exist.") from ex
+    return document
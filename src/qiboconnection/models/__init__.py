@@ -16,10 +16,21 @@
 
 from .calibration import Calibration
 from .job import Job
+from .job_history import JobHistory, JobRecord
 from .job_listing import JobListing
 from .job_listing_item import JobListingItem
 from .job_result import JobResult
 from .runcard import Runcard
 from .user import User
 
-__all__ = ["Calibration", "Job", "JobListing", "JobListingItem", "JobResult", "Runcard", "User"]
+__all__ = [
+    "Calibration",
+    "Job",
+    "JobHistory",
+    "JobListing",
+    "JobListingItem",
+    "JobRecord",
+    "JobResult",
+    "Runcard",
+    "User",
+]
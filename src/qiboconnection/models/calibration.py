@@ -14,20 +14,31 @@
 
 """Calibration class"""
 
+import json
 from dataclasses import field
 
+from qiboconnection.models.patchable import PatchableMixin
 from qiboconnection.typings.requests import CalibrationRequest
 from qiboconnection.typings.responses import CalibrationResponse
-from qiboconnection.util import base64_decode, base64url_encode
+from qiboconnection.util import (
+    base64_decode,
+    base64url_encode,
+    compress_any,
+    compressed_envelope,
+    decompress_any,
+)
 
 
-class Calibration:
-    """Calibration representation"""
+class Calibration(PatchableMixin):
+    """Calibration representation. Calibrations with a `compression`, 'gzip' or 'zstd', are uploaded compressed."""
 
     name: str
     description: str
     calibration: str = ""
     id: int | None = field(default=None)
+    compression: str | None = None
+    _request_class = CalibrationRequest
+    _content_field = "calibration"
 
     def __init__(self, **kwargs):
         for k, v in kwargs.items():
@@ -35,13 +46,26 @@ class Calibration:
 
     @property
     def _encoded_calibration(self):
-        """return base64-encoded stringified jsonified experiment"""
-        return base64url_encode(self.calibration) if self.calibration is not None else None
+        """return base64-encoded stringified jsonified experiment, or its compressed envelope if it has a compression"""
+        if self.calibration is None:
+            return None
+        if self.compression is not None:
+            return json.dumps(compress_any(self.calibration, compression=self.compression))
+        return base64url_encode(self.calibration)
 
     @classmethod
-    def from_response(cls, response: CalibrationResponse):
-        """Calibration constructor that takes in an instance from a CalibrationResponse"""
-        return cls(
+    def _decode_content(cls, encoded: str | None):
+        """Decodes the calibration as stored in the server, either compressed or base64 encoded"""
+        envelope = compressed_envelope(encoded)
+        return decompress_any(**envelope) if envelope else base64_decode(encoded)
+
+    @classmethod
+    def from_response(cls, response: CalibrationResponse, track_changes: bool = False):
+        """Calibration constructor that takes in an instance from a CalibrationResponse. Compressed calibrations are
+        detected and keep their compression. With `track_changes`, the calibration keeps track of its version in the server,
+        to only send its changes when updated."""
+        envelope = compressed_envelope(response.calibration)
+        calibration = cls(
             id=response.calibration_id,
             created_at=response.created_at,
             updated_at=response.updated_at,
@@ -49,9 +73,16 @@ class Calibration:
             description=response.description,
             user_id=response.user_id,
             device_id=response.device_id,
-            calibration=base64_decode(response.calibration),
+            calibration=cls._decode_content(response.calibration),
             qililab_version=response.qililab_version,
+            compression=envelope["compression"] if envelope else None,
         )
+        if track_changes:
+            calibration.track_changes(response)
+        return calibration
+
+    def _request(self) -> CalibrationRequest:
+        return self.calibration_request()
 
     def calibration_request(self):
         """Created a Request instance"""
@@ -16,9 +16,8 @@
 
 import json
 
-from typeguard import typechecked
-
 from qiboconnection.connection import Connection
+from qiboconnection.typechecking import typechecked
 from qiboconnection.typings.devices import DeviceInput
 from qiboconnection.typings.enums import DeviceStatus
 
@@ -16,18 +16,23 @@
 
 import json
 from abc import ABC
-from typing import List
-
-from typeguard import typechecked
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 
 from qiboconnection.config import logger
 from qiboconnection.connection import Connection
+from qiboconnection.typechecking import typechecked
+from qiboconnection.typings.enums import DeviceStatus
 
 from .device import Device
 
 
+def _index_key(value: str | None) -> str | None:
+    """Plain string used as index key, so that enum members and their values share the same key"""
+    return None if value is None else str(getattr(value, "value", value))
+
+
 class Devices(ABC):
-    """List of Quantum or Simulator devices"""
+    """Collection of Quantum or Simulator devices, indexed by id, status and type. Devices keep their insertion order."""
 
     @typechecked
     def __init__(
@@ -37,47 +42,62 @@ class Devices(ABC):
         only_one_device_not_null = device is not None and not isinstance(device, list)
         more_than_one_device_not_null = device is not None and isinstance(device, list)
 
-        self._devices: List[Device] = []
+        self._devices_by_id: Dict[int, Device] = {}
+        self._ids_by_status: Dict[str | None, Dict[int, None]] = {}
+        self._ids_by_type: Dict[str | None, Dict[int, None]] = {}
+        self._index_keys: Dict[int, Tuple[str | None, str | None]] = {}
+        self._positions: Dict[int, int] = {}
+        self._duplicated_ids: Set[int] = set()
         if only_one_device_not_null:
             self.add(device=device)  # type: ignore
         if more_than_one_device_not_null:
             self._create_list_of_devices(list_devices=device)  # type: ignore
 
+    @property
+    def _devices(self) -> List[Device]:
+        """Devices in insertion order
+
+        Returns:
+            List[Device]: devices
+        """
+        return list(self._devices_by_id.values())
+
     @typechecked
     def _create_list_of_devices(self, list_devices: List[Device]):
-        """Appends each of the devices to self._devices
+        """Adds each of the devices
 
         Args:
-            list_devices: devices to be appended
+            list_devices: devices to be added
         """
         for device in list_devices:
-            self._devices.append(device)
+            self.add(device=device)
 
     @typechecked
     def add(self, device: Device) -> None:
-        """Adds a new Device
+        """Adds a new Device. Adding a device with the id of an existing one marks that id as duplicated.
 
         Args:
             device (Device): any Device supported type
         """
-        self._devices.append(device)
+        if device.id in self._devices_by_id:
+            self._duplicated_ids.add(device.id)
+        self._store(device=device)
 
     @typechecked
     def _update(self, device: Device) -> bool:
         """
-        Checks if inner list of devices contains a device with the same id as the input device. If there is one, it
-        replaces it with the new device.
+        Checks if there is a device with the same id as the input device. If there is one, it replaces it with the new
+        device.
         Args:
             device: Device with new information
 
         Returns:
             bool: True if one device has been updated. False otherwise.
         """
-        for index, current_device in enumerate(self._devices):
-            if current_device.id == device.id:
-                self._devices[index] = device
-                return True
-        return False
+        if device.id not in self._devices_by_id:
+            return False
+        self._store(device=device)
+        return True
 
     @typechecked
     def add_or_update(self, device: Device) -> None:
@@ -90,6 +110,87 @@ class Devices(ABC):
         if not updated:
             self.add(device=device)
 
+    def _store(self, device: Device) -> None:
+        """Stores a device under its id, keeping the position of the device it replaces, and indexes it."""
+        self._unindex(device_id=device.id)
+        self._devices_by_id[device.id] = device
+        self._positions.setdefault(device.id, len(self._positions))
+        self._index(device=device)
+
+    def _index(self, device: Device) -> None:
+        """Adds a device to the status and type indexes"""
+        status, device_type = _index_key(device.status), _index_key(device.type)
+        self._ids_by_status.setdefault(status, {})[device.id] = None
+        self._ids_by_type.setdefault(device_type, {})[device.id] = None
+        self._index_keys[device.id] = (status, device_type)
+
+    def _unindex(self, device_id: int) -> None:
+        """Removes a device from the status and type indexes, using the keys it was indexed with, since the status of
+        a device may have changed in place since then."""
+        if (index_keys := self._index_keys.pop(device_id, None)) is None:
+            return
+        status, device_type = index_keys
+        self._ids_by_status[status].pop(device_id, None)
+        self._ids_by_type[device_type].pop(device_id, None)
+
+    def _from_ids(self, device_ids: Iterable[int]) -> "Devices":
+        """Builds a Devices collection with the given devices, in insertion order, only visiting the given ones"""
+        selected_ids = sorted(set(device_ids), key=self._positions.__getitem__)
+        return Devices([self._devices_by_id[device_id] for device_id in selected_ids])
+
+    def __iter__(self) -> Iterator[Device]:
+        return iter(list(self._devices_by_id.values()))
+
+    def __len__(self) -> int:
+        return len(self._devices_by_id)
+
+    def __contains__(self, device_id: object) -> bool:
+        return device_id in self._devices_by_id
+
+    def by_status(self, status: str) -> "Devices":
+        """Returns the devices with the given status
+
+        Args:
+            status (str): device status, as in `DeviceStatus`
+
+        Returns:
+            Devices: devices with that status
+        """
+        return self._from_ids(self._ids_by_status.get(_index_key(status), {}))
+
+    def online(self) -> "Devices":
+        """Returns the online devices
+
+        Returns:
+            Devices: online devices
+        """
+        return self.by_status(DeviceStatus.ONLINE)
+
+    def by_type(self, device_type: str) -> "Devices":
+        """Returns the devices of the given type. A type prefix selects every type under it, so `by_type("quantum")`
+        returns the quantum, quantum analog and quantum digital devices.
+
+        Args:
+            device_type (str): device type, as in `DeviceType`, or a prefix of it
+
+        Returns:
+            Devices: devices of that type
+        """
+        return self._from_ids(
+            device_id
+            for indexed_type, device_ids in self._ids_by_type.items()
+            if indexed_type is not None and (indexed_type == device_type or indexed_type.startswith(f"{device_type}_"))
+            for device_id in device_ids
+        )
+
+    def least_loaded(self) -> Device | None:
+        """Returns the online device with the fewest pending jobs
+
+        Returns:
+            Device | None: least loaded online device, or None if no device is online
+        """
+        return min(self.online(), key=lambda device: device.number_pending_jobs or 0, default=None)
+
     def __str__(self) -> str:
         """String representation of a List of Devices
 
@@ -97,7 +198,7 @@ class Devices(ABC):
             str: String representation of a List of Devices
         """
         jsonized_devices = self.toJSON(expand=False)
-        return f"<Devices[{len(self._devices)}]:" f"{jsonized_devices}>"
+        return f"<Devices[{len(self)}]:" f"{jsonized_devices}>"
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -108,7 +209,7 @@ class Devices(ABC):
         Returns:
             list[dict]: a list of Devices converted into a dictionary
         """
-        return [dict(device.to_dict(expand=expand)) for device in self._devices]
+        return [dict(device.to_dict(expand=expand)) for device in self]
 
     def toJSON(self, expand=False) -> str:
         """returns a JSON string representation of the devices
@@ -117,7 +218,7 @@ class Devices(ABC):
             str: a JSON string representation of the devices
         """
         dict_list = []
-        for device in self._devices:
+        for device in self:
             dict_list.append(device.to_dict(expand=expand))
 
         return json.dumps(dict_list, indent=2)
@@ -145,12 +246,11 @@ class Devices(ABC):
         Returns:
 
         """
-        device_found = [device for device in self._devices if device.id == device_id]
-        if not device_found:
-            raise ValueError("Device not found")
-        if len(device_found) > 1:
+        if device_id in self._duplicated_ids:
             raise ValueError(f"Device duplicated with same id:{device_id}")
-        return device_found.pop()
+        if (device_found := self._devices_by_id.get(device_id)) is None:
+            raise ValueError("Device not found")
+        return device_found
 
     def set_device_to_online(self, connection: Connection, device_id: int) -> None:
         """Releases a device to let others use it
@@ -161,6 +261,7 @@ class Devices(ABC):
         """
         device_found = self._find_device(device_id)
         device_found.set_to_online(connection=connection)
+        self._store(device=device_found)
         logger.info("Device %s set online. STATUS: ONLINE", device_found.name)
 
     def set_device_to_maintenance(self, connection: Connection, device_id: int) -> None:
@@ -172,4 +273,5 @@ class Devices(ABC):
         """
         device_found = self._find_device(device_id)
         device_found.set_to_maintenance(connection=connection)
+        self._store(device=device_found)
         logger.info("Device %s set to maintenance. STATUS: MAINTENANCE", device_found.name)
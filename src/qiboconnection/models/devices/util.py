@@ -14,8 +14,7 @@
 
 """Device Utility Methods"""
 
-from typeguard import typechecked
-
+from qiboconnection.typechecking import typechecked
 from qiboconnection.typings.devices import DeviceInput
 
 from .device import Device
@@ -17,11 +17,17 @@
 import json
 from abc import ABC
 from dataclasses import asdict, dataclass, field
-from typing import Any, List
-
-from qibo.models.circuit import Circuit  # type: ignore[import-untyped]
-from typeguard import typechecked
-
+from typing import TYPE_CHECKING, Any, List
+
+from qiboconnection.serialization import (
+    encode_job_request,
+    escape_json_string,
+    expand_circuit_template,
+    serialize_circuit_template,
+    serialize_circuits,
+)
+from qiboconnection.tracing import span
+from qiboconnection.typechecking import typechecked
 from qiboconnection.typings.enums import JobStatus, JobType
 from qiboconnection.typings.requests import JobRequest
 from qiboconnection.typings.responses.job_response import JobResponse
@@ -33,6 +39,10 @@ from .devices.device import Device
 from .job_result import JobResult
 from .user import User
 
+if TYPE_CHECKING:
+    from numpy import typing as npt
+    from qibo.models.circuit import Circuit  # type: ignore[import-untyped]
+
 
 @dataclass
 class Job(ABC):
@@ -41,7 +51,9 @@ class Job(ABC):
     user: User
     device: Device
     program: ProgramDefinition | None = field(default=None)
-    circuit: list[Circuit] | None = None
+    circuit: "list[Circuit] | None" = None
+    parameters: "list | npt.NDArray | None" = None
+    template_sweep: bool = False
     qprogram: str | None = None
     anneal_program_args: dict | None = None
     vqa: VQA | None = None
@@ -51,6 +63,8 @@ class Job(ABC):
     name: str = "-"
     summary: str = "-"
     id: int = 0
+    _description: str | None = field(default=None, init=False, repr=False, compare=False)
+    _escaped_description: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         n = len([arg for arg in [self.qprogram, self.circuit, self.anneal_program_args, self.vqa] if arg is not None])
@@ -61,6 +75,8 @@ class Job(ABC):
                 )
             case 0:
                 raise ValueError("Neither of circuit, vqa, qprogram or anneal_program_args were provided.")
+        if self.parameters is not None and (self.circuit is None or len(self.circuit) != 1):
+            raise ValueError("Parameters can only be provided together with a single template circuit.")
 
     @property
     def user_id(self) -> int | None:
@@ -107,9 +123,60 @@ class Job(ABC):
             job_type=self.job_type,
             name=self.name,
             summary=self.summary,
-            description=self._get_job_description(),
+            description=self.description,
         )
 
+    @property
+    def description(self) -> str:
+        """Serialized description of the program the job executes. It is built only once per Job.
+
+        Returns:
+            str: job description
+        """
+        if self._description is None:
+            with span("qiboconnection.serialize_description", job_type=str(self.job_type)):
+                self._description = self._get_job_description()
+        return self._description
+
+    @description.setter
+    def description(self, description: str) -> None:
+        """Sets an already serialized description, e.g. one shared among jobs that execute the same program.
+
+        Args:
+            description (str): job description
+        """
+        self._description = description
+        self._escaped_description = None
+
+    @property
+    def escaped_description(self) -> bytes:
+        """Description escaped to be embedded in the JSON body of the submission. It is built only once per Job.
+
+        Returns:
+            bytes: escaped job description
+        """
+        if self._escaped_description is None:
+            self._escaped_description = escape_json_string(self.description)
+        return self._escaped_description
+
+    @escaped_description.setter
+    def escaped_description(self, escaped_description: bytes) -> None:
+        """Sets an already escaped description, e.g. one shared among jobs that execute the same program.
+
+        Args:
+            escaped_description (bytes): escaped job description
+        """
+        self._escaped_description = escaped_description
+
+    @property
+    def request_body(self) -> bytes:
+        """JSON body of the request that submits the job, built in one pass from the escaped description.
+
+        Returns:
+            bytes: utf-8 JSON body
+        """
+        return encode_job_request(self.job_request, escaped_description=self.escaped_description)
+
     @property
     def job_id(self) -> int:
         """Returns Job identifier
@@ -152,8 +219,12 @@ class Job(ABC):
             vqa_as_dict = asdict(self.vqa)
             vqa_as_dict.pop("vqa_dict")
             return json.dumps({**compress_any(self.vqa.vqa_dict), **vqa_as_dict})
+        if self.circuit is not None and self.parameters is not None and self.template_sweep:
+            return serialize_circuit_template(circuit=self.circuit[0], parameters=self.parameters)
+        if self.circuit is not None and self.parameters is not None:
+            return serialize_circuits(expand_circuit_template(circuit=self.circuit[0], parameters=self.parameters))
         if self.circuit is not None:
-            return json.dumps(compress_any([c.to_qasm() for c in self.circuit]))
+            return serialize_circuits(self.circuit)
 
         raise ValueError("No suitable information found for building description.")
 
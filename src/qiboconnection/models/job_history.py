@@ -0,0 +1,161 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bounded history of the jobs submitted through an API instance"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterator, List
+
+from qiboconnection.typings.enums import JobStatus, JobType
+
+from .job import Job
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """Lightweight record of a submitted job. Unlike `Job`, it does not hold the circuits or programs executed.
+
+    Attributes:
+        id (int): job identifier
+        device_id (int): identifier of the device the job was sent to
+        job_type (JobType): type of the job
+        nshots (int): number of shots
+        name (str): name of the job
+        summary (str): summary of the job
+        status (JobStatus): last known status of the job
+    """
+
+    id: int
+    device_id: int
+    job_type: JobType
+    nshots: int
+    name: str = "-"
+    summary: str = "-"
+    status: JobStatus = JobStatus.PENDING
+
+    @property
+    def job_id(self) -> int:
+        """Returns Job identifier
+
+        Returns:
+            int: Job identifier
+        """
+        return self.id
+
+    @classmethod
+    def from_job(cls, job: Job) -> "JobRecord":
+        """Builds the record of a submitted job
+
+        Args:
+            job (Job): submitted job
+
+        Returns:
+            JobRecord: record of the job
+        """
+        return cls(
+            id=job.id,
+            device_id=job.device_id,
+            job_type=job.job_type,
+            nshots=job.nshots,
+            name=job.name,
+            summary=job.summary,
+            status=job.job_status,
+        )
+
+
+class JobHistory:
+    """Thread-safe history of the latest submitted jobs, by id. Once it holds `max_size` jobs, adding a job discards the
+    oldest one.
+
+    Args:
+        max_size (int, optional): maximum number of jobs kept. 0 keeps none, and None keeps all of them.
+    """
+
+    def __init__(self, max_size: int | None = None):
+        if max_size is not None and max_size < 0:
+            raise ValueError("The size of the job history cannot be negative.")
+        self.max_size = max_size
+        self._jobs: OrderedDict[int, Job | JobRecord] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __iter__(self) -> Iterator[Job | JobRecord]:
+        return iter(self.to_list())
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._jobs
+
+    def add(self, job: Job | JobRecord) -> None:
+        """Adds a job to the history, discarding the oldest ones if it is full
+
+        Args:
+            job (Job | JobRecord): submitted job
+        """
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._jobs[job.id] = job
+            self._jobs.move_to_end(job.id)
+            while self.max_size is not None and len(self._jobs) > self.max_size:
+                self._jobs.popitem(last=False)
+
+    def update_status(self, job_id: int, status: JobStatus | str) -> None:
+        """Updates the status of a job of the history. Jobs that are not in the history are ignored.
+
+        Args:
+            job_id (int): job identifier
+            status (JobStatus | str): new status. Unknown statuses are ignored.
+        """
+        try:
+            status = JobStatus(status)
+        except ValueError:
+            return
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if isinstance(job, JobRecord):
+                job.status = status
+            elif job is not None:
+                job.job_status = status
+
+    def last(self) -> Job | JobRecord:
+        """Returns the latest job added
+
+        Raises:
+            IndexError: The history is empty.
+
+        Returns:
+            Job | JobRecord: latest job
+        """
+        with self._lock:
+            if not self._jobs:
+                raise IndexError("No jobs have been submitted.")
+            return next(reversed(self._jobs.values()))
+
+    def to_list(self) -> List[Job | JobRecord]:
+        """Returns the jobs of the history, from oldest to latest
+
+        Returns:
+            List[Job | JobRecord]: jobs
+        """
+        with self._lock:
+            return list(self._jobs.values())
+
+    def clear(self) -> None:
+        """Removes all the jobs of the history"""
+        with self._lock:
+            self._jobs.clear()
@@ -15,35 +15,40 @@
 """JobListing class"""
 
 from dataclasses import dataclass, field
-from typing import List
-
-import pandas as pd
+from typing import TYPE_CHECKING, List
 
+from qiboconnection.typings.compact import CompactModel
 from qiboconnection.typings.responses import JobListingItemResponse
 
 from .job_listing_item import JobListingItem
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass
 class JobListing:
     """JobListing representation"""
 
     items: List[JobListingItem]
-    _dataframe: pd.DataFrame = field(init=False)
+    _dataframe: "pd.DataFrame" = field(init=False)
 
     def __post_init__(self):
         self._dataframe = self._build_dataframe()
 
     def _build_dataframe(self):
         """Builds the dataframe from the info in each listing item"""
-        df = pd.DataFrame((item.__dict__ for item in self.items))
+        import pandas as pd  # noqa: PLC0415
+
+        df = pd.DataFrame((item.to_dict() if isinstance(item, CompactModel) else item.__dict__ for item in self.items))
         for col in df.columns:
             df[col] = self._coerce_column_type(column=df[col])
         return df
 
     @classmethod
-    def _coerce_column_type(cls, column: pd.Series):
+    def _coerce_column_type(cls, column: "pd.Series"):
         """Convert a column into a number if possible. Else, try to convert it into a date."""
+        import pandas as pd  # noqa: PLC0415
 
         try:
             return pd.to_numeric(column)
@@ -54,7 +59,7 @@ class JobListing:
                 return column
 
     @classmethod
-    def from_response(cls, response_list: List[JobListingItemResponse]):
+    def from_response(cls, response_list: List[JobListingItemResponse] | List[CompactModel]):
         """Constructor for JobListing that takes in a list of JobResponse"""
         return cls(items=[JobListingItem.from_response(response=response) for response in response_list])
 
@@ -15,6 +15,7 @@
 
 from dataclasses import field
 
+from qiboconnection.typings.compact import CompactModel, compact_model
 from qiboconnection.typings.enums import JobStatus, JobType
 from qiboconnection.typings.responses import JobListingItemResponse
 from qiboconnection.util import from_kwargs
@@ -31,6 +32,9 @@ class JobListingItem:
     id: int | None = field(default=None)
 
     @classmethod
-    def from_response(cls, response: JobListingItemResponse):
-        """Constructor for JobListingItems that takes in a JobListingItemResponse"""
+    def from_response(cls, response: JobListingItemResponse | CompactModel):
+        """Constructor for JobListingItems that takes in a JobListingItemResponse. Compact responses build compact
+        items."""
+        if isinstance(response, CompactModel):
+            return compact_model(cls).from_kwargs(**response.to_dict())
         return from_kwargs(cls, **response.__dict__)
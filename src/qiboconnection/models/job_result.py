@@ -17,14 +17,16 @@ import json
 import logging
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import List
-
-from numpy import typing as npt
-from qibo.result import CircuitResult  # type: ignore[import-untyped]
+from typing import TYPE_CHECKING, List
 
+from qiboconnection.tracing import span
 from qiboconnection.typings.enums import JobType
 from qiboconnection.util import decode_results_from_qprogram, decompress_any
 
+if TYPE_CHECKING:
+    from numpy import typing as npt
+    from qibo.result import CircuitResult  # type: ignore[import-untyped]
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,15 +37,20 @@ class JobResult(ABC):
     job_id: int
     http_response: str
     job_type: str
-    data: (
-        List[CircuitResult] | CircuitResult | npt.NDArray | List[int] | List[float] | dict | List[dict] | str | None
-    ) = field(init=False)
+    data: "List[CircuitResult] | CircuitResult | npt.NDArray | List[int] | List[float] | dict | List[dict] | str | None" = field(
+        init=False
+    )
 
     def __post_init__(self) -> None:
         """
         Decodes data from the http_response provided at instance creation, and uses that info to build the self.data
         attribute.
         """
+        with span("qiboconnection.decode_result", job_id=self.job_id, job_type=self.job_type):
+            self._decode()
+
+    def _decode(self) -> None:
+        """Decodes the http_response into self.data, trying the compressed format first and then the legacy ones"""
         try:
             self.data = decompress_any(**json.loads(self.http_response))
             return
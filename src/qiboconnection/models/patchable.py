@@ -0,0 +1,80 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Mixin of the resources updated with JSON patches"""
+
+import json
+from dataclasses import asdict, fields
+from typing import Any, ClassVar, Dict, List
+
+from qiboconnection import json_patch
+from qiboconnection.util import version_tag
+
+
+class PatchableMixin:
+    """Keeps track of the version of a resource in the server, to only send the changes made to it afterwards.
+
+    Changes are computed over the fields of the resource that can be updated, with its content decoded, so changing a
+    value of the content only sends an operation for that value, under the path of the content field, e.g.
+    `/runcard/...`. Only resources retrieved for editing, or already updated, keep track of their version in the server.
+    """
+
+    _request_class: ClassVar[type]
+    _content_field: ClassVar[str]
+    _server_document: Dict[str, Any] | None = None
+    _server_version: str | None = None
+
+    def _request(self) -> Any:
+        """Request with the fields of the resource that can be updated"""
+        raise NotImplementedError
+
+    @classmethod
+    def _decode_content(cls, encoded: str | None) -> Any:
+        """Content of the resource from its encoded representation in the server"""
+        raise NotImplementedError
+
+    def _document(self) -> Dict[str, Any]:
+        """Fields of the resource that can be updated, with its content decoded"""
+        return {field.name: getattr(self, field.name) for field in fields(self._request_class)}
+
+    def track_changes(self, response: Any) -> None:
+        """Keeps the resource as it is in the server, to compute the changes made to it afterwards. The content of the
+        response is decoded on its own, so later changes made to the content of the resource are not shared with it.
+
+        Args:
+            response (Any): response of the server with the resource
+        """
+        document = {field.name: getattr(response, field.name) for field in fields(self._request_class)}
+        document[self._content_field] = self._decode_content(document[self._content_field])
+        self._server_document = document
+        self._server_version = version_tag(response.updated_at)
+
+    @property
+    def server_version(self) -> str | None:
+        """Version of the resource in the server when it was last retrieved or updated, None if it is not tracked"""
+        return self._server_version
+
+    def changes_patch(self) -> List[Dict[str, Any]] | None:
+        """JSON patch with the changes made to the resource since it was last retrieved from the server or updated
+
+        Returns:
+            List[Dict[str, Any]] | None: JSON patch, or None if the version in the server is not known or sending the
+            whole resource takes fewer bytes
+        """
+        if self._server_document is None:
+            return None
+        patch = json_patch.diff(self._server_document, self._document())
+        if len(json.dumps(patch)) >= len(json.dumps(asdict(self._request()))):
+            return None
+        return patch
@@ -14,20 +14,31 @@
 
 """Runcard class"""
 
+import json
 from dataclasses import field
 
+from qiboconnection.models.patchable import PatchableMixin
 from qiboconnection.typings.requests import RuncardRequest
 from qiboconnection.typings.responses import RuncardResponse
-from qiboconnection.util import decode_jsonified_dict, jsonify_dict_and_base64_encode
+from qiboconnection.util import (
+    compress_any,
+    compressed_envelope,
+    decode_jsonified_dict,
+    decompress_any,
+    jsonify_dict_and_base64_encode,
+)
 
 
-class Runcard:
-    """Runcard representation"""
+class Runcard(PatchableMixin):
+    """Runcard representation. Runcards with a `compression`, 'gzip' or 'zstd', are uploaded compressed."""
 
     name: str
     description: str
     runcard: dict
     id: int | None = field(default=None)
+    compression: str | None = None
+    _request_class = RuncardRequest
+    _content_field = "runcard"
 
     def __init__(self, **kwargs):
         for k, v in kwargs.items():
@@ -35,13 +46,26 @@ class Runcard:
 
     @property
     def _encoded_runcard(self):
-        """return base64-encoded stringified jsonified experiment"""
-        return jsonify_dict_and_base64_encode(self.runcard) if self.runcard is not None else None
+        """return base64-encoded stringified jsonified experiment, or its compressed envelope if it has a compression"""
+        if self.runcard is None:
+            return None
+        if self.compression is not None:
+            return json.dumps(compress_any(self.runcard, compression=self.compression))
+        return jsonify_dict_and_base64_encode(self.runcard)
 
     @classmethod
-    def from_response(cls, response: RuncardResponse):
-        """Runcard constructor that takes in an instance from a RuncardResponse"""
-        return cls(
+    def _decode_content(cls, encoded: str | None):
+        """Decodes the runcard as stored in the server, either compressed or base64 encoded"""
+        envelope = compressed_envelope(encoded)
+        return decompress_any(**envelope) if envelope else decode_jsonified_dict(encoded)
+
+    @classmethod
+    def from_response(cls, response: RuncardResponse, track_changes: bool = False):
+        """Runcard constructor that takes in an instance from a RuncardResponse. Compressed runcards are detected and
+        keep their compression. With `track_changes`, the runcard keeps track of its version in the server,
+        to only send its changes when updated."""
+        envelope = compressed_envelope(response.runcard)
+        runcard = cls(
             id=response.runcard_id,
             created_at=response.created_at,
             updated_at=response.updated_at,
@@ -49,9 +73,16 @@ class Runcard:
             description=response.description,
             user_id=response.user_id,
             device_id=response.device_id,
-            runcard=decode_jsonified_dict(response.runcard),
+            runcard=cls._decode_content(response.runcard),
             qililab_version=response.qililab_version,
+            compression=envelope["compression"] if envelope else None,
         )
+        if track_changes:
+            runcard.track_changes(response)
+        return runcard
+
+    def _request(self) -> RuncardRequest:
+        return self.runcard_request()
 
     def runcard_request(self):
         """Created a Request instance"""
@@ -0,0 +1,153 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Queue-aware selection of the device a job is executed on"""
+
+import threading
+from time import monotonic
+from typing import Callable, Dict, List
+
+from qiboconnection.models.devices import Device, Devices
+
+_NUMBER_QUBITS_FEATURES = ("number_qubits", "nqubits", "qubits")
+
+
+def device_number_qubits(device: Device) -> int | None:
+    """Returns the number of qubits of a device, as reported in its static features.
+
+    Args:
+        device (Device): device to inspect
+
+    Returns:
+        int | None: number of qubits, or None if the device does not report it
+    """
+    static_features = device.static_features
+    if not isinstance(static_features, dict):
+        return None
+    for feature in _NUMBER_QUBITS_FEATURES:
+        value = static_features.get(feature)
+        if isinstance(value, int):
+            return value
+        if isinstance(value, list):
+            return len(value)
+    return None
+
+
+class DeviceScheduler:
+    """Picks the online device with the shortest queue among the ones able to run a job.
+
+    Devices are chosen from a snapshot of the device listing, which is fetched again once it is older than
+    `refresh_interval` seconds. Choosing a device therefore costs no request while the snapshot is fresh. Every device
+    chosen counts as one more pending job on it until the next snapshot, so bursts of jobs are spread among the devices
+    instead of all going to the one that had the shortest queue.
+
+    Args:
+        fetch_devices (Callable[[], Devices]): function that retrieves all the devices, usually `API.list_devices`
+        refresh_interval (float): seconds after which the snapshot is considered stale
+    """
+
+    def __init__(self, fetch_devices: Callable[[], Devices], refresh_interval: float = 30.0):
+        self.refresh_interval = refresh_interval
+        self._fetch_devices = fetch_devices
+        self._devices = Devices()
+        self._fetched_at: float | None = None
+        self._selected_jobs: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._selection_lock = threading.Lock()
+
+    def refresh(self) -> List[Device]:
+        """Fetches a new snapshot of the devices
+
+        Returns:
+            List[Device]: devices in the new snapshot
+        """
+        return list(self._refresh())
+
+    def snapshot(self) -> List[Device]:
+        """Returns the devices of the current snapshot, fetching a new one if it is stale
+
+        Returns:
+            List[Device]: known devices
+        """
+        return list(self._current_devices())
+
+    def _refresh(self) -> Devices:
+        """Fetches and stores a new snapshot of the devices"""
+        devices = self._fetch_devices()
+        with self._lock:
+            self._devices = devices
+            self._fetched_at = monotonic()
+            self._selected_jobs = {}
+        return devices
+
+    def _current_devices(self) -> Devices:
+        """Returns the current snapshot of the devices, fetching a new one if it is stale"""
+        with self._lock:
+            if self._fetched_at is not None and monotonic() - self._fetched_at < self.refresh_interval:
+                return self._devices
+        return self._refresh()
+
+    def candidates(self, nqubits: int | None = None, device_type: str | None = None) -> List[Device]:
+        """Returns the online devices able to run a job, sorted by the length of their queue.
+
+        Args:
+            nqubits (int, optional): number of qubits the job needs. Devices that do not report their number of qubits
+                are considered able to run it.
+            device_type (str, optional): type of device the job has to run on, as in `DeviceType`, or a prefix of it
+
+        Returns:
+            List[Device]: suitable devices, starting by the one with the shortest queue
+        """
+        devices = self._current_devices().online()
+        if device_type is not None:
+            devices = devices.by_type(device_type)
+        suitable_devices = [
+            device for device in devices if nqubits is None or (device_number_qubits(device) or nqubits) >= nqubits
+        ]
+        return sorted(suitable_devices, key=self.pending_jobs)
+
+    def pending_jobs(self, device: Device) -> int:
+        """Returns the pending jobs of a device: the ones in the snapshot plus the ones it was chosen for since then.
+
+        Args:
+            device (Device): device of the snapshot
+
+        Returns:
+            int: number of pending jobs
+        """
+        return (device.number_pending_jobs or 0) + self._selected_jobs.get(device.id, 0)
+
+    def select_device(self, nqubits: int | None = None, device_type: str | None = None) -> Device:
+        """Returns the online device with the shortest expected wait among the ones able to run a job.
+
+        Args:
+            nqubits (int, optional): number of qubits the job needs
+            device_type (str, optional): type of device the job has to run on, as in `DeviceType`
+
+        Raises:
+            ValueError: No online device is able to run the job.
+
+        Returns:
+            Device: selected device
+        """
+        with self._selection_lock:
+            candidates = self.candidates(nqubits=nqubits, device_type=device_type)
+            if not candidates:
+                raise ValueError(
+                    f"No online device is able to run the job (nqubits={nqubits}, device_type={device_type})."
+                )
+            device = candidates[0]
+            with self._lock:
+                self._selected_jobs[device.id] = self._selected_jobs.get(device.id, 0) + 1
+        return device
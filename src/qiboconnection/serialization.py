@@ -0,0 +1,353 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Serialization of job descriptions, with a content-addressed cache for the circuits that get submitted repeatedly."""
+
+import base64
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Callable, List
+
+from qiboconnection.tracing import span
+from qiboconnection.typings.requests import JobRequest
+from qiboconnection.util import compress_any
+
+if TYPE_CHECKING:
+    from numpy import typing as npt
+    from qibo.models.circuit import Circuit  # type: ignore[import-untyped]
+
+_CONTROL_CHARACTERS = bytes(range(0x20))
+
+
+class DescriptionCache:
+    """Thread-safe LRU cache of serialized job descriptions, indexed by the content hash of what they describe.
+
+    Args:
+        maxsize (int): maximum number of descriptions kept. A maxsize of 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of descriptions kept in the cache
+
+        Returns:
+            int: maximum number of entries
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        """Updates the maximum number of entries, evicting the least recently used ones if needed.
+
+        Args:
+            maxsize (int): new maximum number of entries
+        """
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(self, key: str, builder: Callable[[], str]) -> str:
+        """Returns the description stored under `key`, building and storing it with `builder` if it is not cached.
+
+        Args:
+            key (str): content hash of the described object
+            builder (Callable[[], str]): function that serializes the object
+
+        Returns:
+            str: serialized description
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        description = builder()
+        with self._lock:
+            self.misses += 1
+            if self._maxsize > 0:
+                self._entries[key] = description
+                self._entries.move_to_end(key)
+                self._evict()
+        return description
+
+    def clear(self) -> None:
+        """Removes all the cached descriptions and resets the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self) -> None:
+        """Drops the least recently used entries until the cache fits in its maxsize"""
+        while len(self._entries) > max(self._maxsize, 0):
+            self._entries.popitem(last=False)
+
+
+description_cache = DescriptionCache()
+
+
+def circuits_hash(circuits: "List[Circuit]", include_parameters: bool = True) -> str:
+    """Computes a content hash of a list of circuits from their structure and parameters, without serializing them.
+
+    Two lists of circuits share a hash only if they have the same number of qubits and the same gates, acting on the
+    same qubits, with the same parameters and measurement registers.
+
+    Args:
+        circuits (List[Circuit]): circuits to hash
+        include_parameters (bool): whether the values of the gate parameters are part of the hash. When False, circuits
+            that only differ in their gate angles share a hash.
+
+    Returns:
+        str: hex digest identifying the circuits
+    """
+    digest = hashlib.sha256()
+    for circuit in circuits:
+        digest.update(f"circuit:{circuit.nqubits};".encode())
+        for gate in circuit.queue:
+            parameter_names = getattr(gate, "parameter_names", None) or []
+            if isinstance(parameter_names, str):
+                parameter_names = [parameter_names]
+            gate_fingerprint = (
+                type(gate).__name__,
+                gate.name,
+                tuple(gate.target_qubits),
+                tuple(gate.control_qubits),
+                gate.init_args if include_parameters else gate.init_args[: len(gate.qubits)],
+                sorted(
+                    (key, value)
+                    for key, value in gate.init_kwargs.items()
+                    if include_parameters or key not in parameter_names
+                ),
+                gate.parameters if include_parameters else len(gate.parameters),
+                getattr(gate, "register_name", None),
+            )
+            digest.update(f"{gate_fingerprint!r};".encode())
+    return digest.hexdigest()
+
+
+def serialize_circuits(circuits: "List[Circuit]") -> str:
+    """Builds the compressed description of a list of circuits, reusing it from the `description_cache` when the same
+    circuits have already been serialized.
+
+    Args:
+        circuits (List[Circuit]): circuits to serialize
+
+    Returns:
+        str: jsonified compressed list of the qasm representation of the circuits
+    """
+    return description_cache.get_or_build(
+        key=circuits_hash(circuits), builder=lambda: json.dumps(compress_any([c.to_qasm() for c in circuits]))
+    )
+
+
+def compress_array(array: "npt.ArrayLike") -> dict:
+    """Packs a numeric array into a compact json-serializable dict: its raw float64 bytes, gzipped and base64 encoded.
+
+    Args:
+        array (npt.ArrayLike): array to compress
+
+    Returns:
+        dict: compressed array, with the info needed for rebuilding it
+    """
+    import numpy as np  # noqa: PLC0415
+
+    contiguous_array = np.ascontiguousarray(array, dtype=np.float64)
+    with span("qiboconnection.compress", bytes=contiguous_array.nbytes):
+        compressed_data = base64.b64encode(gzip.compress(contiguous_array.tobytes(), mtime=0)).decode()
+    return {
+        "data": compressed_data,
+        "dtype": str(contiguous_array.dtype),
+        "shape": list(contiguous_array.shape),
+        "compression": "gzip",
+    }
+
+
+def decompress_array(data: str, dtype: str, shape: List[int], **kwargs) -> "npt.NDArray":
+    """Inverse of `compress_array`.
+
+    Args:
+        data (str): base64 encoded gzipped array bytes
+        dtype (str): numpy dtype of the array
+        shape (List[int]): shape of the array
+
+    Returns:
+        npt.NDArray: rebuilt array
+    """
+    import numpy as np  # noqa: PLC0415
+
+    return np.frombuffer(gzip.decompress(base64.b64decode(data)), dtype=dtype).reshape(shape)
+
+
+def _expand_to_all_parameters(circuit: "Circuit", parameters: "npt.NDArray") -> "npt.NDArray":
+    """Builds, for each row of trainable parameters, the row with the values of every parametrized gate of the circuit.
+    Non-trainable gates keep the values they have in the template circuit.
+
+    This is needed because a circuit rebuilt from qasm considers all its parametrized gates trainable.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    trainable_columns: List[int] = []
+    fixed_columns: List[int] = []
+    fixed_values: List[float] = []
+    column = 0
+    for gate in circuit.queue:
+        gate_parameters = tuple(gate.parameters)
+        if not gate_parameters:
+            continue
+        gate_columns = list(range(column, column + len(gate_parameters)))
+        if getattr(gate, "trainable", True):
+            trainable_columns.extend(gate_columns)
+        else:
+            fixed_columns.extend(gate_columns)
+            fixed_values.extend(gate_parameters)
+        column += len(gate_parameters)
+
+    if parameters.shape[1] != len(trainable_columns):
+        raise ValueError(
+            f"Each parameter vector should have {len(trainable_columns)} values, one for each trainable parameter of "
+            + f"the circuit, but {parameters.shape[1]} were provided."
+        )
+    all_parameters = np.empty((parameters.shape[0], column), dtype=np.float64)
+    all_parameters[:, trainable_columns] = parameters
+    all_parameters[:, fixed_columns] = fixed_values
+    return all_parameters
+
+
+def expand_circuit_template(circuit: "Circuit", parameters: "npt.ArrayLike") -> "List[Circuit]":
+    """Builds one circuit per point of a parameter sweep by binding each vector of trainable parameters to a copy of the
+    template circuit.
+
+    Args:
+        circuit (Circuit): template circuit
+        parameters (npt.ArrayLike): one vector of trainable parameters per point of the sweep, in the order given by
+            `circuit.get_parameters()`.
+
+    Returns:
+        List[Circuit]: circuits of the sweep
+    """
+    import numpy as np  # noqa: PLC0415
+
+    parameters_array = np.atleast_2d(np.asarray(parameters, dtype=np.float64))
+    if parameters_array.ndim != 2:  # noqa: PLR2004
+        raise ValueError("Parameters should be provided as a list of parameter vectors.")
+    _expand_to_all_parameters(circuit=circuit, parameters=parameters_array)
+    circuits = []
+    for row in parameters_array:
+        bound_circuit = circuit.copy(deep=True)
+        bound_circuit.set_parameters(list(row))
+        circuits.append(bound_circuit)
+    return circuits
+
+
+def serialize_circuit_template(circuit: "Circuit", parameters: "npt.ArrayLike") -> str:
+    """Builds the description of a parameter sweep: the qasm of the circuit skeleton, serialized once, plus the compact
+    array of parameters to bind to it for each point of the sweep.
+
+    Only servers that bind templates understand this description. Others would run the template circuit alone, so it
+    is only sent when asked for with `API.execute(..., template_sweep=True)`.
+
+    Args:
+        circuit (Circuit): template circuit
+        parameters (npt.ArrayLike): one vector of trainable parameters per point of the sweep, in the order given by
+            `circuit.get_parameters()`.
+
+    Returns:
+        str: jsonified compressed description of the sweep
+    """
+    import numpy as np  # noqa: PLC0415
+
+    parameters_array = np.atleast_2d(np.asarray(parameters, dtype=np.float64))
+    if parameters_array.ndim != 2:  # noqa: PLR2004
+        raise ValueError("Parameters should be provided as a list of parameter vectors.")
+    all_parameters = _expand_to_all_parameters(circuit=circuit, parameters=parameters_array)
+    skeleton = description_cache.get_or_build(
+        key=f"template:{circuits_hash([circuit], include_parameters=False)}",
+        builder=lambda: json.dumps(compress_any([circuit.to_qasm()])),
+    )
+    return json.dumps({**json.loads(skeleton), "parameters": compress_array(all_parameters)})
+
+
+def bind_circuit_template(skeleton: str, parameters: "npt.NDArray") -> "List[Circuit]":
+    """Builds one circuit per row of parameters from the qasm of a template circuit.
+
+    Args:
+        skeleton (str): qasm of the template circuit
+        parameters (npt.NDArray): values of every parametrized gate, one row per circuit to build
+
+    Returns:
+        List[Circuit]: circuits of the sweep
+    """
+    from qibo.models.circuit import Circuit  # type: ignore[import-untyped]  # noqa: PLC0415
+
+    template = Circuit.from_qasm(skeleton)
+    circuits = []
+    for row in parameters:
+        circuit = template.copy(deep=True)
+        circuit.set_parameters(list(row))
+        circuits.append(circuit)
+    return circuits
+
+
+def escape_json_string(value: str) -> bytes:
+    """Escapes a string to embed it in a JSON document, without the surrounding quotes.
+
+    Job descriptions are ASCII JSON documents, where quotes are the only characters to escape. Those are escaped with a
+    single byte replacement, which is faster than the character-by-character escaping of `json.dumps`.
+    Any other string falls back to `json.dumps`.
+
+    Args:
+        value (str): string to escape
+
+    Returns:
+        bytes: escaped string, encoded in ascii
+    """
+    if value.isascii():
+        encoded_value = value.encode("ascii")
+        if b"\\" not in encoded_value and len(encoded_value.translate(None, _CONTROL_CHARACTERS)) == len(encoded_value):
+            return encoded_value.replace(b'"', b'\\"')
+    return json.dumps(value)[1:-1].encode("ascii")
+
+
+def encode_job_request(job_request: JobRequest, escaped_description: bytes | None = None) -> bytes:
+    """Builds the JSON body of a job submission. The description, which holds the whole payload of the job, is only
+    escaped once and copied once into the body, instead of going through `json.dumps` and being encoded afterwards.
+
+    Args:
+        job_request (JobRequest): request to encode
+        escaped_description (bytes, optional): description already escaped with `escape_json_string`, e.g. shared by
+            the jobs sent to many devices. Escaped from the request if not provided.
+
+    Returns:
+        bytes: utf-8 JSON body
+    """
+    fields = asdict(job_request)
+    description = fields.pop("description")
+    if escaped_description is None:
+        escaped_description = escape_json_string(description)
+    head = json.dumps(fields)
+    return b"".join((head[:-1].encode("utf-8"), b', "description": "', escaped_description, b'"}'))
@@ -0,0 +1,248 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side rate limiting and concurrency control of the calls made to the remote server"""
+
+import re
+import threading
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Callable, Dict
+from urllib.parse import urlsplit
+
+from requests import codes
+
+from qiboconnection.config import logger
+from qiboconnection.timeouts import remaining_time
+from qiboconnection.typings.enums import EndpointClass
+
+if TYPE_CHECKING:
+    import requests
+
+_ID_SEGMENT = re.compile(r"/\d+/?$")
+_DEFAULT_RETRY_AFTER = 1.0
+_RATE_DECREASE = 0.5
+_RATE_INCREASE = 0.05
+_MIN_RATE_FRACTION = 0.05
+
+
+def endpoint_class(method: str, url: str) -> EndpointClass:
+    """Classifies a call by the kind of endpoint it hits
+
+    Args:
+        method (str): HTTP method
+        url (str): called url
+
+    Returns:
+        EndpointClass: auth for the token calls, submission for new circuits, polling for reading a single item, listing
+        for reading collections and other for the rest
+    """
+    path = urlsplit(url).path
+    method = method.lower()
+    if "/authorisation-tokens" in path:
+        return EndpointClass.AUTH
+    if method == "post" and path.rstrip("/").endswith("/circuits"):
+        return EndpointClass.SUBMISSION
+    if method == "get":
+        return EndpointClass.POLLING if _ID_SEGMENT.search(path) else EndpointClass.LISTING
+    return EndpointClass.OTHER
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Limits of the calls of an endpoint class
+
+    Attributes:
+        rate (float | None): sustained calls per second. None for no limit.
+        burst (int): calls that can be made at once after being idle, on top of the sustained rate
+        max_concurrency (int | None): calls in flight at the same time. None for no limit.
+    """
+
+    rate: float | None = None
+    burst: int = 1
+    max_concurrency: int | None = None
+
+    def __post_init__(self):
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError("Rate should be positive.")
+        if self.burst < 1:
+            raise ValueError("Burst should be at least 1.")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError("Max concurrency should be at least 1.")
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Each call takes a token, and tokens are refilled at `rate` per second up to `burst`.
+
+    The rate adapts to the throttling of the server: it is halved every time the server asks to slow down, and
+    recovers by 5% of the configured rate on every successful call.
+
+    Args:
+        rate (float | None): tokens per second. None never blocks, other than while paused.
+        burst (int): capacity of the bucket
+    """
+
+    def __init__(self, rate: float | None = None, burst: int = 1):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available, and takes it. Waits are bounded by the current deadline, if any.
+
+        Raises:
+            TimeoutError: The deadline was reached before a token was available.
+        """
+        while True:
+            with self._lock:
+                now = monotonic()
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self.rate is None:
+                        return
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            remaining = remaining_time()
+            if remaining is not None:
+                if remaining <= 0:
+                    raise TimeoutError("Deadline exceeded while waiting to be allowed to call the server.")
+                wait = min(wait, remaining)
+            sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stops handing tokens out for some seconds and slows the rate down, as asked by the server
+
+        Args:
+            seconds (float): seconds to wait before the next call
+        """
+        with self._lock:
+            now = monotonic()
+            # calls throttled while already paused were in flight together, so the rate is only slowed down once
+            if self.rate is not None and self.max_rate is not None and now >= self._paused_until:
+                self.rate = max(self.rate * _RATE_DECREASE, self.max_rate * _MIN_RATE_FRACTION)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens, self._updated = 1.0, self._paused_until
+
+    def recover(self) -> None:
+        """Speeds the rate back up towards the configured one after a successful call"""
+        if self.rate is None or self.max_rate is None or self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * _RATE_INCREASE)
+
+
+def retry_after(response: "requests.Response", default: float = _DEFAULT_RETRY_AFTER) -> float | None:
+    """Seconds the server asks to wait before calling again, if it is throttling the calls
+
+    Args:
+        response (requests.Response): response of a call
+        default (float): seconds to wait after a 429 response without a `Retry-After` header
+
+    Returns:
+        float | None: seconds to wait, or None if the response is not a throttling one
+    """
+    if response.status_code not in {codes.too_many_requests, codes.service_unavailable}:
+        return None
+    header = response.headers.get("Retry-After")
+    if header is None:
+        return default if response.status_code == codes.too_many_requests else None
+    try:
+        return max(0.0, float(header))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(header) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+
+class Throttle:
+    """Rate limiter and concurrency governor of the calls of a `Connection`, shared by all the threads using it.
+
+    Every endpoint class has its own token bucket and, if its concurrency is limited, semaphore. Calls answered with a
+    429, or a 503 with a `Retry-After` header, pause their endpoint class for the time asked by the server, slow its
+    rate down and are retried, unless the wait would go past the current deadline.
+
+    Args:
+        limits (Dict[str, RateLimit], optional): limits by endpoint class, i.e. 'auth', 'submission', 'polling',
+            'listing' or 'other'. Endpoint classes without limits are not throttled, but still wait when asked to.
+        max_retries (int): times a throttled call is retried before returning its response
+        max_retry_after (float): maximum seconds to wait before retrying, whatever the server asks for
+    """
+
+    def __init__(self, limits: Dict[str, RateLimit] | None = None, max_retries: int = 3, max_retry_after: float = 60.0):
+        limits = {EndpointClass(name): limit for name, limit in (limits or {}).items()}
+        self.limits = {name: limits.get(name, RateLimit()) for name in EndpointClass}
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self._buckets = {name: TokenBucket(rate=limit.rate, burst=limit.burst) for name, limit in self.limits.items()}
+        self._semaphores = {
+            name: threading.BoundedSemaphore(limit.max_concurrency)
+            for name, limit in self.limits.items()
+            if limit.max_concurrency is not None
+        }
+
+    def bucket(self, name: str) -> TokenBucket:
+        """Token bucket of an endpoint class
+
+        Args:
+            name (str): endpoint class
+
+        Returns:
+            TokenBucket: bucket
+        """
+        return self._buckets[EndpointClass(name)]
+
+    def call(self, method: str, url: str, send: Callable[[], "requests.Response"]) -> "requests.Response":
+        """Makes a call within the limits of its endpoint class, retrying it while the server throttles it
+
+        Args:
+            method (str): HTTP method
+            url (str): called url
+            send (Callable[[], requests.Response]): function making the call
+
+        Returns:
+            requests.Response: response of the last attempt
+        """
+        name = endpoint_class(method=method, url=url)
+        bucket, semaphore = self._buckets[name], self._semaphores.get(name)
+        attempt = 0
+        while True:
+            bucket.acquire()
+            with semaphore or nullcontext():
+                response = send()
+            wait = retry_after(response)
+            if wait is None:
+                bucket.recover()
+                return response
+            wait = min(wait, self.max_retry_after)
+            bucket.pause(wait)
+            remaining = remaining_time()
+            if attempt >= self.max_retries or (remaining is not None and remaining <= wait):
+                return response
+            attempt += 1
+            logger.warning(
+                "Throttled by the server (%i) on %s calls. Retrying in %.1fs.", response.status_code, name.value, wait
+            )
@@ -0,0 +1,148 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Timeouts of the calls made to the remote server, by endpoint, and deadlines spanning several calls"""
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from time import monotonic
+from typing import Dict, Iterator, Tuple
+
+from qiboconnection.typings.enums import EndpointClass
+
+TIMEOUT_ENV_VAR = "QIBOCONNECTION_TIMEOUT"
+DOWNLOAD = "download"
+
+_deadline: ContextVar[float | None] = ContextVar("qiboconnection_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Bounds every call made within the context, in this thread or in the tasks copying its context, to finish
+    `seconds` from now. Nested deadlines can only shorten the outer ones.
+
+    Args:
+        seconds (float, optional): seconds from now. None sets no deadline.
+    """
+    if seconds is None:
+        yield
+        return
+    current = _deadline.get()
+    token = _deadline.set(monotonic() + seconds if current is None else min(current, monotonic() + seconds))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Seconds left until the current deadline
+
+    Returns:
+        float | None: seconds, negative once the deadline has passed, or None if there is no deadline
+    """
+    current = _deadline.get()
+    return None if current is None else current - monotonic()
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """Timeouts of a call, in seconds. None means no limit.
+
+    Attributes:
+        connect (float | None): seconds to establish the connection with the server
+        read (float | None): seconds to wait for the server to send the next bytes. Big bodies can take longer in
+            total, as long as they keep arriving.
+        total (float | None): seconds from the start of the call after which no attempt, nor retry when throttled,
+            is made, and which caps the connect and read timeouts of each attempt. It bounds every wait on the server,
+            not the whole transfer: a response whose bytes keep arriving within the read timeout can finish later.
+    """
+
+    connect: float | None = None
+    read: float | None = None
+    total: float | None = None
+
+    def for_requests(self) -> float | Tuple[float | None, float | None] | None:
+        """Timeout argument of `requests`, capped by the current deadline
+
+        Raises:
+            TimeoutError: The deadline has already passed.
+
+        Returns:
+            float | Tuple[float | None, float | None] | None: timeout, as a single number when connect and read match
+        """
+        connect, read = self.connect, self.read
+        remaining = remaining_time()
+        if remaining is not None:
+            if remaining <= 0:
+                raise TimeoutError("Deadline exceeded before the call could be made.")
+            connect = remaining if connect is None else min(connect, remaining)
+            read = remaining if read is None else min(read, remaining)
+        return connect if connect == read else (connect, read)
+
+
+def _environment_timeout() -> float:
+    """Timeout set through the `QIBOCONNECTION_TIMEOUT` environment variable, 10 seconds by default"""
+    return float(os.getenv(TIMEOUT_ENV_VAR, "10"))
+
+
+class TimeoutPolicy:
+    """Timeouts of the calls of a `Connection` by endpoint class: 'auth', 'submission' (which includes uploads),
+    'polling', 'listing', 'other', and 'download' for the calls retrieving job results.
+
+    By default, every call gets the `QIBOCONNECTION_TIMEOUT` seconds, read once when the policy is built, to connect and
+    to read, except for submissions and downloads, which wait at least 60 and 300 seconds for the server to answer, and
+    polls, which wait at most 5 seconds to connect.
+
+    Args:
+        default (Timeout, optional): timeout of the endpoint classes without their own. If not provided, the
+            environment timeout with the longer waits described above.
+        endpoints (Dict[str, Timeout], optional): timeouts by endpoint class
+    """
+
+    def __init__(self, default: Timeout | None = None, endpoints: Dict[str, Timeout] | None = None):
+        names = [*EndpointClass, DOWNLOAD]
+        endpoints = endpoints or {}
+        for name in endpoints:
+            if name not in names:
+                raise ValueError(f"Unknown endpoint class {name}. Use one of {', '.join(names)}.")
+        if default is None:
+            seconds = _environment_timeout()
+            default = Timeout(connect=seconds, read=seconds)
+            endpoints = {
+                EndpointClass.SUBMISSION: replace(default, read=max(seconds, 60)),
+                DOWNLOAD: replace(default, read=max(seconds, 300)),
+                EndpointClass.POLLING: replace(default, connect=min(seconds, 5)),
+                **endpoints,
+            }
+        self.default = default
+        self.endpoints: Dict[str, Timeout] = {name: endpoints.get(name, default) for name in names}
+
+    def get(self, name: str) -> Timeout:
+        """Timeout of an endpoint class
+
+        Args:
+            name (str): endpoint class
+
+        Returns:
+            Timeout: timeout
+        """
+        return self.endpoints.get(name, self.default)
+
+    @property
+    def download(self) -> Timeout:
+        """Timeout of the calls retrieving job results"""
+        return self.get(DOWNLOAD)
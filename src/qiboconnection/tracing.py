@@ -0,0 +1,275 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pluggable tracing of the logical operations of the API.
+
+Operations such as submitting a job, polling it or decoding its result are wrapped in nested spans, so a single trace
+shows whether a slow experiment is bound by serialization, network, queueing or decoding. Spans are discarded unless a
+tracer is set with `set_tracer`, for every API of the process:
+
+    set_tracer(OpenTelemetryTracer())  # export the spans through OpenTelemetry
+    set_tracer(RecordingTracer())  # keep the spans in memory to inspect them
+"""
+
+import threading
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, TypeVar
+
+_F = TypeVar("_F", bound=Callable)
+
+
+class Span:
+    """Span that records nothing, and base of the spans of every tracer"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Annotates the span
+
+        Args:
+            key (str): attribute name
+            value (Any): attribute value
+        """
+
+
+class Tracer:
+    """Tracer that records nothing. Other tracers subclass it and override `start_span`."""
+
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> AbstractContextManager[Span]:  # noqa: PLR6301
+        """Starts a span, nested in the current one, that ends when the returned context manager exits
+
+        Args:
+            name (str): name of the operation
+            attributes (Dict[str, Any]): annotations of the span
+
+        Returns:
+            AbstractContextManager[Span]: context manager returning the started span
+        """
+        return _NO_OP_SPAN_CONTEXT
+
+
+class _NoOpSpanContext(AbstractContextManager):
+    """Reusable context manager of the spans that record nothing"""
+
+    def __enter__(self) -> Span:
+        return _NO_OP_SPAN
+
+    def __exit__(self, *_) -> None:
+        return None
+
+
+_NO_OP_SPAN = Span()
+_NO_OP_SPAN_CONTEXT = _NoOpSpanContext()
+
+
+@dataclass
+class RecordedSpan(Span):
+    """Span kept in memory by a `RecordingTracer`
+
+    Attributes:
+        name (str): name of the operation
+        parent (RecordedSpan | None): span it is nested in
+        attributes (Dict[str, Any]): annotations of the span
+        start (float): `perf_counter` time when the span started
+        end (float | None): `perf_counter` time when the span ended, None while it is running
+        error (Exception | None): exception raised within the span
+    """
+
+    name: str
+    parent: "RecordedSpan | None" = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start: float = field(default_factory=perf_counter)
+    end: float | None = None
+    error: Exception | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Seconds the span lasted, None while it is running
+
+        Returns:
+            float | None: duration
+        """
+        return None if self.end is None else self.end - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class RecordingTracer(Tracer):
+    """Tracer that keeps the finished spans in memory, in the order they ended.
+
+    Args:
+        max_spans (int): maximum number of spans kept. The oldest ones are discarded afterwards.
+    """
+
+    def __init__(self, max_spans: int = 10000):
+        self.max_spans = max_spans
+        self._spans: List[RecordedSpan] = []
+        self._current: ContextVar[RecordedSpan | None] = ContextVar("qiboconnection_current_span", default=None)
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> List[RecordedSpan]:
+        """Finished spans
+
+        Returns:
+            List[RecordedSpan]: spans, in the order they ended
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def children(self, span: RecordedSpan) -> List[RecordedSpan]:
+        """Finished spans nested directly in a span
+
+        Args:
+            span (RecordedSpan): parent span
+
+        Returns:
+            List[RecordedSpan]: child spans, in the order they ended
+        """
+        return [child for child in self.spans if child.parent is span]
+
+    def clear(self) -> None:
+        """Forgets the finished spans"""
+        with self._lock:
+            self._spans.clear()
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Iterator[RecordedSpan]:
+        recorded_span = RecordedSpan(name=name, parent=self._current.get(), attributes=dict(attributes))
+        token = self._current.set(recorded_span)
+        try:
+            yield recorded_span
+        except Exception as ex:
+            recorded_span.error = ex
+            raise
+        finally:
+            recorded_span.end = perf_counter()
+            self._current.reset(token)
+            with self._lock:
+                self._spans.append(recorded_span)
+                del self._spans[: -self.max_spans]
+
+
+class _OpenTelemetrySpan(Span):
+    """Wraps an OpenTelemetry span"""
+
+    def __init__(self, span: Any):
+        self._span = span
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self._span.set_attribute(key, value)
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer that exports the spans through OpenTelemetry. Requires the `opentelemetry-api` package, installed with
+    `pip install qiboconnection[opentelemetry]`.
+
+    Args:
+        tracer (opentelemetry.trace.Tracer, optional): OpenTelemetry tracer to create the spans with. If not provided,
+            the one of the global tracer provider is used.
+
+    Raises:
+        ImportError: opentelemetry-api is not installed.
+    """
+
+    def __init__(self, tracer: Any = None):
+        if tracer is None:
+            try:
+                from opentelemetry import trace  # noqa: PLC0415
+            except ImportError as ex:
+                raise ImportError(
+                    "OpenTelemetryTracer requires opentelemetry-api. Install it with "
+                    + "`pip install qiboconnection[opentelemetry]`."
+                ) from ex
+            tracer = trace.get_tracer("qiboconnection")
+        self._tracer = tracer
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Iterator[Span]:
+        with self._tracer.start_as_current_span(name, attributes=_otel_attributes(attributes)) as otel_span:
+            yield _OpenTelemetrySpan(otel_span)
+
+
+def _otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Keeps the attributes OpenTelemetry accepts, converting the other ones into strings"""
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
+
+
+class _TracingState:
+    """Holds the tracer the spans are sent to"""
+
+    def __init__(self):
+        self.tracer = Tracer()
+
+
+_state = _TracingState()
+
+
+def get_tracer() -> Tracer:
+    """Returns the tracer the spans are sent to
+
+    Returns:
+        Tracer: current tracer
+    """
+    return _state.tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Sets the tracer the spans are sent to
+
+    Args:
+        tracer (Tracer | None): tracer to use. None discards the spans.
+    """
+    _state.tracer = tracer if tracer is not None else Tracer()
+
+
+def span(name: str, **attributes: Any) -> AbstractContextManager[Span]:
+    """Starts a span nested in the current one, with the current tracer
+
+    Args:
+        name (str): name of the operation, e.g. `qiboconnection.execute`
+        **attributes: annotations of the span
+
+    Returns:
+        AbstractContextManager[Span]: context manager returning the started span
+    """
+    return _state.tracer.start_span(name, attributes)
+
+
+def traced(name: str) -> Callable[[_F], _F]:
+    """Decorator that wraps every call of a function in a span
+
+    Args:
+        name (str): name of the span
+
+    Returns:
+        Callable: decorator
+    """
+
+    def decorator(func: _F) -> _F:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _state.tracer.start_span(name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
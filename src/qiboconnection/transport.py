@@ -0,0 +1,359 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Transports performing the HTTP calls of `Connection`, including ones recording and replaying the traffic"""
+
+import base64
+import gzip
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from io import BytesIO
+from time import perf_counter, sleep
+from typing import Any, Deque, Dict, FrozenSet, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from qiboconnection.errors import ConnectionException
+
+SECRET_FIELDS = frozenset({"assertion", "apiKey", "api_key", "password", "accessToken", "refreshToken"})
+# Secret headers, and the ones describing the encoding of the body, which is recorded already decoded
+_UNRECORDED_HEADERS = frozenset(
+    {"authorization", "cookie", "set-cookie", "x-api-key", "content-encoding", "content-length", "transfer-encoding"}
+)
+_TOKEN_FIELDS = frozenset({"accessToken", "refreshToken"})
+_REDACTED = "***"
+_REDACTED_SIGNATURE = "cmVkYWN0ZWQ"
+_JWT_SEGMENTS = 3
+
+
+class Transport(ABC):
+    """Performs the HTTP calls of a `Connection`. Subclasses can record, replay or alter the traffic."""
+
+    @abstractmethod
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Makes an HTTP call
+
+        Args:
+            method (str): lowercase HTTP method, e.g. `get`
+            url (str): url to call
+            **kwargs: arguments of the `requests` call, e.g. `json`, `headers` or `timeout`
+
+        Returns:
+            requests.Response: response
+        """
+
+
+class RequestsTransport(Transport):
+    """Transport making the calls with `requests`, which is the default one"""
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:  # noqa: PLR6301
+        return getattr(requests, method)(url, **kwargs)
+
+
+@dataclass(slots=True)
+class RecordedExchange:
+    """Request and response of a recorded call. Secrets are redacted before the exchange is built.
+
+    Attributes:
+        method (str): lowercase HTTP method
+        path (str): path and sorted query of the called url, including its params, without the scheme and host
+        status_code (int): status of the response
+        reason (str): reason of the response status
+        headers (Dict[str, str]): response headers
+        content (str): response body, as text or base64 encoded as told by `base64_content`
+        started (float): seconds since the recording started until the call was made
+        duration (float): seconds the call took
+        request (Any): body of the request, if any: its json document, or its text if it is not json, base64 encoded
+            as told by `base64_request` if it is binary
+        base64_content (bool): whether `content` is base64 encoded, for binary bodies
+        base64_request (bool): whether `request` is base64 encoded, for binary bodies
+    """
+
+    method: str
+    path: str
+    status_code: int
+    reason: str
+    headers: Dict[str, str]
+    content: str
+    started: float
+    duration: float
+    request: Any = None
+    base64_content: bool = False
+    base64_request: bool = False
+
+    @property
+    def body(self) -> bytes:
+        """Response body"""
+        return base64.b64decode(self.content) if self.base64_content else self.content.encode("utf-8")
+
+
+def _path(url: str, params: Any = None) -> str:
+    """Path and query of a url, so recordings can be replayed against any server. The query includes the `params` of
+    the call, as `requests` would add them, and is sorted, so the order the parameters are given in does not matter."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    for name, value in params.items() if isinstance(params, dict) else params or []:
+        # requests leaves out the parameters without a value, and sends lists as repeated parameters
+        values = value if isinstance(value, (list, tuple)) else [] if value is None else [value]
+        query.extend((str(name), str(item)) for item in values)
+    return f"{parts.path}?{urlencode(sorted(query))}" if query else parts.path
+
+
+def _decode(content: bytes) -> Tuple[str, bool]:
+    """Text of a body, or its base64 encoding if it is binary, and whether it is base64 encoded"""
+    try:
+        return content.decode("utf-8"), False
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), True
+
+
+def _redact_token(token: Any) -> Any:
+    """Replaces a JWT by an unsigned one keeping only the user id, which is the only claim the client reads"""
+    segments = token.split(".") if isinstance(token, str) else []
+    if len(segments) != _JWT_SEGMENTS:
+        return _REDACTED
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(segments[1] + "=" * (-len(segments[1]) % 4)))
+    except ValueError:
+        return _REDACTED
+    header, payload = (
+        base64.urlsafe_b64encode(json.dumps(part).encode("utf-8")).decode("utf-8").rstrip("=")
+        for part in ({"alg": "none", "typ": "JWT"}, {"user_id": claims.get("user_id")})
+    )
+    return f"{header}.{payload}.{_REDACTED_SIGNATURE}"
+
+
+def redact(value: Any, secret_fields: FrozenSet[str] = SECRET_FIELDS) -> Any:
+    """Returns a copy of a json document with the values of its secret fields replaced. Tokens are replaced by
+    unsigned ones that can still be decoded.
+
+    Args:
+        value (Any): json document
+        secret_fields (FrozenSet[str]): names of the fields to redact
+
+    Returns:
+        Any: redacted document
+    """
+    if isinstance(value, dict):
+        return {
+            key: (
+                (_redact_token(item) if key in _TOKEN_FIELDS else _REDACTED)
+                if key in secret_fields
+                else redact(item, secret_fields=secret_fields)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item, secret_fields=secret_fields) for item in value]
+    return value
+
+
+class RecordingTransport(Transport):
+    """Transport recording every call made through another transport into a gzipped file, with one json exchange per
+    line, to be served back by a `ReplayTransport`:
+
+        with RecordingTransport("traffic.jsonl.gz") as transport:
+            api = API(configuration=configuration, transport=transport)
+            ...
+
+    Request headers are not recorded, and secrets such as api keys, assertions and tokens are redacted from the request
+    and response bodies. Tokens are replaced by unsigned ones, so replayed logins still work.
+
+    Args:
+        path (str): file to write the recording to. It is overwritten.
+        transport (Transport, optional): transport making the calls. Defaults to `RequestsTransport`.
+        secret_fields (FrozenSet[str]): names of the json fields to redact
+    """
+
+    def __init__(self, path: str, transport: Transport | None = None, secret_fields: FrozenSet[str] = SECRET_FIELDS):
+        self._transport = transport or RequestsTransport()
+        self._secret_fields = secret_fields
+        self._file = gzip.open(path, "wt", encoding="utf-8")  # noqa: SIM115
+        self._start = perf_counter()
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        started = perf_counter()
+        response = self._transport.request(method, url, **kwargs)
+        self._record(
+            method=method,
+            url=url,
+            params=kwargs.get("params"),
+            response=response,
+            started=started,
+            duration=perf_counter() - started,
+            request=kwargs.get("json") if kwargs.get("json") is not None else kwargs.get("data"),
+        )
+        return response
+
+    def _redact_text(self, text: str) -> Any:
+        """Json document of a text body with its secrets redacted, or the text itself if it is not json"""
+        try:
+            document = json.loads(text)
+        except ValueError:
+            return text
+        return redact(document, secret_fields=self._secret_fields)
+
+    def _request_body(self, request: Any) -> Tuple[Any, bool]:
+        """Body of a request to record, redacting its secrets whether it was sent as json or as raw data, and whether
+        it is base64 encoded"""
+        if isinstance(request, str):
+            request = request.encode("utf-8")
+        if not isinstance(request, (bytes, bytearray)):
+            return redact(request, secret_fields=self._secret_fields), False
+        text, base64_request = _decode(bytes(request))
+        return (text if base64_request else self._redact_text(text)), base64_request
+
+    def _record(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        response: requests.Response,
+        started: float,
+        duration: float,
+        request: Any,
+    ) -> None:
+        """Writes a call to the recording, redacting its secrets"""
+        text, base64_content = _decode(response.content or b"")
+        if not base64_content:
+            # Bodies are redacted whatever their content type says, and only rewritten if they held secrets
+            with suppress(ValueError):
+                document = json.loads(text)
+                redacted = redact(document, secret_fields=self._secret_fields)
+                if redacted != document:
+                    text = json.dumps(redacted)
+        request, base64_request = self._request_body(request)
+        exchange = RecordedExchange(
+            method=method.lower(),
+            path=_path(url, params=params),
+            status_code=response.status_code,
+            reason=response.reason or "",
+            headers={
+                name: value for name, value in response.headers.items() if name.lower() not in _UNRECORDED_HEADERS
+            },
+            content=text,
+            started=started - self._start,
+            duration=duration,
+            request=request,
+            base64_content=base64_content,
+            base64_request=base64_request,
+        )
+        line = json.dumps(asdict(exchange), separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        """Finishes writing the recording"""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "RecordingTransport":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def read_recording(path: str) -> List[RecordedExchange]:
+    """Reads the exchanges written by a `RecordingTransport`
+
+    Args:
+        path (str): recording file
+
+    Returns:
+        List[RecordedExchange]: recorded exchanges, in the order the calls were made
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as recording:
+        return [RecordedExchange(**json.loads(line)) for line in recording if line.strip()]
+
+
+class ReplayTransport(Transport):
+    """Transport serving the responses of a recording instead of calling the server, to re-run and profile `API`
+    workloads deterministically without network.
+
+    Calls are matched to the recorded ones by method, path and query, and the recorded responses of each of them are
+    served in order. Once they run out, the last one is served again, so polling loops that take more iterations than
+    recorded still finish.
+
+    Args:
+        path (str): file written by a `RecordingTransport`
+        speed (float, optional): if provided, the recorded timings are reproduced, divided by `speed`, so 1 keeps them
+            and 10 compresses them tenfold: each response takes at least its recorded duration, and is not served
+            before the time it was received since the recording started. Responses are served immediately otherwise.
+    """
+
+    def __init__(self, path: str, speed: float | None = None):
+        if speed is not None and speed <= 0:
+            raise ValueError("Replay speed should be positive.")
+        self._speed = speed
+        self._exchanges: Dict[Tuple[str, str], Deque[RecordedExchange]] = {}
+        self._last: Dict[Tuple[str, str], RecordedExchange] = {}
+        for exchange in read_recording(path):
+            self._exchanges.setdefault((exchange.method, exchange.path), deque()).append(exchange)
+        self._lock = threading.Lock()
+        self._start = perf_counter()
+
+    @property
+    def pending(self) -> int:
+        """Number of recorded exchanges not served yet"""
+        with self._lock:
+            return sum(len(exchanges) for exchanges in self._exchanges.values())
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        key = (method.lower(), _path(url, params=kwargs.get("params")))
+        with self._lock:
+            exchanges = self._exchanges.get(key)
+            if exchanges:
+                exchange = self._last[key] = exchanges.popleft()
+            elif key in self._last:
+                exchange = self._last[key]
+            else:
+                raise ConnectionException(f"No recorded response for {method.upper()} {key[1]}.")
+        if self._speed is not None:
+            # Responses served again once the recorded ones run out only reproduce their duration
+            received = (exchange.started + exchange.duration) / self._speed
+            sleep(max(exchange.duration / self._speed, received - (perf_counter() - self._start)))
+        return _build_response(exchange=exchange, method=method, url=url, **kwargs)
+
+
+def _build_response(exchange: RecordedExchange, method: str, url: str, **kwargs) -> requests.Response:
+    """Builds the response of a call from a recorded exchange, as `requests` would"""
+    request = requests.Request(
+        method=method.upper(),
+        url=url,
+        headers=kwargs.get("headers"),
+        json=kwargs.get("json"),
+        data=kwargs.get("data"),
+        params=kwargs.get("params"),
+    ).prepare()
+    body = exchange.body
+    raw = HTTPResponse(
+        body=BytesIO(body),
+        headers={**exchange.headers, "Content-Length": str(len(body))},
+        status=exchange.status_code,
+        reason=exchange.reason,
+        preload_content=False,
+    )
+    response = HTTPAdapter().build_response(request, raw)
+    response.elapsed = timedelta(seconds=exchange.duration)
+    return response
@@ -0,0 +1,168 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Configurable runtime type checking of the public methods.
+
+Runtime type checks are enabled by default. They can be switched off while running with `set_typechecking(False)`,
+which applies to the whole process, in which case each call only pays for a flag lookup. Setting the
+`QIBOCONNECTION_TYPECHECKING` environment variable to `off` before importing qiboconnection removes the checks
+altogether, leaving the undecorated functions, with no overhead at all.
+
+typeguard instruments each function by recompiling it, which is slow, so that is deferred to its first checked call
+instead of being done while importing qiboconnection.
+
+Heavy dependencies such as qibo and numpy are only imported under `TYPE_CHECKING` for the annotations, and typeguard
+skips the annotations naming them. Functions annotated with them are checked against their type hints instead, resolved
+the first time they are checked, which imports those dependencies then."""
+
+import importlib
+import inspect
+import os
+from functools import wraps
+from typing import Any, Callable, Dict, Set, TypeVar, get_type_hints
+
+TYPECHECKING_ENV_VAR = "QIBOCONNECTION_TYPECHECKING"
+_DISABLED_VALUES = {"0", "off", "false", "no"}
+
+_F = TypeVar("_F", bound=Callable)
+
+# Names under which the heavy dependencies are imported for the annotations only, and where to import them from
+_LAZY_ANNOTATION_TYPES = {
+    "npt": "numpy.typing",
+    "Circuit": "qibo.models.circuit:Circuit",
+    "CircuitResult": "qibo.result:CircuitResult",
+}
+
+
+class _TypecheckingState:
+    """Holds whether runtime type checks are enabled"""
+
+    def __init__(self):
+        self.compiled = os.environ.get(TYPECHECKING_ENV_VAR, "on").strip().lower() not in _DISABLED_VALUES
+        self.enabled = self.compiled
+
+
+_state = _TypecheckingState()
+
+
+def typechecking_enabled() -> bool:
+    """Whether runtime type checks are currently performed
+
+    Returns:
+        bool: True if arguments and return values are checked
+    """
+    return _state.enabled
+
+
+def set_typechecking(enabled: bool) -> None:
+    """Enables or disables the runtime type checks of all the decorated functions.
+
+    Args:
+        enabled (bool): whether to check types
+
+    Raises:
+        ValueError: Type checks cannot be enabled when they were removed through the environment variable.
+    """
+    if enabled and not _state.compiled:
+        raise ValueError(
+            f"Type checks cannot be enabled because they were removed by setting {TYPECHECKING_ENV_VAR} before "
+            + "importing qiboconnection."
+        )
+    _state.enabled = enabled
+
+
+def typechecked(func: _F) -> _F:
+    """Drop-in replacement of `typeguard.typechecked` whose checks can be disabled globally.
+
+    Args:
+        func (Callable): function to check
+
+    Returns:
+        Callable: function checking its arguments and return value while type checks are enabled
+    """
+    if not _state.compiled:
+        return func
+    checked_func: Callable | None = None
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal checked_func
+        if not _state.enabled:
+            return func(*args, **kwargs)
+        if checked_func is None:
+            lazy_names = _lazy_annotation_names(func)
+            if lazy_names:
+                checked_func = _check_against_type_hints(func, lazy_names=lazy_names)
+            else:
+                from typeguard import typechecked as typeguard_typechecked  # noqa: PLC0415
+
+                checked_func = typeguard_typechecked(func)
+        return checked_func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _lazy_annotation_names(func: Callable) -> Set[str]:
+    """Names of the lazily imported dependencies used in the annotations of a function, which it cannot resolve"""
+    names: Set[str] = set()
+    for annotation in func.__annotations__.values():
+        if isinstance(annotation, str):
+            names.update(compile(annotation, "<annotation>", "eval").co_names)
+    return {name for name in names if name in _LAZY_ANNOTATION_TYPES and name not in func.__globals__}
+
+
+def _import_lazy_type(name: str) -> Any:
+    """Imports a lazily imported dependency named in annotations. Annotations naming a missing one are not checked."""
+    module_name, _, attribute = _LAZY_ANNOTATION_TYPES[name].partition(":")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return Any
+    return getattr(module, attribute) if attribute else module
+
+
+def _check_against_type_hints(func: Callable, lazy_names: Set[str]) -> Callable:
+    """Builds a version of a function checking its arguments and return value against its type hints, importing the
+    lazily imported dependencies they name."""
+    from typeguard import TypeCheckError, check_type  # noqa: PLC0415
+
+    hints: Dict[str, Any] = get_type_hints(func, localns={name: _import_lazy_type(name) for name in lazy_names})
+    signature = inspect.signature(func)
+
+    def check(description: str, value: Any, expected_type: Any) -> None:
+        try:
+            check_type(value, expected_type)
+        except TypeCheckError as ex:
+            ex.append_path_element(description)
+            raise
+
+    def checked_func(*args, **kwargs):
+        for name, value in signature.bind(*args, **kwargs).arguments.items():
+            if name not in hints:
+                continue
+            kind = signature.parameters[name].kind
+            if kind is inspect.Parameter.VAR_POSITIONAL:
+                for item in value:
+                    check(f'item of argument "{name}"', item, hints[name])
+            elif kind is inspect.Parameter.VAR_KEYWORD:
+                for item in value.values():
+                    check(f'item of argument "{name}"', item, hints[name])
+            else:
+                check(f'argument "{name}"', value, hints[name])
+        result = func(*args, **kwargs)
+        if "return" in hints:
+            check("the return value", result, hints["return"])
+        return result
+
+    return checked_func
@@ -16,8 +16,10 @@
 
 from .algorithm_name import AlgorithmName
 from .algorythm_type import AlgorithmType
+from .circuit_state import CircuitState
 from .device_status import DeviceStatus
 from .device_type import DeviceType
+from .endpoint_class import EndpointClass
 from .grant_type import GrantType
 from .initial_value import InitialValue
 from .job_status import JobStatus
@@ -29,8 +31,10 @@ from .user_scope import UserScope
 __all__ = [
     "AlgorithmName",
     "AlgorithmType",
+    "CircuitState",
     "DeviceStatus",
     "DeviceType",
+    "EndpointClass",
     "GrantType",
     "InitialValue",
     "JobStatus",
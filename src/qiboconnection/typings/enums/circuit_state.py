@@ -0,0 +1,32 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""CircuitState enum"""
+
+from .str_enum import StrEnum
+
+
+class CircuitState(StrEnum):
+    """State of a circuit of the circuit breaker
+
+    Args:
+        enum (str): Accepted values are:
+            * "closed": calls are made
+            * "open": calls fail fast
+            * "half-open": a trial call is made to check whether the server recovered
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
@@ -0,0 +1,31 @@
+# Copyright 2023 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""EndpointClass enum"""
+
+from .str_enum import StrEnum
+
+
+class EndpointClass(StrEnum):
+    """Kind of call made to the remote server, each of them throttled separately
+
+    Args:
+        enum (str): available endpoint classes: 'auth', 'submission', 'polling', 'listing' and 'other'
+    """
+
+    AUTH = "auth"
+    SUBMISSION = "submission"
+    POLLING = "polling"
+    LISTING = "listing"
+    OTHER = "other"
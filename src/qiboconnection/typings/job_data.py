@@ -16,10 +16,9 @@
 
 from inspect import signature
 
-from qibo.models import Circuit  # type: ignore[import-untyped]
-
 from qiboconnection.api_utils import deserialize_job_description, parse_job_response_to_result
 from qiboconnection.typings.responses.job_response import JobResponse
+from qiboconnection.util import is_qibo_circuit
 
 
 class JobData(JobResponse):
@@ -35,7 +34,7 @@ class JobData(JobResponse):
 
         if not isinstance(self.result, (dict, list, str, type(None))):
             raise ValueError("Job result needs to be a dict, a list, a string or a None!")
-        if not isinstance(self.description, (dict, type(None), Circuit, list, str)):
+        if not (isinstance(self.description, (dict, type(None), list, str)) or is_qibo_circuit(self.description)):
             raise ValueError("Job description needs to be a Qibo Circuit, a dict, a list, a str or a None!")
 
     def __repr__(self):
@@ -18,14 +18,18 @@ import base64
 import gzip
 import json
 import logging
+import sys
 from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from functools import lru_cache
 from inspect import signature
 from json.decoder import JSONDecodeError
-from typing import Any, List, Tuple
+from typing import Any, Callable, List, Tuple
 
 import requests
 
 from qiboconnection.errors import custom_raise_for_status
+from qiboconnection.tracing import span
 
 logger = logging.getLogger()
 
@@ -110,33 +114,126 @@ def unzip(zipped_list: List[Tuple[Any, Any]]):
     return tuple(zip(*zipped_list))
 
 
-def compress_any(any_obj, encoding="utf-8") -> dict:
+COMPRESSIONS = ("gzip", "zstd")
+
+
+@lru_cache(maxsize=1)
+def _zstd() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """Compress and decompress functions of zstd, from the standard library if available or from `zstandard`"""
+    try:
+        from compression import zstd  # noqa: PLC0415 # standard library since Python 3.14
+
+        return zstd.compress, zstd.decompress
+    except ImportError:
+        pass
+    try:
+        import zstandard  # noqa: PLC0415
+    except ImportError as ex:
+        raise ImportError(
+            "zstd compression requires zstandard. Install it with `pip install qiboconnection[zstd]`."
+        ) from ex
+    return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    """Compresses bytes with gzip or zstd"""
+    if compression == "gzip":
+        # A fixed mtime keeps the output deterministic, so equal objects always produce the same compressed string.
+        return gzip.compress(data, mtime=0)
+    if compression == "zstd":
+        return _zstd()[0](data)
+    raise ValueError(f"Unknown compression {compression}. Use one of {', '.join(COMPRESSIONS)}.")
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    """Decompresses bytes compressed with gzip or zstd"""
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        return _zstd()[1](data)
+    raise ValueError(f"Unknown compression {compression}. Use one of {', '.join(COMPRESSIONS)}.")
+
+
+def compress_any(any_obj, encoding="utf-8", compression="gzip") -> dict:
     """
     Transforms any json-serializable object into a compressed string.
     :param any_obj: object to compress
     :param encoding: encoding to use for the byte representation
+    :param compression: `gzip`, or `zstd`, which requires the `zstandard` package before Python 3.14
     :return:
     """
 
     encoded_data = json.dumps(any_obj).encode(encoding)
-    compressed_data = base64.b64encode(gzip.compress(encoded_data)).decode()
-    return {"data": compressed_data, "encoding": encoding, "compression": "gzip"}
+    with span("qiboconnection.compress", bytes=len(encoded_data), compression=compression):
+        compressed_data = base64.b64encode(_compress(encoded_data, compression=compression)).decode()
+    return {"data": compressed_data, "encoding": encoding, "compression": compression}
 
 
-def decompress_any(data: str, **kwargs) -> dict:
+def decompress_any(data: str, encoding="utf-8", compression="gzip", **kwargs) -> dict:
     """
     Decompresses a compressed string into its original datatype.
     :param data: compressed data containing a json to extract a dictionary from
+    :param encoding: encoding of the byte representation
+    :param compression: compression used, `gzip` or `zstd`
     :return:
     """
 
     data_bin = base64.urlsafe_b64decode(data)
-    data_decompressed = json.loads(gzip.decompress(data_bin))
+    data_decompressed = json.loads(_decompress(data_bin, compression=compression).decode(encoding))
 
     return data_decompressed
 
 
-def from_kwargs(cls, **kwargs: dict):
+def compressed_envelope(payload: str | None) -> dict | None:
+    """Envelope built by `compress_any` that a payload holds as JSON, if any
+
+    Args:
+        payload (str, optional): payload sent to or received from the server
+
+    Returns:
+        dict | None: envelope, or None if the payload is not compressed, e.g. a base64 string
+    """
+    # base64 never contains braces, so legacy payloads are told apart without trying to parse them
+    if not isinstance(payload, str) or not payload.startswith("{"):
+        return None
+    try:
+        envelope = json.loads(payload)
+    except JSONDecodeError:
+        return None
+    if not isinstance(envelope, dict) or envelope.get("compression") not in COMPRESSIONS or "data" not in envelope:
+        return None
+    return envelope
+
+
+def version_tag(updated_at: Any) -> str | None:
+    """Version of a resource of the server, given by the date it was last updated
+
+    Args:
+        updated_at (Any): date of the last update, as a datetime or as sent by the server
+
+    Returns:
+        str | None: version, or None if the date is not known
+    """
+    if updated_at is None:
+        return None
+    return updated_at.isoformat() if isinstance(updated_at, datetime) else str(updated_at)
+
+
+def is_qibo_circuit(obj: Any) -> bool:
+    """Checks whether an object is a qibo Circuit without importing qibo: if qibo has not been imported, no circuit
+    can exist yet.
+
+    Args:
+        obj (Any): object to check
+
+    Returns:
+        bool: True if the object is a qibo Circuit
+    """
+    circuit_module = sys.modules.get("qibo.models.circuit")
+    return circuit_module is not None and isinstance(obj, circuit_module.Circuit)
+
+
+def from_kwargs(cls, **kwargs: Any):
     """
     Create an instance of the class by extracting attributes from keyword arguments.
 
@@ -153,17 +250,29 @@ def from_kwargs(cls, **kwargs: dict):
         An instance of the class with attributes initialized from the keyword
         arguments.
     """
-    cls_fields = set(signature(cls).parameters)
-    native_args, new_args = {}, {}
+    return _kwargs_builder(cls)(kwargs)
 
-    for name, val in kwargs.items():
-        if name in cls_fields:
-            native_args[name] = val
-        else:
-            new_args[name] = val
 
-    ret = cls(**native_args)
+@lru_cache(maxsize=None)
+def _kwargs_builder(cls) -> Callable[[dict], Any]:
+    """Builds, once per class, the function used by `from_kwargs` to instantiate `cls`. Inspecting the signature of a
+    class is much slower than instantiating it, so it is only done the first time.
 
-    for new_name, new_val in new_args.items():
-        setattr(ret, new_name, new_val)
-    return ret
+    Args:
+        cls: class to instantiate
+
+    Returns:
+        Callable[[dict], Any]: function building an instance of `cls` from a dict of keyword arguments
+    """
+    cls_fields = frozenset(signature(cls).parameters)
+
+    def build(kwargs: dict):
+        if cls_fields.issuperset(kwargs):
+            return cls(**kwargs)
+        ret = cls(**{name: val for name, val in kwargs.items() if name in cls_fields})
+        for new_name, new_val in kwargs.items():
+            if new_name not in cls_fields:
+                setattr(ret, new_name, new_val)
+        return ret
+
+    return build
@@ -0,0 +1,366 @@
+"""In-process fake of the QaaS public api, to benchmark the client without the real service."""
+
+import base64
+import itertools
+import json
+import os
+import random
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from qiboconnection.api import API
+from qiboconnection.json_patch import apply_patch
+from qiboconnection.typings.connection import ConnectionConfiguration
+from qiboconnection.util import (
+    base64_decode,
+    base64url_encode,
+    compress_any,
+    compressed_envelope,
+    decode_jsonified_dict,
+    decompress_any,
+    jsonify_dict_and_base64_encode,
+)
+
+HOST = "127.0.0.1"
+API_PATH = "/api/v1"
+USER_ID = 1
+
+Route = Tuple[str, re.Pattern, Callable[..., Tuple[Any, int]]]
+
+
+def _base64url(payload: dict) -> str:
+    """Encodes a dict the way JWT segments are encoded"""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("utf-8").rstrip("=")
+
+
+def _access_token() -> str:
+    """Unsigned JWT carrying the user id, which is all the client reads from it"""
+    header, payload = _base64url({"alg": "HS256", "typ": "JWT"}), _base64url({"user_id": USER_ID})
+    return f"{header}.{payload}.{_base64url({})}"
+
+
+def _timestamp() -> str:
+    """Timestamp in the format used by the server"""
+    return datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+
+class FakeQaaS:
+    """Fake QaaS server running in a background thread. It implements the authorisation, circuits, jobs, devices,
+    runcards and calibrations endpoints used by `API`, keeping everything in memory.
+
+    Args:
+        latency (float): seconds every request waits before being answered
+        queue_time (float): seconds a job stays pending before it is completed
+        result_size (int): number of floats of the result of every job
+        listing_size (int): number of jobs the job listing returns, besides the submitted ones
+        number_devices (int): number of online devices
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        queue_time: float = 0.0,
+        result_size: int = 1000,
+        listing_size: int = 0,
+        number_devices: int = 1,
+    ):
+        self.latency = latency
+        self.queue_time = queue_time
+        self.devices = {
+            device_id: {
+                "device_id": device_id,
+                "device_name": f"Fake device {device_id}",
+                "device_type": "simulator",
+                "status": "online",
+                "availability": "available",
+                "channel_id": None,
+                "number_pending_jobs": 0,
+                "characteristics": {"type": "simulator"},
+            }
+            for device_id in range(1, number_devices + 1)
+        }
+        self.jobs: Dict[int, dict] = {}
+        self._job_ids = itertools.count(1)
+        self.runcards: Dict[int, dict] = {}
+        self.calibrations: Dict[int, dict] = {}
+        self.requests = 0
+        generator = random.Random(0)
+        self.result = json.dumps(compress_any([generator.random() for _ in range(result_size)]))
+        self._listing = [
+            {
+                "id": -job_id,
+                "user_id": USER_ID,
+                "device_id": 1,
+                "status": "completed",
+                "job_type": "circuit",
+                "number_shots": 1000,
+                "name": "-",
+                "summary": "-",
+                "favourite": False,
+                "created_at": _timestamp(),
+                "updated_at": _timestamp(),
+            }
+            for job_id in range(1, listing_size + 1)
+        ]
+        self._lock = threading.Lock()
+        self._routes = self._build_routes()
+        self._server = ThreadingHTTPServer((HOST, 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base url of the server, to be used as `QUANTUM_SERVICE_URL`"""
+        return f"http://{HOST}:{self._server.server_port}"
+
+    def start(self) -> None:
+        """Starts serving requests in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-qaas", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops serving requests"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeQaaS":
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    @contextmanager
+    def environment(self) -> Iterator[None]:
+        """Points the client to this server while the context is active"""
+        previous_url = os.environ.get("QUANTUM_SERVICE_URL")
+        os.environ["QUANTUM_SERVICE_URL"] = self.url
+        try:
+            yield
+        finally:
+            if previous_url is None:
+                del os.environ["QUANTUM_SERVICE_URL"]
+            else:
+                os.environ["QUANTUM_SERVICE_URL"] = previous_url
+
+    def api(self, **kwargs) -> API:
+        """Builds an `API` logged into this server
+
+        Args:
+            **kwargs: other arguments of `API`
+
+        Returns:
+            API: authenticated api
+        """
+        with self.environment():
+            return API(configuration=ConnectionConfiguration(username="benchmark", api_key="benchmark"), **kwargs)
+
+    # ROUTING
+
+    def _build_routes(self) -> List[Route]:
+        """Method, path pattern and handler of every endpoint"""
+        routes = [
+            ("POST", r"/authorisation-tokens", self._create_token),
+            ("POST", r"/authorisation-tokens/refresh", self._create_token),
+            ("POST", r"/circuits", self._create_job),
+            ("GET", r"/jobs", self._list_jobs),
+            ("GET", r"/jobs/(\d+)", self._get_job),
+            ("DELETE", r"/jobs/(\d+)", self._delete_job),
+            ("GET", r"/devices", self._list_devices),
+            ("GET", r"/devices/(\d+)", self._get_device),
+            ("PUT", r"/devices/(\d+)", self._update_device),
+            ("POST", r"/runcards", self._saver(self.runcards, "runcard_id")),
+            ("GET", r"/runcards", self._lister(self.runcards)),
+            ("GET", r"/runcards/(\d+)", self._getter(self.runcards)),
+            ("PUT", r"/runcards/(\d+)", self._updater(self.runcards)),
+            (
+                "PATCH",
+                r"/runcards/(\d+)",
+                self._patcher(self.runcards, "runcard", decode_jsonified_dict, jsonify_dict_and_base64_encode),
+            ),
+            ("POST", r"/calibrations", self._saver(self.calibrations, "calibration_id")),
+            ("GET", r"/calibrations", self._lister(self.calibrations)),
+            ("GET", r"/calibrations/(\d+)", self._getter(self.calibrations)),
+            ("PUT", r"/calibrations/(\d+)", self._updater(self.calibrations)),
+            (
+                "PATCH",
+                r"/calibrations/(\d+)",
+                self._patcher(self.calibrations, "calibration", base64_decode, base64url_encode),
+            ),
+        ]
+        return [(method, re.compile(f"{API_PATH}{pattern}"), handler) for method, pattern, handler in routes] + [
+            ("GET", re.compile(r"/status"), lambda _: ("OK", 200))
+        ]
+
+    def _handler_class(self) -> type:
+        """Request handler bound to this server"""
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Dispatches the requests to the handlers of the fake server"""
+
+            def log_message(self, *_) -> None:
+                pass
+
+            def _dispatch(self) -> None:
+                if fake.latency:
+                    sleep(fake.latency)
+                with fake._lock:
+                    fake.requests += 1
+                path = self.path.split("?")[0]
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                for method, pattern, handler in fake._routes:
+                    match = pattern.fullmatch(path)
+                    if method == self.command and match:
+                        response, status = handler(body, *[int(group) for group in match.groups()])
+                        break
+                else:
+                    response, status = {"title": "Not Found", "detail": f"{self.command} {path}"}, 404
+                content = b"" if status == 204 else json.dumps(response).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+        return Handler
+
+    def _page(self, items: List[dict], path: str) -> dict:
+        """Wraps items in a single page, as the paginated endpoints do"""
+        return {
+            "items": items,
+            "total": len(items),
+            "per_page": len(items),
+            "self": f"{self.url}{API_PATH}{path}?page=1",
+            "links": {"next": f"{self.url}{API_PATH}{path}?page=None"},
+        }
+
+    # HANDLERS
+
+    @staticmethod
+    def _create_token(_) -> Tuple[dict, int]:
+        return {
+            "accessToken": _access_token(),
+            "refreshToken": _access_token(),
+            "tokenType": "bearer",
+            "expiresIn": 3600,
+            "issuedAt": _timestamp(),
+        }, 200
+
+    def _create_job(self, body: dict) -> Tuple[dict, int]:
+        with self._lock:
+            job_id = next(self._job_ids)
+            self.jobs[job_id] = {**body, "job_id": job_id, "submitted_at": monotonic()}
+        return {"job_id": job_id}, 201
+
+    def _job_response(self, job: dict) -> dict:
+        completed = monotonic() - job["submitted_at"] >= self.queue_time
+        return {
+            "job_id": job["job_id"],
+            "user_id": job["user_id"],
+            "device_id": job["device_id"],
+            "status": "completed" if completed else "pending",
+            "job_type": job["job_type"],
+            "queue_position": 0,
+            "number_shots": job["number_shots"],
+            "description": job["description"],
+            "result": self.result if completed else None,
+            "name": job["name"],
+            "summary": job["summary"],
+        }
+
+    def _get_job(self, _, job_id: int) -> Tuple[dict, int]:
+        job = self.jobs.get(job_id)
+        if job is None:
+            return {"title": "Bad Request", "detail": f"Requested job with 'job_id': {job_id}, does not exist."}, 400
+        return self._job_response(job), 200
+
+    def _delete_job(self, _, job_id: int) -> Tuple[str, int]:
+        with self._lock:
+            self.jobs.pop(job_id, None)
+        return "", 204
+
+    def _list_jobs(self, _) -> Tuple[dict, int]:
+        submitted = [
+            {
+                key: value
+                for key, value in self._job_response(job).items()
+                if key not in {"description", "result", "queue_position"}
+            }
+            | {"id": job["job_id"]}
+            for job in list(self.jobs.values())
+        ]
+        return self._page(self._listing + submitted, "/jobs"), 200
+
+    def _list_devices(self, _) -> Tuple[dict, int]:
+        return self._page(list(self.devices.values()), "/devices"), 200
+
+    def _get_device(self, _, device_id: int) -> Tuple[dict, int]:
+        return self.devices[device_id], 200
+
+    def _update_device(self, body: dict, device_id: int) -> Tuple[dict, int]:
+        self.devices[device_id].update(body)
+        return self.devices[device_id], 200
+
+    def _saver(self, store: Dict[int, dict], id_field: str) -> Callable[[dict], Tuple[dict, int]]:
+        def save(body: dict) -> Tuple[dict, int]:
+            with self._lock:
+                item_id = len(store) + 1
+                store[item_id] = {**body, id_field: item_id, "created_at": _timestamp(), "updated_at": _timestamp()}
+            return store[item_id], 201
+
+        return save
+
+    def _lister(self, store: Dict[int, dict]) -> Callable[[Any], Tuple[dict, int]]:
+        return lambda _: (self._page(list(store.values()), ""), 200)
+
+    @staticmethod
+    def _getter(store: Dict[int, dict]) -> Callable[[Any, int], Tuple[dict, int]]:
+        return lambda _, item_id: (store[item_id], 200)
+
+    def _updater(self, store: Dict[int, dict]) -> Callable[[dict, int], Tuple[dict, int]]:
+        def update(body: dict, item_id: int) -> Tuple[dict, int]:
+            with self._lock:
+                store[item_id] = {**store[item_id], **body, "updated_at": _timestamp()}
+            return store[item_id], 200
+
+        return update
+
+    def _patcher(
+        self,
+        store: Dict[int, dict],
+        content_field: str,
+        decode: Callable[[str], Any],
+        encode: Callable[[Any], str],
+    ) -> Callable[[List[dict], int], Tuple[dict, int]]:
+        """Applies JSON patches over the stored items with their content decoded, keeping its compression, if any"""
+
+        def patch(body: List[dict], item_id: int) -> Tuple[dict, int]:
+            with self._lock:
+                stored = store[item_id]
+                envelope = compressed_envelope(stored[content_field])
+                content = decompress_any(**envelope) if envelope else decode(stored[content_field])
+                try:
+                    patched = apply_patch({**stored, content_field: content}, body)
+                except ValueError as ex:
+                    return {"title": "Unprocessable Entity", "detail": str(ex)}, 422
+                content = patched[content_field]
+                patched[content_field] = (
+                    json.dumps(compress_any(content, compression=envelope["compression"]))
+                    if envelope
+                    else encode(content)
+                )
+                store[item_id] = {**patched, "updated_at": _timestamp()}
+            return store[item_id], 200
+
+        return patch
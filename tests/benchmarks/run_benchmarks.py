@@ -0,0 +1,229 @@
+"""Benchmarks of the client against the fake QaaS server.
+
+Run them with `python -m tests.benchmarks.run_benchmarks --output benchmarks.json`. Results are printed and, if an
+output file is given, written as JSON so they can be compared between versions."""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from inspect import signature
+from time import perf_counter
+from typing import Callable, List
+
+from qiboconnection import __version__
+from qiboconnection.api import API
+from qiboconnection.models.devices import create_device
+from qiboconnection.models.job_result import JobResult
+from qiboconnection.typechecking import set_typechecking, typechecking_enabled
+from qiboconnection.typings.responses import JobListingItemResponse
+from qiboconnection.util import from_kwargs
+
+from .fake_qaas import FakeQaaS
+
+QPROGRAM = json.dumps({"operations": [{"type": "play", "waveform": list(range(100))}]})
+DEVICE = {"id": 1, "name": "dev", "status": "online", "number_pending_jobs": 3}
+LISTING_ITEM = {"status": "completed", "user_id": 1, "device_id": 9, "job_type": "circuit", "number_shots": 10, "id": 3}
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of a single benchmark"""
+
+    name: str
+    operations: int
+    seconds: float
+
+    @property
+    def per_second(self) -> float:
+        """Operations per second"""
+        return self.operations / self.seconds if self.seconds else float("inf")
+
+    def to_dict(self) -> dict:
+        """Convert into dict, including the throughput"""
+        return {**asdict(self), "per_second": self.per_second}
+
+
+def _measure(name: str, operations: int, function: Callable[[], object]) -> BenchmarkResult:
+    """Times a function performing a number of operations"""
+    start = perf_counter()
+    function()
+    return BenchmarkResult(name=name, operations=operations, seconds=perf_counter() - start)
+
+
+def benchmark_submission(api: API, jobs: int) -> BenchmarkResult:
+    """Submits jobs one after the other"""
+    return _measure(
+        "submission",
+        jobs,
+        lambda: [api.execute(qprogram=QPROGRAM, device_id=1, nshots=1000) for _ in range(jobs)],
+    )
+
+
+def benchmark_polling(api: API, job_ids: List[int], rounds: int) -> BenchmarkResult:
+    """Retrieves the status of the given jobs, which are still queued, as `execute_and_return_results` does"""
+
+    def poll():
+        for _ in range(rounds):
+            for job_id in job_ids:
+                api.get_job(job_id)
+
+    return _measure("polling", rounds * len(job_ids), poll)
+
+
+def benchmark_listing(api: API, rounds: int, compact: bool = False) -> BenchmarkResult:
+    """Lists the jobs of the user"""
+    return _measure(
+        "listing_compact" if compact else "listing",
+        rounds,
+        lambda: [api.list_jobs(compact=compact) for _ in range(rounds)],
+    )
+
+
+def benchmark_decoding(fake: FakeQaaS, rounds: int) -> BenchmarkResult:
+    """Decodes the result the fake server returns for every job, without any request involved"""
+    http_response = fake.result
+    return _measure(
+        "result_decoding",
+        rounds,
+        lambda: [JobResult(job_id=1, http_response=http_response, job_type="qprogram") for _ in range(rounds)],
+    )
+
+
+def _from_kwargs_inspecting_signature(cls, **kwargs):
+    """`from_kwargs` as it was before caching, inspecting the signature of the class on every call"""
+    cls_fields = set(signature(cls).parameters)
+    ret = cls(**{name: val for name, val in kwargs.items() if name in cls_fields})
+    for name, val in kwargs.items():
+        if name not in cls_fields:
+            setattr(ret, name, val)
+    return ret
+
+
+def benchmark_from_kwargs(objects: int) -> List[BenchmarkResult]:
+    """Builds listing items from their fields, as listings do for every item, inspecting the class on every call as
+    before and with `from_kwargs`"""
+    return [
+        _measure(
+            name,
+            objects,
+            lambda: [builder(JobListingItemResponse, **LISTING_ITEM, name="job") for _ in range(objects)],
+        )
+        for name, builder in (
+            ("from_kwargs_uncached", _from_kwargs_inspecting_signature),
+            ("from_kwargs", from_kwargs),
+        )
+    ]
+
+
+def benchmark_typechecking(calls: int) -> List[BenchmarkResult]:
+    """Builds devices, as polling does for every device retrieved, with the runtime type checks of their arguments
+    enabled and disabled. The difference is the per-call cost of the checks."""
+    enabled = typechecking_enabled()
+    results = []
+    try:
+        for checked in (True, False):
+            set_typechecking(checked)
+            results.append(
+                _measure(
+                    "typechecking_enabled" if checked else "typechecking_disabled",
+                    calls,
+                    lambda: [create_device(device_input=DEVICE) for _ in range(calls)],
+                )
+            )
+    finally:
+        set_typechecking(enabled)
+    return results
+
+
+def run_benchmarks(
+    jobs: int = 100,
+    rounds: int = 10,
+    latency: float = 0.0,
+    result_size: int = 100_000,
+    listing_size: int = 10_000,
+    calls: int = 10_000,
+) -> dict:
+    """Runs all the benchmarks against a fresh fake server.
+
+    Args:
+        jobs (int): number of jobs submitted and polled
+        rounds (int): number of times the listing, polling and decoding benchmarks are repeated
+        latency (float): seconds the fake server waits before answering every request
+        result_size (int): number of floats of the result of every job
+        listing_size (int): number of jobs listed, besides the submitted ones, and of listing items built from their
+            fields
+        calls (int): number of calls of the type checking benchmark
+
+    Returns:
+        dict: parameters, environment and outcome of every benchmark
+    """
+    parameters = {
+        "jobs": jobs,
+        "rounds": rounds,
+        "latency": latency,
+        "result_size": result_size,
+        "listing_size": listing_size,
+        "calls": calls,
+    }
+    with FakeQaaS(latency=latency, queue_time=float("inf"), result_size=result_size, listing_size=listing_size) as fake:
+        api = fake.api()
+        results = [benchmark_submission(api, jobs=jobs)]
+        job_ids = [job.id for job in api.jobs]
+        results += [
+            benchmark_polling(api, job_ids=job_ids, rounds=rounds),
+            benchmark_listing(api, rounds=rounds),
+            benchmark_listing(api, rounds=rounds, compact=True),
+            benchmark_decoding(fake, rounds=rounds),
+            *benchmark_from_kwargs(objects=listing_size),
+            *benchmark_typechecking(calls=calls),
+        ]
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "qiboconnection": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "parameters": parameters,
+        "results": {result.name: result.to_dict() for result in results},
+    }
+
+
+def main(argv: List[str] | None = None) -> dict:
+    """Runs the benchmarks from the command line"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100, help="number of jobs submitted and polled")
+    parser.add_argument("--rounds", type=int, default=10, help="repetitions of the polling, listing and decoding")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the server waits before answering")
+    parser.add_argument("--result-size", type=int, default=100_000, help="number of floats of every result")
+    parser.add_argument("--listing-size", type=int, default=10_000, help="number of jobs in the listing")
+    parser.add_argument("--calls", type=int, default=10_000, help="calls of the type checking benchmark")
+    parser.add_argument("--output", help="JSON file the results are written to")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        jobs=args.jobs,
+        rounds=args.rounds,
+        latency=args.latency,
+        result_size=args.result_size,
+        listing_size=args.listing_size,
+        calls=args.calls,
+    )
+    for name, result in report["results"].items():
+        print(  # noqa: T201
+            f"{name:>20}: {result['operations']:>6} operations in {result['seconds']:8.3f}s "
+            + f"({result['per_second']:10.1f}/s)"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    logging.getLogger("qiboconnection").setLevel(logging.ERROR)
+    main(sys.argv[1:])
@@ -0,0 +1,87 @@
+"""Smoke tests of the benchmark suite, run with tiny sizes"""
+
+import json
+from unittest.mock import patch
+
+from .fake_qaas import FakeQaaS
+from .run_benchmarks import main
+
+BENCHMARKS = (
+    "submission",
+    "polling",
+    "listing",
+    "listing_compact",
+    "result_decoding",
+    "from_kwargs_uncached",
+    "from_kwargs",
+    "typechecking_enabled",
+    "typechecking_disabled",
+)
+
+
+def test_fake_server_serves_the_api():
+    """Test the API can submit, retrieve and list jobs, devices and runcards from the fake server."""
+    with FakeQaaS(result_size=10, listing_size=5, number_devices=2) as fake:
+        api = fake.api()
+        job_id = api.execute(qprogram="{}", device_id=1)
+        assert len(api.get_job(job_id).result) == 10
+        assert len(api.list_jobs().items) == 6
+        assert len(api.list_devices()) == 2
+        api.save_runcard(
+            name="runcard", description="-", runcard_dict={}, device_id=1, user_id=1, qililab_version="0.0.0"
+        )
+        assert len(api.list_runcards()) == 1
+
+
+def test_fake_server_does_not_reuse_job_ids():
+    """Test the fake server gives new jobs a new id even after deleting the previous ones."""
+    with FakeQaaS(result_size=10) as fake:
+        api = fake.api()
+        first_id = api.execute(qprogram="{}", device_id=1)
+        api.delete_job(first_id)
+        assert api.execute(qprogram="{}", device_id=1) != first_id
+
+
+def test_fake_server_updates_runcards():
+    """Test the fake server applies the changes of a runcard sent as a JSON patch."""
+    with FakeQaaS() as fake:
+        api = fake.api()
+        runcard_id = api.save_runcard(
+            name="runcard",
+            description="-",
+            runcard_dict={"qubits": [{"frequency": 5e9}]},
+            device_id=1,
+            user_id=1,
+            qililab_version="0.0.0",
+        )
+        runcard = api.get_runcard(runcard_id=runcard_id)
+        runcard.runcard["qubits"][0]["frequency"] = 6e9
+        with patch.object(api._connection, "send_put_auth_remote_api_call") as mocked_put:
+            api.update_runcard(runcard=runcard)
+        mocked_put.assert_not_called()
+        assert api.get_runcard(runcard_id=runcard_id).runcard == {"qubits": [{"frequency": 6e9}]}
+
+
+def test_benchmarks_write_results(tmp_path):
+    """Test the benchmarks run and write a machine-readable report."""
+    output = tmp_path / "benchmarks.json"
+    main(
+        [
+            "--jobs",
+            "3",
+            "--rounds",
+            "2",
+            "--result-size",
+            "10",
+            "--listing-size",
+            "10",
+            "--calls",
+            "10",
+            "--output",
+            str(output),
+        ]
+    )
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert set(report["results"]) == set(BENCHMARKS)
+    assert report["results"]["polling"]["operations"] == 6
+    assert all(result["per_second"] > 0 for result in report["results"].values())
@@ -4,6 +4,7 @@ import base64
 import gzip
 import json
 from dataclasses import asdict
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
@@ -11,17 +12,30 @@ import pytest
 import responses
 from qibo import gates
 from qibo.models import Circuit
+from requests import HTTPError
 
 from qiboconnection.api import API
 from qiboconnection.connection import ConnectionConfiguration
-from qiboconnection.errors import ConnectionException, RemoteExecutionException
+from qiboconnection.deduplication import SubmissionIndex
+from qiboconnection.errors import (
+    ConnectionException,
+    PartialSubmissionException,
+    RemoteExecutionException,
+    UpdateConflictException,
+)
 from qiboconnection.models.calibration import Calibration
 from qiboconnection.models.devices.devices import Devices
 from qiboconnection.models.devices.util import create_device
+from qiboconnection.models.job import Job
+from qiboconnection.models.job_history import JobHistory, JobRecord
 from qiboconnection.models.job_listing import JobListing
 from qiboconnection.models.runcard import Runcard
+from qiboconnection.serialization import description_cache
+from qiboconnection.tracing import RecordingTracer, set_tracer
+from qiboconnection.typings.compact import CompactModel
 from qiboconnection.typings.enums import JobStatus, JobType
 from qiboconnection.typings.job_data import JobData
+from qiboconnection.typings.responses import CalibrationResponse, RuncardResponse
 from qiboconnection.typings.vqa import VQA
 from qiboconnection.util import compress_any
 
@@ -152,6 +166,19 @@ def test_list_devices_ise(mocked_web_call: MagicMock, mocked_api: API):
     mocked_web_call.assert_called_with(self=mocked_api._connection, path=mocked_api._DEVICES_CALL_PATH)
 
 
+@patch("qiboconnection.connection.Connection.send_get_auth_remote_api_call_all_pages", autospec=True)
+def test_watch_devices(mocked_web_call: MagicMock, mocked_api: API):
+    """Test the device watcher polls the device listing"""
+    mocked_web_call.return_value = web_responses.devices.retrieve_many_response
+
+    watcher = mocked_api.watch_devices(start=False)
+    watcher.poll()
+
+    assert not watcher.running
+    mocked_web_call.assert_called_with(self=mocked_api._connection, path=mocked_api._DEVICES_CALL_PATH)
+    assert len(watcher.devices) == len(mocked_api.list_devices())
+
+
 @patch("qiboconnection.connection.Connection.send_get_auth_remote_api_call", autospec=True)
 def test_select_device_id(mocked_web_call: MagicMock, mocked_api: API):
     """Test list devices function"""
@@ -217,6 +244,19 @@ def test_list_jobs(mocked_web_call: MagicMock, favourites: bool, mocked_api: API
     assert isinstance(jobs_list.dataframe, pd.DataFrame)
 
 
+@patch("qiboconnection.connection.Connection.send_get_auth_remote_api_call_all_pages", autospec=True)
+def test_list_jobs_compact(mocked_web_call: MagicMock, mocked_api: API):
+    """Tests API.list_jobs() method building compact items"""
+    mocked_web_call.return_value = web_responses.job_response.retrieve_job_listing_response
+
+    jobs_list = mocked_api.list_jobs(compact=True)
+    regular_jobs_list = mocked_api.list_jobs()
+
+    assert all(isinstance(item, CompactModel) for item in jobs_list.items)
+    assert sorted(jobs_list.dataframe.columns) == sorted(regular_jobs_list.dataframe.columns)
+    assert len(jobs_list.dataframe) == len(regular_jobs_list.dataframe)
+
+
 @pytest.mark.parametrize(
     "web_job_response",
     [JobResponse.retrieve_job_response_1, JobResponse.retrieve_job_response_2, JobResponse.retrieve_job_response_3],
@@ -228,7 +268,11 @@ def test_get_job(mocked_web_call: MagicMock, mocked_api: API, web_job_response:
 
     job_data = mocked_api.get_job(job_id=1)
 
-    mocked_web_call.assert_called_with(self=mocked_api._connection, path=f"{mocked_api._JOBS_CALL_PATH}/1")
+    mocked_web_call.assert_called_with(
+        self=mocked_api._connection,
+        path=f"{mocked_api._JOBS_CALL_PATH}/1",
+        timeout=mocked_api._connection.timeouts.download,
+    )
     assert isinstance(job_data, JobData)
 
 
@@ -244,7 +288,11 @@ def test_get_job_exception(mocked_api_call: MagicMock, mocked_api: API):
         mocked_api.get_result(job_id=0)
 
     # Assert that the mocked function was called with correct arguments
-    mocked_api_call.assert_called_with(self=mocked_api._connection, path=f"{mocked_api._JOBS_CALL_PATH}/{0}")
+    mocked_api_call.assert_called_with(
+        self=mocked_api._connection,
+        path=f"{mocked_api._JOBS_CALL_PATH}/{0}",
+        timeout=mocked_api._connection.timeouts.download,
+    )
 
 
 @patch("qiboconnection.connection.Connection.send_post_auth_remote_api_call", autospec=True)
@@ -414,6 +462,104 @@ def test_update_runcard(mocked_web_call: MagicMock, mocked_api: API):
     assert isinstance(updated_runcard, Runcard)
 
 
+def _retrieved_runcard() -> Runcard:
+    """Builds a runcard as retrieved from the server for editing"""
+    return Runcard.from_response(
+        response=RuncardResponse.from_kwargs(**web_responses.runcards.retrieve_response[0]), track_changes=True
+    )
+
+
+@patch("qiboconnection.connection.Connection.send_put_auth_remote_api_call", autospec=True)
+@patch("qiboconnection.connection.Connection.send_patch_auth_remote_api_call", autospec=True)
+def test_update_runcard_sends_only_the_changes(
+    mocked_patch_call: MagicMock, mocked_put_call: MagicMock, mocked_api: API
+):
+    """Tests API.update_runcard() sends the changes of a retrieved runcard as a JSON patch, and keeps track of them."""
+    mocked_patch_call.return_value = web_responses.runcards.update_response
+    runcard = _retrieved_runcard()
+    runcard.description = "tuned"
+
+    updated_runcard = mocked_api.update_runcard(runcard=runcard)
+
+    mocked_put_call.assert_not_called()
+    mocked_patch_call.assert_called_once_with(
+        mocked_api._connection,
+        path=f"{mocked_api._RUNCARDS_CALL_PATH}/1",
+        data=[{"op": "replace", "path": "/description", "value": "tuned"}],
+        version="Fri, 16 Dec 2022 18:40:24 GMT",
+    )
+    assert isinstance(updated_runcard, Runcard)
+    assert runcard.server_version == updated_runcard.server_version
+
+
+@patch("qiboconnection.connection.Connection.send_put_auth_remote_api_call", autospec=True)
+@patch("qiboconnection.connection.Connection.send_patch_auth_remote_api_call", autospec=True)
+def test_list_runcards_do_not_track_changes(mocked_patch_call: MagicMock, mocked_put_call: MagicMock, mocked_api: API):
+    """Tests runcards not retrieved for editing are updated whole."""
+    mocked_put_call.return_value = web_responses.runcards.update_response
+    runcard = Runcard.from_response(response=RuncardResponse.from_kwargs(**web_responses.runcards.retrieve_response[0]))
+    runcard.description = "tuned"
+
+    mocked_api.update_runcard(runcard=runcard)
+
+    mocked_patch_call.assert_not_called()
+    mocked_put_call.assert_called_once()
+
+
+@patch("qiboconnection.connection.Connection.send_patch_auth_remote_api_call", autospec=True)
+def test_update_runcard_conflict(mocked_patch_call: MagicMock, mocked_api: API):
+    """Tests API.update_runcard() raises when the runcard was modified in the server since it was retrieved."""
+    mocked_patch_call.side_effect = HTTPError(response=MagicMock(status_code=412))
+    runcard = _retrieved_runcard()
+    runcard.description = "tuned"
+
+    with pytest.raises(UpdateConflictException):
+        mocked_api.update_runcard(runcard=runcard)
+
+
+@patch("qiboconnection.connection.Connection.send_put_auth_remote_api_call", autospec=True)
+@patch("qiboconnection.connection.Connection.send_patch_auth_remote_api_call", autospec=True)
+def test_update_runcard_with_paths_not_accepted_is_put(
+    mocked_patch_call: MagicMock, mocked_put_call: MagicMock, mocked_api: API
+):
+    """Tests API.update_runcard() sends the whole runcard when the server does not accept the paths of the changes,
+    and keeps patching afterwards."""
+    mocked_patch_call.side_effect = HTTPError(response=MagicMock(status_code=422))
+    mocked_put_call.return_value = web_responses.runcards.update_response
+    runcard = _retrieved_runcard()
+    runcard.runcard["name"] = "tuned"
+
+    mocked_api.update_runcard(runcard=runcard)
+
+    mocked_patch_call.assert_called_once()
+    assert mocked_patch_call.call_args.kwargs["data"] == [{"op": "add", "path": "/runcard/name", "value": "tuned"}]
+    mocked_put_call.assert_called_once()
+    assert mocked_api._partial_updates
+
+
+@patch("qiboconnection.connection.Connection.send_put_auth_remote_api_call", autospec=True)
+@patch("qiboconnection.connection.Connection.send_patch_auth_remote_api_call", autospec=True)
+def test_update_calibration_falls_back_to_put(
+    mocked_patch_call: MagicMock, mocked_put_call: MagicMock, mocked_api: API
+):
+    """Tests API.update_calibration() sends the whole calibration when the server does not support patches."""
+    mocked_patch_call.side_effect = HTTPError(response=MagicMock(status_code=405))
+    mocked_put_call.return_value = web_responses.calibrations.update_response
+    calibration = Calibration.from_response(
+        response=CalibrationResponse.from_kwargs(**web_responses.calibrations.retrieve_response[0]), track_changes=True
+    )
+    calibration.description = "tuned"
+
+    try:
+        mocked_api.update_calibration(calibration=calibration)
+        mocked_api.update_calibration(calibration=calibration)
+    finally:
+        mocked_api._partial_updates = True
+
+    assert mocked_patch_call.call_count == 1
+    assert mocked_put_call.call_count == 2
+
+
 @patch("qiboconnection.connection.Connection.send_put_auth_remote_api_call", autospec=True)
 def test_update_runcard_with_no_id(mocked_web_call: MagicMock, mocked_api: API):
     """Tests API.update_runcard() method"""
@@ -504,7 +650,11 @@ def test_get_result_exception(mocked_api_call: MagicMock, mocked_api: API):
         mocked_api.get_result(job_id=0)
 
     # Assert that the mocked function was called with correct arguments
-    mocked_api_call.assert_called_with(self=mocked_api._connection, path=f"{mocked_api._JOBS_CALL_PATH}/{0}")
+    mocked_api_call.assert_called_with(
+        self=mocked_api._connection,
+        path=f"{mocked_api._JOBS_CALL_PATH}/{0}",
+        timeout=mocked_api._connection.timeouts.download,
+    )
 
 
 @patch("qiboconnection.connection.Connection.send_get_auth_remote_api_call", autospec=True)
@@ -519,7 +669,11 @@ def test_get_results_exception(mocked_api_call: MagicMock, mocked_api: API):
         mocked_api.get_results(job_ids=[0, -1])
 
     # Assert that the mocked function was called with correct arguments
-    mocked_api_call.assert_called_with(self=mocked_api._connection, path=f"{mocked_api._JOBS_CALL_PATH}/{0}")
+    mocked_api_call.assert_called_with(
+        self=mocked_api._connection,
+        path=f"{mocked_api._JOBS_CALL_PATH}/{0}",
+        timeout=mocked_api._connection.timeouts.download,
+    )
 
 
 @patch("qiboconnection.connection.Connection.send_post_auth_remote_api_call", autospec=True)
@@ -830,6 +984,96 @@ def test_cancel_job_exception(mocked_api_call: MagicMock, mocked_api: API):
     )
 
 
+@patch("qiboconnection.connection.Connection.send_put_auth_remote_api_call", autospec=True)
+def test_cancel_jobs_in_bulk(mocked_api_call: MagicMock, mocked_api: API):
+    """Tests API.cancel_jobs() cancels every job with a single call, returning the errors the server answers with."""
+    mocked_api_call.return_value = ({"errors": {"2": "Job is already running."}}, 200)
+
+    outcomes = mocked_api.cancel_jobs(job_ids=[1, 2, 3, 1])
+
+    mocked_api_call.assert_called_once_with(
+        mocked_api._connection, path=f"{mocked_api._JOBS_CALL_PATH}/cancel", data={"job_ids": [1, 2, 3]}
+    )
+    assert outcomes[1] is None
+    assert outcomes[3] is None
+    assert isinstance(outcomes[2], RemoteExecutionException)
+
+
+@patch("qiboconnection.connection.Connection.send_put_auth_remote_api_call", autospec=True)
+def test_cancel_jobs(mocked_api_call: MagicMock, mocked_api: API):
+    """Tests API.cancel_jobs() cancels the jobs one by one when the server has no bulk endpoint, returning the outcome
+    of every job instead of stopping at the first error."""
+
+    def cancel(_, path, data):
+        if "job_ids" in data:
+            raise HTTPError(response=MagicMock(status_code=404))
+        if data["job_id"] == 2:
+            return web_responses.job_response.cancel_job_response_ise
+        return web_responses.job_response.cancel_job_response
+
+    mocked_api_call.side_effect = cancel
+    try:
+        outcomes = mocked_api.cancel_jobs(job_ids=[1, 2, 3, 1], max_workers=2)
+        assert not mocked_api._bulk_job_calls
+        assert mocked_api.cancel_jobs(job_ids=[4]) == {4: None}
+    finally:
+        mocked_api._bulk_job_calls = True
+
+    assert list(outcomes) == [1, 2, 3]
+    assert outcomes[1] is None
+    assert outcomes[3] is None
+    assert isinstance(outcomes[2], RemoteExecutionException)
+    assert mocked_api_call.call_count == 5
+    with pytest.raises(ValueError):
+        mocked_api.cancel_jobs(job_ids=[1], max_workers=0)
+
+
+@patch("qiboconnection.connection.Connection.send_delete_auth_remote_api_call", autospec=True)
+@patch("qiboconnection.connection.Connection.send_post_auth_remote_api_call", autospec=True)
+def test_delete_jobs(mocked_bulk_call: MagicMock, mocked_api_call: MagicMock, mocked_api: API):
+    """Tests API.delete_jobs() deletes every job, with a single call or one by one if the server has no bulk
+    endpoint."""
+    mocked_bulk_call.return_value = (None, 204)
+
+    assert mocked_api.delete_jobs(job_ids=list(range(20))) == dict.fromkeys(range(20))
+    mocked_bulk_call.assert_called_once_with(
+        mocked_api._connection, path=f"{mocked_api._JOBS_CALL_PATH}/delete", data={"job_ids": list(range(20))}
+    )
+    mocked_api_call.assert_not_called()
+
+    mocked_bulk_call.side_effect = HTTPError(response=MagicMock(status_code=405))
+    mocked_api_call.return_value = web_responses.job_response.delete_job_response
+    try:
+        assert mocked_api.delete_jobs(job_ids=list(range(20))) == dict.fromkeys(range(20))
+    finally:
+        mocked_api._bulk_job_calls = True
+    assert sorted(call.kwargs["path"] for call in mocked_api_call.call_args_list) == sorted(
+        f"{mocked_api._JOBS_CALL_PATH}/{job_id}" for job_id in range(20)
+    )
+    assert mocked_api.delete_jobs(job_ids=[]) == {}
+
+
+def test_cancel_all(mocked_api: API):
+    """Tests API.cancel_all() cancels the waiting jobs of the user that pass the filter."""
+    user_id = mocked_api.user_id
+    jobs = [
+        SimpleNamespace(id=1, user_id=user_id, device_id=9, status=JobStatus.PENDING),
+        SimpleNamespace(id=2, user_id=user_id, device_id=9, status=JobStatus.QUEUED),
+        SimpleNamespace(id=3, user_id=user_id, device_id=7, status=JobStatus.QUEUED),
+        SimpleNamespace(id=4, user_id=user_id, device_id=9, status=JobStatus.RUNNING),
+        SimpleNamespace(id=5, user_id=user_id + 1, device_id=9, status=JobStatus.QUEUED),
+    ]
+    with (
+        patch.object(mocked_api, "list_jobs", return_value=MagicMock(items=jobs)),
+        patch.object(mocked_api, "_run_in_bulk", return_value=None),
+        patch.object(mocked_api, "cancel_job") as mocked_cancel_job,
+    ):
+        outcomes = mocked_api.cancel_all(job_filter=lambda job: job.device_id == 9)
+
+    assert outcomes == {1: None, 2: None}
+    assert sorted(call.args[0] for call in mocked_cancel_job.call_args_list) == [1, 2]
+
+
 class TestExecute:
     """Unit tests for the `API.execute` method."""
 
@@ -932,7 +1176,7 @@ class TestExecute:
 
         assert job_ids == [0]
         assert len(self.r_mock.calls) == 2
-        body = json.loads(self.r_mock.calls[1].request.body.decode())
+        body = json.loads(self.r_mock.calls[1].request.body)
         assert body["device_id"] == 9
         assert body["number_shots"] == 1000
         assert body["job_type"] == "circuit"
@@ -960,7 +1204,7 @@ class TestExecute:
 
         assert job_ids == 0
         assert len(self.r_mock.calls) == 2
-        body = json.loads(self.r_mock.calls[1].request.body.decode())
+        body = json.loads(self.r_mock.calls[1].request.body)
         assert body["device_id"] == 9
         assert body["number_shots"] == 1000
         assert body["job_type"] == "circuit"
@@ -976,7 +1220,7 @@ class TestExecute:
 
         assert job_ids == [0]
         assert len(self.r_mock.calls) == 2
-        body = json.loads(self.r_mock.calls[1].request.body.decode())
+        body = json.loads(self.r_mock.calls[1].request.body)
         assert body["device_id"] == 9
         assert body["number_shots"] == 1000
         assert body["job_type"] == "circuit"
@@ -985,6 +1229,240 @@ class TestExecute:
         assert len(description_data) == 10
         assert all(d == self.circuit.to_qasm() for d in description_data)  # make sure we posted the correct circuits
 
+    def test_execute_deduplicates_identical_submissions(self, mocked_api: API):
+        """Test the API.execute method reuses the job of an identical recent submission, sending its hash as the
+        idempotency key."""
+        mocked_api._submission_index = SubmissionIndex(ttl=60)
+        try:
+            first_job_id = mocked_api.execute(circuit=self.circuit, nshots=1000, device_id=9)
+            second_job_id = mocked_api.execute(circuit=self.circuit, nshots=1000, device_id=9)
+            _ = mocked_api.execute(circuit=self.circuit, nshots=500, device_id=9)
+        finally:
+            mocked_api._submission_index = None
+
+        assert first_job_id == second_job_id == 0
+        posts = [call.request for call in self.r_mock.calls if call.request.method == "POST"]
+        assert len(posts) == 2
+        assert posts[0].headers["Idempotency-Key"] != posts[1].headers["Idempotency-Key"]
+
+    def test_execute_keeps_lightweight_job_records(self, mocked_api: API):
+        """Test the API.execute method keeps a bounded history of job records without the circuits."""
+        jobs, keep_job_payloads = mocked_api._jobs, mocked_api._keep_job_payloads
+        mocked_api._jobs = JobHistory(max_size=2)
+        try:
+            for nshots in (10, 20, 30):
+                mocked_api.execute(circuit=self.circuit, nshots=nshots, device_id=9)
+            records = mocked_api.jobs
+            mocked_api._keep_job_payloads = True
+            mocked_api.execute(circuit=self.circuit, nshots=40, device_id=9)
+            last_job = mocked_api.last_job
+        finally:
+            mocked_api._jobs, mocked_api._keep_job_payloads = jobs, keep_job_payloads
+
+        # Every submission gets job id 0 from the mocked server, so the history keeps the latest one
+        assert len(records) == 1
+        assert isinstance(records[0], JobRecord)
+        assert (records[0].id, records[0].device_id, records[0].nshots) == (0, 9, 30)
+        assert records[0].job_type == JobType.CIRCUIT
+        assert records[0].status == JobStatus.PENDING
+        assert not hasattr(records[0], "circuit")
+        assert isinstance(last_job, Job)
+        assert last_job.circuit == [self.circuit]
+
+    def test_execute_traces_submission(self, mocked_api: API):
+        """Test the API.execute method nests the serialization, compression and submission spans in its own."""
+        tracer = RecordingTracer()
+        set_tracer(tracer)
+        description_cache.clear()
+        try:
+            mocked_api.execute(circuit=self.circuit, nshots=1000, device_id=9)
+        finally:
+            set_tracer(None)
+
+        execute_span = next(span for span in tracer.spans if span.name == "qiboconnection.execute")
+        assert [span.name for span in tracer.children(execute_span)] == [
+            "qiboconnection.serialize_description",
+            "qiboconnection.submit",
+        ]
+        serialize_span, submit_span = tracer.children(execute_span)
+        assert [span.name for span in tracer.children(serialize_span)] == ["qiboconnection.compress"]
+        assert submit_span.attributes["device_id"] == 9
+        assert submit_span.attributes["bytes"] > 0
+
+    def test_execute_parameter_sweep(self, mocked_api: API):
+        """Test the API.execute method binds the parameter vectors to the template and sends one circuit per point."""
+        template = Circuit(1)
+        template.add(gates.RX(0, theta=0.1))
+        template.add(gates.M(0))
+
+        job_id = mocked_api.execute(circuit=template, parameters=[[0.1], [0.2], [0.3]], device_id=9)
+
+        assert job_id == 0
+        body = json.loads(self.r_mock.calls[1].request.body)
+        description = json.loads(body["description"])
+        qasms = json.loads(gzip.decompress(base64.urlsafe_b64decode(description["data"])))
+        assert len(qasms) == 3
+        assert "parameters" not in description
+        assert [Circuit.from_qasm(qasm).get_parameters() for qasm in qasms] == [[(0.1,)], [(0.2,)], [(0.3,)]]
+
+    def test_execute_template_sweep(self, mocked_api: API):
+        """Test the API.execute method sends a single template circuit and its parameter vectors when asked to."""
+        template = Circuit(1)
+        template.add(gates.RX(0, theta=0.1))
+        template.add(gates.M(0))
+
+        job_id = mocked_api.execute(
+            circuit=template, parameters=[[0.1], [0.2], [0.3]], template_sweep=True, device_id=9
+        )
+
+        assert job_id == 0
+        body = json.loads(self.r_mock.calls[-1].request.body)
+        description = json.loads(body["description"])
+        assert len(json.loads(gzip.decompress(base64.urlsafe_b64decode(description["data"])))) == 1
+        assert description["parameters"]["shape"] == [3, 1]
+
+    def test_execute_parameter_sweep_needs_a_single_circuit(self, mocked_api: API):
+        """Test the API.execute method rejects parameters without a single template circuit."""
+        with pytest.raises(ValueError, match="single template circuit"):
+            mocked_api.execute(circuit=[self.circuit, self.circuit], parameters=[[0.1]], device_id=9)
+
+    # TODO: delete when removing device_ids argument
+    def test_execute_in_many_devices_serializes_once(self, mocked_api: API):
+        """Test the API.execute method builds the description only once when sending the job to many devices."""
+        with patch("qiboconnection.models.job.Job._get_job_description", autospec=True) as mocked_description:
+            mocked_description.return_value = json.dumps(compress_any(["qasm"]))
+            job_ids = mocked_api.execute(circuit=self.circuit, nshots=1000, device_ids=[9, 9])
+
+        assert job_ids == [0, 0]
+        mocked_description.assert_called_once()
+        posted_bodies = [json.loads(call.request.body) for call in self.r_mock.calls if call.request.body]
+        assert len(posted_bodies) == 2
+        assert posted_bodies[0]["description"] == posted_bodies[1]["description"]
+
+    def test_execute_with_device_cache(self, mocked_api: API):
+        """Test the API.execute method reuses the cached device info while it is fresh, so each submission only costs
+        the POST request, and that refresh_devices() requests it again."""
+        mocked_api._device_cache_ttl = 60
+        mocked_api._devices_fetched_at.clear()
+        try:
+            mocked_api.execute(circuit=self.circuit, nshots=10, device_id=9)
+            mocked_api.execute(circuit=self.circuit, nshots=10, device_id=9)
+            assert [call.request.method for call in self.r_mock.calls] == ["GET", "POST", "POST"]
+
+            mocked_api.refresh_devices(device_ids=[9])
+            mocked_api.execute(circuit=self.circuit, nshots=10, device_id=9)
+            assert [call.request.method for call in self.r_mock.calls][3:] == ["GET", "POST"]
+        finally:
+            mocked_api._device_cache_ttl = 0.0
+
+    def test_execute_selecting_device_automatically(self, mocked_api: API):
+        """Test the API.execute method picks the online device with the shortest queue from the cached listing,
+        without requesting the device before each submission."""
+        devices = Devices(
+            [
+                create_device({"id": 9, "name": "busy", "status": "online", "number_pending_jobs": 4}),
+                create_device({"id": 10, "name": "free", "status": "online", "number_pending_jobs": 1}),
+            ]
+        )
+        with patch.object(mocked_api._scheduler, "_fetch_devices", return_value=devices) as mocked_fetch:
+            mocked_api.scheduler.refresh()
+            first_job_id = mocked_api.execute(circuit=self.circuit, nshots=10, auto_select_device=True)
+            second_job_id = mocked_api.execute(circuit=self.circuit, nshots=10, auto_select_device=True)
+
+        assert first_job_id == second_job_id == 0
+        mocked_fetch.assert_called_once()
+        assert [call.request.method for call in self.r_mock.calls] == ["POST", "POST"]
+        assert json.loads(self.r_mock.calls[0].request.body)["device_id"] == 10
+
+        with pytest.raises(ValueError, match="Devices cannot be provided when selecting the device automatically."):
+            mocked_api.execute(circuit=self.circuit, device_id=9, auto_select_device=True)
+
+    # TODO: delete when removing device_ids argument
+    def test_execute_splitting_shots(self, mocked_api: API):
+        """Test the API.execute method splits the shots among the devices, favouring the ones with shorter queues."""
+        self.r_mock.add(
+            method="GET",
+            url="https://qilimanjaroqaas.ddns.net:8080/api/v1/devices/10",
+            status=200,
+            json={"status": "online", "device_id": 10, "device_name": "Busy Device", "number_pending_jobs": 3},
+        )
+        job_ids = mocked_api.execute(circuit=self.circuit, nshots=1000, device_ids=[9, 10], split_shots=True)
+
+        assert job_ids == [0, 0]
+        posted_bodies = [json.loads(call.request.body) for call in self.r_mock.calls if call.request.body]
+        assert sorted((body["device_id"], body["number_shots"]) for body in posted_bodies) == [(9, 800), (10, 200)]
+
+    # TODO: delete when removing device_ids argument
+    def test_execute_splitting_shots_with_weights(self, mocked_api: API):
+        """Test the API.execute method skips the devices that get no shots, and checks the number of weights."""
+        job_ids = mocked_api.execute(
+            circuit=self.circuit, nshots=1000, device_ids=[9, 9], split_shots=True, shot_weights=[1, 0]
+        )
+        assert job_ids == [0]
+        posted_bodies = [json.loads(call.request.body) for call in self.r_mock.calls if call.request.body]
+        assert [body["number_shots"] for body in posted_bodies] == [1000]
+
+        with pytest.raises(ValueError, match="Shot weights should be provided for each selected device."):
+            mocked_api.execute(circuit=self.circuit, device_ids=[9, 9], split_shots=True, shot_weights=[1])
+
+    # TODO: delete when removing device_ids argument
+    def test_execute_splitting_shots_keeps_the_submitted_jobs(self, mocked_api: API):
+        """Test the API.execute method submits every split job even if some fail, keeps the ones queued and raises
+        with their ids."""
+        failure = RemoteExecutionException(message="Circuit could not be executed.", status_code=500)
+
+        def submit(_: API, job: Job) -> tuple[int, bool]:
+            if job.nshots == 300:
+                raise failure
+            job.id = 7
+            return 7, True
+
+        jobs = mocked_api._jobs
+        mocked_api._jobs = JobHistory()
+        try:
+            with (
+                patch("qiboconnection.api.API._submit_job", autospec=True, side_effect=submit) as mocked_submit,
+                pytest.raises(PartialSubmissionException) as error,
+            ):
+                mocked_api.execute(
+                    circuit=self.circuit, nshots=1000, device_ids=[9, 9], split_shots=True, shot_weights=[7, 3]
+                )
+            records = mocked_api.jobs
+        finally:
+            mocked_api._jobs = jobs
+
+        assert mocked_submit.call_count == 2
+        assert error.value.job_ids == [7]
+        assert error.value.errors == [failure]
+        assert error.value.status_code == 500
+        assert [(record.id, record.nshots) for record in records] == [(7, 700)]
+
+    def test_submitting_jobs_concurrently_does_not_swallow_interrupts(self, mocked_api: API):
+        """Test interrupting a concurrent submission is raised instead of being kept as a submission error."""
+        with (
+            patch("qiboconnection.api.API._submit_job", autospec=True, side_effect=KeyboardInterrupt),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            mocked_api._submit_jobs(jobs=[MagicMock(spec=Job), MagicMock(spec=Job)], concurrently=True)
+
+    def test_execute_splitting_shots_needs_circuits(self, mocked_api: API):
+        """Test the API.execute method only splits the shots of circuits, whose results can be merged."""
+        with pytest.raises(ValueError, match="Shots can only be split among devices for circuits."):
+            mocked_api.execute(qprogram="qprogram", device_ids=[9, 9], split_shots=True)
+
+    # TODO: delete when removing device_ids argument
+    @patch("qiboconnection.api.API._wait_and_return_results", autospec=True)
+    def test_execute_and_return_results_splitting_shots(self, mocked_wait: MagicMock, mocked_api: API):
+        """Test execute_and_return_results merges the results of the split jobs."""
+        mocked_wait.return_value = [
+            [{"probabilities": {"0": 1.0}, "counts": {"0": 500}}],
+            [{"probabilities": {"1": 1.0}, "counts": {"1": 500}}],
+        ]
+        result = mocked_api.execute_and_return_results(
+            circuit=[self.circuit], nshots=1000, device_ids=[9, 9], split_shots=True
+        )
+        assert result == [[{"probabilities": {"0": 0.5, "1": 0.5}, "counts": {"0": 500, "1": 500}}]]
+
     # TODO: delete
     @patch("qiboconnection.api.API._get_job", autospec=True)
     def test_execute_and_return_results_device_ids(self, mocked_get_job: MagicMock, mocked_api: API):
@@ -60,3 +60,60 @@ def test_calibration_request():
 
     assert isinstance(calibration_request, CalibrationRequest)
     assert calibration_request.calibration == "eyJhIjogMH0="
+
+
+def test_compressed_calibration_round_trip():
+    """Tests calibrations with a compression are uploaded compressed, and decoded back keeping their compression"""
+    serialized = yaml.safe_dump({"qubits": [{"frequency": 5e9, "t1": 2e-5}] * 200})
+    calibration = Calibration(
+        name="calibration",
+        description="description",
+        user_id=0,
+        device_id=0,
+        calibration=serialized,
+        qililab_version="0.0.0",
+        compression="gzip",
+    )
+    encoded = calibration.calibration_request().calibration
+
+    calibration = Calibration.from_response(
+        response=CalibrationResponse(
+            name="calibration",
+            description="description",
+            user_id=0,
+            device_id=0,
+            calibration=encoded,
+            qililab_version="0.0.0",
+            calibration_id=0,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+    )
+    assert calibration.calibration == serialized
+    assert calibration.compression == "gzip"
+
+
+def test_compressed_calibration_changes_are_sent_whole():
+    """Tests a compressed calibration whose content changed is sent whole, compressed, rather than patched with its plain
+    content, while changes to its other fields are still patched"""
+    serialized = yaml.safe_dump({"qubits": [{"frequency": 5e9, "t1": 2e-5}] * 200})
+    encoded = Calibration(calibration=serialized, compression="gzip")._encoded_calibration
+    response = CalibrationResponse(
+        name="calibration",
+        description="description",
+        user_id=0,
+        device_id=0,
+        calibration=encoded,
+        qililab_version="0.0.0",
+        calibration_id=0,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+    calibration = Calibration.from_response(response=response, track_changes=True)
+    calibration.description = "tuned"
+
+    assert calibration.changes_patch() == [{"op": "replace", "path": "/description", "value": "tuned"}]
+
+    calibration.calibration = calibration.calibration.replace("t1: 2.0e-05", "t1: 3.0e-05", 1)
+
+    assert calibration.changes_patch() is None
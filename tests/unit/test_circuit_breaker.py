@@ -0,0 +1,129 @@
+"""Tests for the circuit breaker of the calls"""
+
+from contextlib import suppress
+from time import monotonic, sleep
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from requests import codes
+
+from qiboconnection.api import API
+from qiboconnection.circuit_breaker import CircuitBreaker, circuit_name
+from qiboconnection.connection import Connection
+from qiboconnection.errors import CircuitOpenException
+from qiboconnection.typings.enums import CircuitState
+
+POLLING = circuit_name(method="get", url="https://host/api/v1/jobs/1")
+LISTING = circuit_name(method="get", url="https://host/api/v1/jobs")
+
+
+def _response(status_code: int = codes.ok) -> MagicMock:
+    """Builds a response with the given status"""
+    return MagicMock(status_code=status_code)
+
+
+def _wait_for(breaker: CircuitBreaker, circuit: str, state: CircuitState, timeout: float = 2.0) -> None:
+    """Waits until a circuit reaches a state"""
+    deadline = monotonic() + timeout
+    while breaker.circuits[circuit] != state:
+        assert monotonic() < deadline, f"{circuit} did not become {state}"
+        sleep(0.005)
+
+
+def _open(breaker: CircuitBreaker, circuit: str = POLLING) -> None:
+    """Fails calls until the circuit opens"""
+    for _ in range(breaker.failure_threshold):
+        breaker.call(circuit=circuit, send=lambda: _response(codes.bad_gateway))
+
+
+def test_circuit_name():
+    """Test circuits are named after the host and endpoint class of the calls."""
+    assert POLLING == "host polling"
+    assert circuit_name(method="post", url="https://other:8080/api/v1/circuits") == "other:8080 submission"
+
+
+def test_circuit_opens_after_consecutive_failures_and_fails_fast():
+    """Test calls fail fast once a circuit opens, without affecting the other circuits."""
+    breaker = CircuitBreaker(failure_threshold=3)
+    send = MagicMock(side_effect=[_response(codes.bad_gateway), _response(), requests.ConnectionError("down")])
+    for _ in range(3):
+        with suppress(requests.ConnectionError):
+            breaker.call(circuit=POLLING, send=send)
+    assert breaker.circuits[POLLING] == CircuitState.CLOSED
+
+    breaker.call(circuit=POLLING, send=lambda: _response(codes.not_found))
+    assert breaker.circuits[POLLING] == CircuitState.CLOSED
+    _open(breaker)
+    assert breaker.circuits[POLLING] == CircuitState.OPEN
+
+    send = MagicMock(return_value=_response())
+    with pytest.raises(CircuitOpenException) as error:
+        breaker.call(circuit=POLLING, send=send)
+    send.assert_not_called()
+    assert error.value.circuit == POLLING
+    assert 0 < error.value.retry_in <= breaker.recovery_timeout
+    assert breaker.call(circuit=LISTING, send=send).status_code == codes.ok
+
+
+def test_circuit_recovers_once_the_probe_succeeds():
+    """Test a successful probe lets a trial call through, which closes the circuit if it succeeds."""
+    probe = MagicMock(side_effect=[False, True, True])
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60, probe_interval=0.01, probe=probe)
+    _open(breaker)
+    _wait_for(breaker, POLLING, CircuitState.HALF_OPEN)
+    assert probe.call_count == 2
+
+    breaker.call(circuit=POLLING, send=lambda: _response(codes.service_unavailable))
+    assert breaker.circuits[POLLING] == CircuitState.OPEN
+    _wait_for(breaker, POLLING, CircuitState.HALF_OPEN)
+
+    assert breaker.call(circuit=POLLING, send=_response).status_code == codes.ok
+    assert breaker.circuits[POLLING] == CircuitState.CLOSED
+
+
+def test_circuit_lets_a_trial_call_through_after_the_recovery_timeout():
+    """Test open circuits let a single trial call through once the recovery timeout passes, without a probe."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    _open(breaker)
+    sleep(0.06)
+
+    def trial():
+        with pytest.raises(CircuitOpenException):
+            breaker.call(circuit=POLLING, send=_response)
+        return _response()
+
+    assert breaker.call(circuit=POLLING, send=trial).status_code == codes.ok
+    assert breaker.circuits[POLLING] == CircuitState.CLOSED
+
+
+def test_circuit_breaker_rejects_invalid_settings():
+    """Test invalid thresholds and timeouts are rejected."""
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(probe_interval=0)
+
+
+@patch("qiboconnection.connection.requests.get", autospec=True)
+def test_connection_fails_fast_while_the_circuit_is_open(mocked_rest_call: MagicMock, mocked_connection: Connection):
+    """Test the connection stops calling the server once its circuit breaker opens."""
+    mocked_rest_call.side_effect = requests.Timeout("timed out")
+    mocked_connection._circuit_breaker = CircuitBreaker(failure_threshold=2)
+    try:
+        for _ in range(2):
+            with pytest.raises(requests.Timeout):
+                mocked_connection.send_get_auth_remote_api_call(path="/jobs/1")
+        with pytest.raises(CircuitOpenException):
+            mocked_connection.send_get_auth_remote_api_call(path="/jobs/1")
+    finally:
+        mocked_connection._circuit_breaker = None
+    assert mocked_rest_call.call_count == 2
+
+
+def test_api_probes_with_ping(mocked_api: API):
+    """Test the API probes the server with ping."""
+    with patch.object(mocked_api, "ping", return_value="OK"):
+        assert mocked_api._is_alive()
+    with patch.object(mocked_api, "ping", side_effect=requests.ConnectionError("down")):
+        assert not mocked_api._is_alive()
@@ -0,0 +1,66 @@
+"""Tests for the compact variants of the typings"""
+
+import sys
+
+import pytest
+
+from qiboconnection.models.job_listing import JobListing, JobListingItem
+from qiboconnection.typings.compact import CompactModel, compact_model
+from qiboconnection.typings.devices import DeviceInput
+from qiboconnection.typings.responses import JobListingItemResponse
+
+listing_item = {"status": "completed", "user_id": 1, "device_id": 9, "job_type": "circuit", "number_shots": 10, "id": 3}
+
+
+def test_compact_model_is_built_once_per_class():
+    """Test the variant of a class is cached, and is a slotted CompactModel."""
+    variant = compact_model(JobListingItemResponse)
+    assert variant is compact_model(JobListingItemResponse)
+    assert issubclass(variant, CompactModel)
+    assert variant.__name__ == "CompactJobListingItemResponse"
+    assert not hasattr(variant.from_kwargs(**listing_item), "__dict__")
+
+
+def test_compact_model_keeps_unknown_fields_in_extra():
+    """Test unknown fields go to the overflow dict and can still be read as attributes."""
+    item = compact_model(JobListingItemResponse).from_kwargs(**listing_item, name="my job")
+
+    assert item.id == 3
+    assert item.extra == {"name": "my job"}
+    assert item.name == "my job"
+    assert item.to_dict() == {**listing_item, "name": "my job"}
+    with pytest.raises(AttributeError):
+        _ = item.summary
+
+
+def test_compact_model_applies_retrocompatibility_conversions():
+    """Test the compact DeviceInput accepts the legacy field names, like DeviceInput.from_kwargs."""
+    device_input = compact_model(DeviceInput).from_kwargs(device_id=1, device_name="dev", status="online")
+    assert (device_input.id, device_input.name, device_input.type) == (1, "dev", None)
+
+
+def test_compact_model_of_plain_annotated_class():
+    """Test variants can be built for annotated classes that are not dataclasses, keeping their defaults."""
+    item = compact_model(JobListingItem).from_kwargs(**{**listing_item, "id": None})
+    assert item.id is None
+    with pytest.raises(TypeError):
+        compact_model(JobListingItem).from_kwargs(id=1)
+
+
+def test_compact_items_take_less_memory():
+    """Test compact items are smaller than regular ones."""
+    regular = JobListingItemResponse.from_kwargs(**listing_item)
+    compact = compact_model(JobListingItemResponse).from_kwargs(**listing_item)
+    assert sys.getsizeof(compact) < sys.getsizeof(regular) + sys.getsizeof(regular.__dict__)
+
+
+def test_job_listing_from_compact_responses():
+    """Test a JobListing can be built from compact responses, with the same dataframe as from regular ones."""
+    responses = [JobListingItemResponse.from_kwargs(**listing_item, name="a")]
+    compact_responses = [compact_model(JobListingItemResponse).from_kwargs(**listing_item, name="a")]
+
+    listing = JobListing.from_response(responses)
+    compact_listing = JobListing.from_response(compact_responses)
+
+    assert isinstance(compact_listing.items[0], CompactModel)
+    assert compact_listing.dataframe.equals(listing.dataframe[compact_listing.dataframe.columns])
@@ -0,0 +1,64 @@
+"""Tests for the deduplication of job submissions"""
+
+from unittest.mock import patch
+
+from qiboconnection.deduplication import SubmissionIndex, job_request_hash
+from qiboconnection.serialization import escape_json_string
+from qiboconnection.typings.requests import JobRequest
+
+
+def _build_job_request(number_shots: int = 10) -> JobRequest:
+    """Builds a simple job request"""
+    return JobRequest(
+        user_id=1,
+        device_id=9,
+        number_shots=number_shots,
+        job_type="circuit",
+        description="description",
+        name="-",
+        summary="-",
+    )
+
+
+def test_job_request_hash():
+    """Test equal requests share a hash and different ones do not."""
+    assert job_request_hash(_build_job_request()) == job_request_hash(_build_job_request())
+    assert job_request_hash(_build_job_request(number_shots=10)) != job_request_hash(
+        _build_job_request(number_shots=20)
+    )
+
+
+def test_submission_index_remembers_jobs_until_ttl():
+    """Test submissions are forgotten once they are older than the ttl."""
+    index = SubmissionIndex(ttl=10)
+    with patch("qiboconnection.deduplication.monotonic", return_value=100.0):
+        index.add(key="a", job_id=1)
+    with patch("qiboconnection.deduplication.monotonic", return_value=105.0):
+        index.add(key="b", job_id=2)
+        assert index.get("a") == 1
+    with patch("qiboconnection.deduplication.monotonic", return_value=111.0):
+        assert index.get("a") is None
+        assert index.get("b") == 2
+    assert len(index) == 1
+
+
+def test_submission_index_discard_job():
+    """Test discarded jobs are not reused."""
+    index = SubmissionIndex(ttl=10)
+    index.add(key="a", job_id=1)
+    index.add(key="b", job_id=2)
+    index.discard_job(job_id=1)
+    assert index.get("a") is None
+    assert index.get("b") == 2
+    index.clear()
+    assert len(index) == 0
+
+
+def test_job_request_hash_reuses_the_escaped_description():
+    """Test the hash does not escape the description again when given, and matches the one escaping it."""
+    job_request = _build_job_request()
+    expected = job_request_hash(job_request)
+    escaped_description = escape_json_string(job_request.description)
+    with patch("qiboconnection.deduplication.escape_json_string", autospec=True) as mocked_escape:
+        assert job_request_hash(job_request, escaped_description=escaped_description) == expected
+    mocked_escape.assert_not_called()
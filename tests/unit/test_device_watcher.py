@@ -0,0 +1,74 @@
+"""Tests for the device watcher"""
+
+import threading
+from unittest.mock import MagicMock
+
+from qiboconnection.device_watcher import DeviceWatcher, diff_devices
+from qiboconnection.models.devices import Devices, create_device
+
+
+def _build_devices(status: str = "maintenance", number_pending_jobs: int = 0) -> Devices:
+    """Builds a listing with a single device"""
+    return Devices(
+        [create_device({"id": 1, "name": "dev", "status": status, "number_pending_jobs": number_pending_jobs})]
+    )
+
+
+def test_diff_devices():
+    """Test only the changed fields are reported, and new devices change from None."""
+    previous = _build_devices()
+    current = _build_devices(status="online", number_pending_jobs=2)
+    current.add(create_device({"id": 2, "name": "new", "status": "online"}))
+
+    changes = diff_devices(previous=previous, current=current)
+
+    assert changes[1] == {"status": ("maintenance", "online"), "number_pending_jobs": (0, 2)}
+    assert changes[2]["status"] == (None, "online")
+    assert diff_devices(previous=current, current=current) == {}
+
+
+def test_poll_notifies_callbacks():
+    """Test polling calls the callbacks for each changed device, and survives failing callbacks."""
+    fetch_devices = MagicMock(side_effect=[_build_devices(), _build_devices(), _build_devices(status="online")])
+    watcher = DeviceWatcher(fetch_devices=fetch_devices)
+    callback = MagicMock()
+    watcher.add_callback(MagicMock(side_effect=RuntimeError("boom")))
+    watcher.add_callback(callback)
+
+    watcher.poll()
+    watcher.poll()
+    watcher.poll()
+
+    assert callback.call_count == 2
+    callback.assert_called_with(1, {"status": ("maintenance", "online")})
+
+
+def test_wait_until_online():
+    """Test waiting for a device returns once a poll sees it online, and times out otherwise."""
+    watcher = DeviceWatcher(fetch_devices=MagicMock(side_effect=[_build_devices(), _build_devices(status="online")]))
+    watcher.poll()
+    assert not watcher.wait_until_online(device_id=1, timeout=0.01)
+
+    poller = threading.Timer(0.05, watcher.poll)
+    poller.start()
+    assert watcher.wait_until_online(device_id=1, timeout=5)
+    poller.join()
+
+
+def test_background_polling_backs_off_after_errors():
+    """Test the watcher keeps polling in the background after errors and stops when asked."""
+    polled = threading.Event()
+    responses = iter([ConnectionError("down"), _build_devices(status="online")])
+
+    def fetch_devices():
+        response = next(responses, None) or _build_devices(status="online")
+        if isinstance(response, Exception):
+            raise response
+        polled.set()
+        return response
+
+    with DeviceWatcher(fetch_devices=fetch_devices, interval=0.01, max_interval=0.02) as watcher:
+        assert polled.wait(timeout=5)
+        assert watcher.wait_until_online(device_id=1, timeout=5)
+        assert watcher.running
+    assert not watcher.running
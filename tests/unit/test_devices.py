@@ -2,12 +2,15 @@
 
 import json
 from typing import List
+from unittest.mock import MagicMock
 
 import pytest
 
 from qiboconnection.models.devices.device import Device
 from qiboconnection.models.devices.devices import Devices
+from qiboconnection.models.devices.util import create_device
 from qiboconnection.typings.devices import DeviceInput
+from qiboconnection.typings.enums import DeviceStatus
 
 from .data import simulator_device_inputs
 
@@ -145,3 +148,48 @@ def test_devices_select_device_raises_value_error_for_duplicated(simulator_devic
     with pytest.raises(ValueError) as e_info:
         _ = devices.select_device(device_id=1)
     assert e_info.value.args[0] == "Device duplicated with same id:1"
+
+
+def _build_devices() -> Devices:
+    """Builds devices with different statuses, types and queues"""
+    return Devices(
+        [
+            create_device({"id": 1, "name": "a", "status": "online", "type": "quantum_analog_device"}),
+            create_device(
+                {"id": 2, "name": "b", "status": "online", "type": "simulator_device", "number_pending_jobs": 3}
+            ),
+            create_device(
+                {"id": 3, "name": "c", "status": "maintenance", "type": "quantum_device", "number_pending_jobs": 0}
+            ),
+            create_device(
+                {"id": 4, "name": "d", "status": "online", "type": "quantum_digital_device", "number_pending_jobs": 1}
+            ),
+        ]
+    )
+
+
+def test_devices_queries():
+    """Test Devices can be queried by status and type, keeping their insertion order."""
+    devices = _build_devices()
+    assert [device.id for device in devices.online()] == [1, 2, 4]
+    assert [device.id for device in devices.by_status(DeviceStatus.MAINTENANCE)] == [3]
+    assert [device.id for device in devices.by_type("quantum")] == [1, 3, 4]
+    assert [device.id for device in devices.by_type("simulator_device")] == [2]
+    assert [device.id for device in devices.online().by_type("quantum")] == [1, 4]
+    assert devices.least_loaded().id == 1
+    assert Devices().least_loaded() is None
+    assert 3 in devices and len(devices) == 4
+
+
+def test_devices_indexes_follow_updates():
+    """Test updating a device keeps its position and moves it in the indexes."""
+    devices = _build_devices()
+    devices.add_or_update(create_device({"id": 1, "name": "a", "status": "offline", "type": "quantum_analog_device"}))
+    assert [device.id for device in devices] == [1, 2, 3, 4]
+    assert [device.id for device in devices.online()] == [2, 4]
+    assert devices.least_loaded().id == 4
+
+    mocked_connection = MagicMock()
+    devices.set_device_to_online(connection=mocked_connection, device_id=3)
+    assert [device.id for device in devices.online()] == [2, 3, 4]
+    assert [device.id for device in devices.by_status("maintenance")] == []
@@ -0,0 +1,41 @@
+"""Tests for the time it takes to import qiboconnection"""
+
+import re
+import subprocess
+import sys
+
+HEAVY_MODULES = ("qibo", "pandas", "numpy", "jwt", "typeguard")
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Runs some code in a fresh interpreter"""
+    return subprocess.run([sys.executable, *options, "-c", code], capture_output=True, text=True, check=True)
+
+
+def test_import_does_not_load_heavy_dependencies():
+    """Test importing the API does not import qibo, pandas, numpy, jwt nor typeguard."""
+    code = (
+        "import sys\n"
+        "import qiboconnection.api\n"
+        f"print(','.join(module for module in {HEAVY_MODULES!r} if module in sys.modules))\n"
+    )
+    assert not _run(code).stdout.strip()
+
+
+def test_heavy_dependencies_are_loaded_when_needed():
+    """Test the lazily imported modules are available once they are used."""
+    code = (
+        "import sys\n"
+        "from qiboconnection.serialization import compress_array\n"
+        "compress_array([1, 2, 3])\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    assert _run(code).stdout.strip() == "True"
+
+
+def test_import_time_has_no_heavy_dependencies():
+    """Test none of the modules timed by `-X importtime` while importing the API is a heavy dependency."""
+    stderr = _run("import qiboconnection.api", "-X", "importtime").stderr
+    modules = [match.group(1).strip() for match in re.finditer(r"import time:\s+\d+\s+\|\s+\d+\s+\|(.*)", stderr)]
+    assert "qiboconnection.api" in modules
+    assert not any(module.split(".")[0] in HEAVY_MODULES for module in modules)
@@ -0,0 +1,67 @@
+"""Tests for the instrumentation of the HTTP calls"""
+
+import pytest
+
+from qiboconnection.instrumentation import LatencyAggregator, RequestEvent, endpoint_template
+
+
+def _event(elapsed: float, endpoint: str = "/api/v1/jobs/{id}", status_code: int = 200) -> RequestEvent:
+    """Builds the event of a call"""
+    return RequestEvent(
+        method="GET",
+        url=f"https://host{endpoint}",
+        endpoint=endpoint,
+        status_code=status_code,
+        bytes_sent=0,
+        bytes_received=10,
+        elapsed=elapsed,
+    )
+
+
+@pytest.mark.parametrize(
+    ("url", "template"),
+    [
+        ("https://host/api/v1/jobs/42?page=1", "/api/v1/jobs/{id}"),
+        ("https://host/api/v1/devices/9/status", "/api/v1/devices/{id}/status"),
+        ("https://host/api/v1/circuits", "/api/v1/circuits"),
+        ("https://host/api/v1/runcards/v2", "/api/v1/runcards/v2"),
+    ],
+)
+def test_endpoint_template(url: str, template: str):
+    """Test numeric identifiers are removed from the endpoints."""
+    assert endpoint_template(url) == template
+
+
+def test_latency_aggregator_percentiles():
+    """Test the estimated percentiles are close to the actual ones."""
+    aggregator = LatencyAggregator()
+    for millisecond in range(1, 1001):
+        aggregator(_event(elapsed=millisecond / 1000))
+    aggregator(_event(elapsed=0.5, endpoint="/api/v1/circuits", status_code=500))
+
+    summary = aggregator.summary()
+
+    assert set(aggregator.endpoints) == {"GET /api/v1/jobs/{id}", "GET /api/v1/circuits"}
+    jobs_summary = summary["GET /api/v1/jobs/{id}"]
+    assert jobs_summary["count"] == 1000
+    assert jobs_summary["errors"] == 0
+    assert jobs_summary["mean"] == pytest.approx(0.5005)
+    for percentile, actual_latency in ((50, 0.5), (95, 0.95), (99, 0.99)):
+        assert actual_latency <= jobs_summary[f"p{percentile}"] <= actual_latency * 1.1
+    assert jobs_summary["max"] == 1.0
+    assert summary["GET /api/v1/circuits"]["errors"] == 1
+    assert summary["GET /api/v1/circuits"]["p99"] == 0.5
+
+
+def test_latency_aggregator_errors():
+    """Test percentiles are only computed for called endpoints and valid percentiles."""
+    aggregator = LatencyAggregator()
+    aggregator(_event(elapsed=0.1))
+
+    with pytest.raises(ValueError, match="has not been called"):
+        aggregator.percentile(endpoint="GET /api/v1/circuits", percentile=50)
+    with pytest.raises(ValueError, match="between 0 and 100"):
+        aggregator.percentile(endpoint="GET /api/v1/jobs/{id}", percentile=101)
+
+    aggregator.reset()
+    assert not aggregator.endpoints
@@ -0,0 +1,52 @@
+"""Tests for the bounded job history"""
+
+import pytest
+
+from qiboconnection.models.job_history import JobHistory, JobRecord
+from qiboconnection.typings.enums import JobStatus, JobType
+
+
+def _record(job_id: int) -> JobRecord:
+    """Builds the record of a circuit job"""
+    return JobRecord(id=job_id, device_id=1, job_type=JobType.CIRCUIT, nshots=10)
+
+
+def test_job_history_discards_the_oldest_jobs():
+    """Test the history keeps only the latest jobs once full."""
+    history = JobHistory(max_size=3)
+    for job_id in range(5):
+        history.add(_record(job_id))
+
+    assert len(history) == 3
+    assert [job.id for job in history] == [2, 3, 4]
+    assert history.last().id == 4
+    assert 1 not in history
+    assert 2 in history
+
+
+def test_job_history_sizes():
+    """Test a history of size 0 keeps no jobs, a history without size keeps all of them, and sizes are not negative."""
+    disabled_history, unbounded_history = JobHistory(max_size=0), JobHistory()
+    for job_id in range(100):
+        disabled_history.add(_record(job_id))
+        unbounded_history.add(_record(job_id))
+
+    assert len(disabled_history) == 0
+    with pytest.raises(IndexError):
+        disabled_history.last()
+    assert len(unbounded_history) == 100
+    with pytest.raises(ValueError):
+        JobHistory(max_size=-1)
+
+
+def test_job_history_update_status():
+    """Test the status of the jobs in the history is updated, ignoring unknown jobs and statuses."""
+    history = JobHistory(max_size=10)
+    history.add(_record(1))
+
+    history.update_status(job_id=1, status="completed")
+    history.update_status(job_id=2, status="completed")
+    history.update_status(job_id=1, status="unknown")
+
+    assert history.last().status == JobStatus.COMPLETED
+    assert len(history) == 1
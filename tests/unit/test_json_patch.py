@@ -0,0 +1,47 @@
+"""Tests for the JSON patches between documents"""
+
+import pytest
+
+from qiboconnection.json_patch import apply_patch, diff
+
+SOURCE = {
+    "settings": {"delay": 40, "gates": [{"name": "X", "duration": 100}, {"name": "Y", "duration": 100}]},
+    "chip/v1": {"qubits": [0, 1]},
+    "flag": True,
+    "removed": None,
+}
+
+
+def test_diff_only_describes_the_changes():
+    """Test changing a few values deep in a document only produces operations for them."""
+    target = {
+        "settings": {"delay": 80, "gates": [{"name": "X", "duration": 100}, {"name": "Y", "duration": 120}]},
+        "chip/v1": {"qubits": [0, 1, 2]},
+        "flag": 1,
+        "added": {"a": 0},
+    }
+
+    operations = diff(SOURCE, target)
+
+    assert operations == [
+        {"op": "replace", "path": "/settings/delay", "value": 80},
+        {"op": "replace", "path": "/settings/gates/1/duration", "value": 120},
+        {"op": "replace", "path": "/chip~1v1/qubits", "value": [0, 1, 2]},
+        {"op": "replace", "path": "/flag", "value": 1},
+        {"op": "remove", "path": "/removed"},
+        {"op": "add", "path": "/added", "value": {"a": 0}},
+    ]
+    assert apply_patch(SOURCE, operations) == target
+    assert SOURCE["settings"]["delay"] == 40
+    assert not diff(SOURCE, SOURCE)
+    assert diff(SOURCE, [1]) == [{"op": "replace", "path": "", "value": [1]}]
+
+
+def test_apply_patch_rejects_invalid_operations():
+    """Test unsupported operations and missing paths are rejected."""
+    with pytest.raises(ValueError):
+        apply_patch(SOURCE, [{"op": "move", "from": "/flag", "path": "/other"}])
+    with pytest.raises(ValueError):
+        apply_patch(SOURCE, [{"op": "replace", "path": "/missing/key", "value": 0}])
+    with pytest.raises(ValueError):
+        apply_patch(SOURCE, [{"op": "replace", "path": "/settings/gates/5", "value": 0}])
@@ -1,9 +1,12 @@
 """Test methods for Runcards classes"""
 
+import json
 from datetime import datetime, timezone
 
+from qiboconnection.json_patch import apply_patch
 from qiboconnection.models.runcard import Runcard
 from qiboconnection.typings.responses.runcard_response import RuncardRequest, RuncardResponse
+from qiboconnection.util import jsonify_dict_and_base64_encode
 
 
 def test_runcard_creation():
@@ -58,3 +61,90 @@ def test_runcard_request():
 
     assert isinstance(runcard_request, RuncardRequest)
     assert runcard_request.runcard == "eyJhIjogMH0="
+
+
+def test_compressed_runcard_round_trip():
+    """Tests runcards with a compression are uploaded compressed, and decoded back keeping their compression"""
+    runcard_dict = {"gates": [{"name": "X", "duration": 40}] * 500}
+    runcard = Runcard(
+        name="runcard",
+        description="description",
+        user_id=0,
+        device_id=0,
+        runcard=runcard_dict,
+        qililab_version="0.0.0",
+        compression="gzip",
+    )
+    encoded = runcard.runcard_request().runcard
+    assert json.loads(encoded)["compression"] == "gzip"
+    assert len(encoded) < len(jsonify_dict_and_base64_encode(runcard_dict)) / 10
+
+    runcard = Runcard.from_response(
+        response=RuncardResponse(
+            name="runcard",
+            description="description",
+            user_id=0,
+            device_id=0,
+            runcard=encoded,
+            qililab_version="0.0.0",
+            runcard_id=0,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+    )
+    assert runcard.runcard == runcard_dict
+    assert runcard.compression == "gzip"
+
+
+def test_runcard_changes_patch_the_stored_runcard():
+    """Tests the changes of a runcard retrieved for editing patch the runcard as stored in the server, and runcards
+    retrieved otherwise do not keep track of them"""
+    response = RuncardResponse(
+        name="runcard",
+        description="description",
+        user_id=0,
+        device_id=0,
+        runcard=jsonify_dict_and_base64_encode({"gates": [{"name": "X", "duration": 40}] * 50}),
+        qililab_version="0.0.0",
+        runcard_id=0,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    assert Runcard.from_response(response=response).changes_patch() is None
+
+    runcard = Runcard.from_response(response=response, track_changes=True)
+    assert runcard.server_version == "2024-01-01T00:00:00+00:00"
+    assert runcard.changes_patch() == []
+
+    runcard.runcard["gates"][0]["duration"] = 20
+    runcard.description = "tuned"
+    patch = runcard.changes_patch()
+    stored = Runcard.from_response(response=response)
+
+    assert [operation["path"] for operation in patch] == ["/runcard/gates/0/duration", "/description"]
+    assert apply_patch(stored._document(), patch) == runcard._document()
+
+
+def test_runcard_single_value_change_patch_size():
+    """Tests changing a single value of a big runcard sends a patch with that value only, far smaller than the whole
+    runcard"""
+    content = {"qubits": {f"q{index}": {"frequency": 5e9 + index, "drag": {"amplitude": 0.5}} for index in range(1500)}}
+    response = RuncardResponse(
+        name="runcard",
+        description="description",
+        user_id=0,
+        device_id=0,
+        runcard=jsonify_dict_and_base64_encode(content),
+        qililab_version="0.0.0",
+        runcard_id=0,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+    runcard = Runcard.from_response(response=response, track_changes=True)
+    runcard.runcard["qubits"]["q42"]["drag"]["amplitude"] = 0.25
+
+    patch = runcard.changes_patch()
+
+    assert patch == [{"op": "replace", "path": "/runcard/qubits/q42/drag/amplitude", "value": 0.25}]
+    assert len(response.runcard) > 100_000
+    assert len(json.dumps(patch)) < 100
@@ -0,0 +1,88 @@
+"""Tests for the automatic selection of devices"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from qiboconnection.models.devices import Devices, create_device
+from qiboconnection.scheduling import DeviceScheduler, device_number_qubits
+
+
+def _build_devices() -> Devices:
+    """Builds a listing with devices of every kind"""
+    return Devices(
+        [
+            create_device({"id": 1, "name": "offline", "status": "offline", "number_pending_jobs": 0}),
+            create_device(
+                {
+                    "id": 2,
+                    "name": "busy",
+                    "status": "online",
+                    "type": "quantum_device",
+                    "number_pending_jobs": 5,
+                    "static_features": {"number_qubits": 5},
+                }
+            ),
+            create_device(
+                {
+                    "id": 3,
+                    "name": "small",
+                    "status": "online",
+                    "type": "quantum_device",
+                    "number_pending_jobs": 0,
+                    "static_features": {"qubits": [0, 1]},
+                }
+            ),
+            create_device(
+                {"id": 4, "name": "simulator", "status": "online", "type": "simulator_device", "number_pending_jobs": 2}
+            ),
+        ]
+    )
+
+
+def test_device_number_qubits():
+    """Test the number of qubits is read from the static features."""
+    devices = list(_build_devices())
+    assert [device_number_qubits(device) for device in devices] == [None, 5, 2, None]
+
+
+@pytest.mark.parametrize(
+    "nqubits, device_type, expected_device_id",
+    [(None, None, 3), (3, None, 4), (3, "quantum_device", 2), (2, "quantum_device", 3)],
+)
+def test_select_device(nqubits: int | None, device_type: str | None, expected_device_id: int):
+    """Test the online device with the shortest queue among the suitable ones is selected."""
+    scheduler = DeviceScheduler(fetch_devices=_build_devices)
+    assert scheduler.select_device(nqubits=nqubits, device_type=device_type).id == expected_device_id
+
+
+def test_select_device_without_candidates():
+    """Test selecting a device fails when no online device can run the job."""
+    scheduler = DeviceScheduler(fetch_devices=_build_devices)
+    with pytest.raises(ValueError, match="No online device is able to run the job"):
+        scheduler.select_device(nqubits=10, device_type="quantum_device")
+
+
+def test_snapshot_is_refreshed_when_stale():
+    """Test the devices are only fetched again once the snapshot is older than the refresh interval."""
+    fetch_devices = MagicMock(side_effect=_build_devices)
+    scheduler = DeviceScheduler(fetch_devices=fetch_devices, refresh_interval=10)
+    with patch("qiboconnection.scheduling.monotonic", return_value=100.0):
+        scheduler.select_device()
+        scheduler.select_device()
+    assert fetch_devices.call_count == 1
+    with patch("qiboconnection.scheduling.monotonic", return_value=111.0):
+        scheduler.select_device()
+    assert fetch_devices.call_count == 2
+    scheduler.refresh()
+    assert fetch_devices.call_count == 3
+
+
+def test_bursts_are_spread_until_the_next_snapshot():
+    """Test every selected device counts as one more pending job on it until the snapshot is refreshed."""
+    scheduler = DeviceScheduler(fetch_devices=_build_devices)
+    assert [scheduler.select_device().id for _ in range(6)] == [3, 3, 3, 4, 3, 4]
+    assert [scheduler.pending_jobs(device) for device in scheduler.candidates()] == [4, 4, 5]
+
+    scheduler.refresh()
+    assert scheduler.select_device().id == 3
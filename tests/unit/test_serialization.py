@@ -0,0 +1,193 @@
+"""Tests for the serialization of job descriptions"""
+
+import base64
+import json
+import os
+from dataclasses import asdict
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from qibo import gates
+from qibo.models import Circuit
+
+from qiboconnection.api_utils import deserialize_job_description
+from qiboconnection.serialization import (
+    DescriptionCache,
+    circuits_hash,
+    compress_array,
+    decompress_array,
+    description_cache,
+    encode_job_request,
+    escape_json_string,
+    expand_circuit_template,
+    serialize_circuit_template,
+    serialize_circuits,
+)
+from qiboconnection.typings.enums import JobType
+from qiboconnection.typings.requests import JobRequest
+from qiboconnection.util import compress_any, decompress_any
+
+
+def _build_circuit(theta: float = 0.1) -> Circuit:
+    """Builds a small parametrized circuit"""
+    circuit = Circuit(2)
+    circuit.add(gates.H(0))
+    circuit.add(gates.RX(1, theta=theta))
+    circuit.add(gates.M(0, 1))
+    return circuit
+
+
+@pytest.fixture(name="empty_description_cache", autouse=True)
+def fixture_empty_description_cache():
+    """Makes every test start and finish with an empty global description cache"""
+    description_cache.clear()
+    yield description_cache
+    description_cache.clear()
+
+
+def test_circuits_hash_depends_on_structure_and_parameters():
+    """Test equal circuits share a hash, while different parameters or gates do not."""
+    assert circuits_hash([_build_circuit()]) == circuits_hash([_build_circuit()])
+    assert circuits_hash([_build_circuit(theta=0.1)]) != circuits_hash([_build_circuit(theta=0.2)])
+
+    circuit_with_extra_gate = _build_circuit()
+    circuit_with_extra_gate.add(gates.X(0))
+    assert circuits_hash([_build_circuit()]) != circuits_hash([circuit_with_extra_gate])
+    assert circuits_hash([_build_circuit()]) != circuits_hash([_build_circuit(), _build_circuit()])
+
+
+def test_circuits_hash_follows_set_parameters():
+    """Test updating the parameters of a circuit changes its hash."""
+    circuit = _build_circuit(theta=0.1)
+    hash_before = circuits_hash([circuit])
+    circuit.set_parameters([0.3])
+    assert circuits_hash([circuit]) != hash_before
+    assert circuits_hash([circuit]) == circuits_hash([_build_circuit(theta=0.3)])
+
+
+def test_serialize_circuits_is_cached():
+    """Test serializing the same circuits twice only builds the qasm once."""
+    with patch.object(Circuit, "to_qasm", autospec=True, side_effect=lambda self: "qasm") as mocked_to_qasm:
+        first = serialize_circuits([_build_circuit()])
+        second = serialize_circuits([_build_circuit()])
+
+    assert first == second
+    assert mocked_to_qasm.call_count == 1
+    assert description_cache.hits == 1
+    assert description_cache.misses == 1
+    assert decompress_any(**json.loads(first)) == ["qasm"]
+
+
+def test_description_cache_evicts_least_recently_used():
+    """Test the cache never holds more than maxsize entries, dropping the least recently used."""
+    cache = DescriptionCache(maxsize=2)
+    cache.get_or_build("a", lambda: "A")
+    cache.get_or_build("b", lambda: "B")
+    cache.get_or_build("a", lambda: "unused")
+    cache.get_or_build("c", lambda: "C")
+
+    assert len(cache) == 2
+    assert cache.get_or_build("a", lambda: "rebuilt") == "A"
+    assert cache.get_or_build("b", lambda: "rebuilt") == "rebuilt"
+
+
+def test_description_cache_disabled():
+    """Test a cache with maxsize 0 always rebuilds the description."""
+    cache = DescriptionCache(maxsize=0)
+    cache.get_or_build("a", lambda: "A")
+    assert len(cache) == 0
+    assert cache.get_or_build("a", lambda: "B") == "B"
+
+
+def test_compress_array_roundtrip():
+    """Test arrays survive compress_array and decompress_array."""
+    array = np.arange(12, dtype=np.float64).reshape(3, 4) / 7
+    compressed = compress_array(array)
+    assert compressed["shape"] == [3, 4]
+    np.testing.assert_array_equal(decompress_array(**compressed), array)
+
+
+def test_serialize_circuit_template_roundtrip():
+    """Test a template description binds back into one circuit per parameter vector, keeping the non-trainable
+    parameters of the template."""
+    template = _build_circuit()
+    template.add(gates.RY(0, theta=0.7, trainable=False))
+    template.add(gates.U3(1, 0.1, 0.2, 0.3))
+    sweep = [[0.5, 1.0, 1.1, 1.2], [0.6, 2.0, 2.1, 2.2]]
+
+    description = deserialize_job_description(
+        raw_description=serialize_circuit_template(circuit=template, parameters=sweep), job_type=JobType.CIRCUIT
+    )
+
+    assert len(description["data"]) == 2
+    for circuit, point in zip(description["data"], sweep):
+        expected = _build_circuit(theta=point[0])
+        expected.add(gates.RY(0, theta=0.7))
+        expected.add(gates.U3(1, *point[1:]))
+        assert circuit.to_qasm() == expected.to_qasm()
+
+
+def test_serialize_circuit_template_serializes_skeleton_once():
+    """Test a sweep over the same skeleton only builds its qasm once, whatever the template parameters are."""
+    with patch.object(Circuit, "to_qasm", autospec=True, side_effect=lambda self: "qasm") as mocked_to_qasm:
+        serialize_circuit_template(circuit=_build_circuit(theta=0.1), parameters=[[0.1], [0.2]])
+        serialize_circuit_template(circuit=_build_circuit(theta=0.9), parameters=[[0.3], [0.4]])
+
+    assert mocked_to_qasm.call_count == 1
+
+
+def test_serialize_circuit_template_is_smaller_than_circuits():
+    """Test sending a sweep as a template takes fewer bytes than sending every circuit."""
+    sweep = np.linspace(0, np.pi, 200).reshape(-1, 1)
+    template_description = serialize_circuit_template(circuit=_build_circuit(), parameters=sweep)
+    circuits_description = serialize_circuits([_build_circuit(theta=point[0]) for point in sweep])
+    assert len(template_description) < len(circuits_description)
+
+
+def test_serialize_circuit_template_wrong_number_of_parameters():
+    """Test parameter vectors must have one value per trainable parameter."""
+    with pytest.raises(ValueError, match="Each parameter vector should have 1 values"):
+        serialize_circuit_template(circuit=_build_circuit(), parameters=[[0.1, 0.2]])
+
+
+def test_expand_circuit_template_binds_like_the_server():
+    """Test expanding a template on the client gives the same circuits as binding its template description."""
+    template = _build_circuit()
+    template.add(gates.U3(1, 0.1, 0.2, 0.3))
+    sweep = [[0.5, 1.0, 1.1, 1.2], [0.6, 2.0, 2.1, 2.2]]
+
+    circuits = expand_circuit_template(circuit=template, parameters=sweep)
+    description = deserialize_job_description(
+        raw_description=serialize_circuit_template(circuit=template, parameters=sweep), job_type=JobType.CIRCUIT
+    )
+
+    assert [circuit.to_qasm() for circuit in circuits] == [circuit.to_qasm() for circuit in description["data"]]
+    assert template.get_parameters() == [(0.1,), (0.1, 0.2, 0.3)]
+    with pytest.raises(ValueError, match="Each parameter vector should have 4 values"):
+        expand_circuit_template(circuit=template, parameters=[[0.1]])
+
+
+@pytest.mark.parametrize(
+    "value", ['{"data": "H4sIAAAA", "encoding": "utf-8"}', 'line\nbreak "quoted" \\', "non-ascii ü"]
+)
+def test_escape_json_string(value: str):
+    """Test strings are escaped the same way json.dumps does."""
+    assert escape_json_string(value) == json.dumps(value)[1:-1].encode("ascii")
+
+
+def test_encode_job_request_matches_json():
+    """Test the body of a submission equals the json of its request, for a big description."""
+    job_request = JobRequest(
+        user_id=1,
+        device_id=9,
+        number_shots=1000,
+        job_type=JobType.QPROGRAM,
+        description=json.dumps(compress_any(base64.b64encode(os.urandom(1_000_000)).decode())),
+        name="test",
+        summary="-",
+    )
+    body = encode_job_request(job_request)
+    json_body = json.dumps(asdict(job_request)).encode("utf-8")
+
+    assert json.loads(body) == json.loads(json_body)
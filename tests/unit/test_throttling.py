@@ -0,0 +1,142 @@
+"""Tests for the client-side throttling of the calls"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import codes
+
+from qiboconnection.connection import Connection
+from qiboconnection.throttling import RateLimit, Throttle, TokenBucket, endpoint_class, retry_after
+from qiboconnection.timeouts import deadline
+from qiboconnection.typings.enums import EndpointClass
+
+if TYPE_CHECKING:
+    from qiboconnection.instrumentation import RequestEvent
+
+
+def _response(status_code: int = codes.ok, **headers) -> MagicMock:
+    """Builds a response with the given status and headers"""
+    return MagicMock(status_code=status_code, headers=headers)
+
+
+@pytest.mark.parametrize(
+    ("method", "url", "expected"),
+    [
+        ("post", "https://host/api/v1/authorisation-tokens/refresh", EndpointClass.AUTH),
+        ("post", "https://host/api/v1/circuits", EndpointClass.SUBMISSION),
+        ("get", "https://host/api/v1/jobs/42", EndpointClass.POLLING),
+        ("get", "https://host/api/v1/jobs?page=2", EndpointClass.LISTING),
+        ("delete", "https://host/api/v1/jobs/42", EndpointClass.OTHER),
+    ],
+)
+def test_endpoint_class(method: str, url: str, expected: EndpointClass):
+    """Test calls are classified by the kind of endpoint they hit."""
+    assert endpoint_class(method=method, url=url) == expected
+
+
+def test_retry_after():
+    """Test the time to wait is read in seconds or as a date, and only for throttling responses."""
+    in_a_minute = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert retry_after(_response(codes.too_many_requests, **{"Retry-After": "3"})) == 3
+    assert 55 < retry_after(_response(codes.service_unavailable, **{"Retry-After": in_a_minute})) <= 60
+    assert retry_after(_response(codes.too_many_requests)) == 1
+    assert retry_after(_response(codes.service_unavailable)) is None
+    assert retry_after(_response(codes.ok, **{"Retry-After": "3"})) is None
+
+
+def test_token_bucket_limits_the_rate():
+    """Test tokens are handed out at the configured rate once the burst is spent."""
+    bucket = TokenBucket(rate=200, burst=5)
+    start = perf_counter()
+    for _ in range(25):
+        bucket.acquire()
+    assert perf_counter() - start >= 0.09
+
+
+def test_token_bucket_waits_are_bounded_by_the_deadline():
+    """Test waiting for a token gives up once the current deadline is reached."""
+    bucket = TokenBucket(rate=1, burst=1)
+    bucket.pause(10)
+
+    start = perf_counter()
+    with deadline(0.05), pytest.raises(TimeoutError):
+        bucket.acquire()
+    assert perf_counter() - start < 1
+
+
+def test_throttle_retries_after_the_time_asked_by_the_server():
+    """Test throttled calls wait, slow their endpoint class down and are retried."""
+    throttle = Throttle(limits={"polling": RateLimit(rate=1000, burst=10)})
+    send = MagicMock(side_effect=[_response(codes.too_many_requests, **{"Retry-After": "0.05"}), _response()])
+
+    start = perf_counter()
+    response = throttle.call(method="get", url="https://host/api/v1/jobs/1", send=send)
+
+    assert response.status_code == codes.ok
+    assert send.call_count == 2
+    assert perf_counter() - start >= 0.05
+    assert throttle.bucket("polling").rate == pytest.approx(550)
+    assert throttle.bucket("listing").rate is None
+
+
+def test_throttle_gives_up_after_max_retries():
+    """Test the throttled response is returned once the retries are exhausted."""
+    throttle = Throttle(max_retries=2)
+    send = MagicMock(return_value=_response(codes.too_many_requests, **{"Retry-After": "0"}))
+    assert (
+        throttle.call(method="post", url="https://host/api/v1/circuits", send=send).status_code
+        == codes.too_many_requests
+    )
+    assert send.call_count == 3
+
+
+def test_throttle_limits_the_concurrency():
+    """Test no more calls than allowed are in flight at the same time."""
+    throttle = Throttle(limits={EndpointClass.SUBMISSION: RateLimit(max_concurrency=2)})
+    in_flight, peak, lock = [0], [0], threading.Lock()
+
+    def send():
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return _response()
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(lambda _: throttle.call("post", "https://host/api/v1/circuits", send), range(12)))
+    assert peak[0] == 2
+
+
+def test_throttle_rejects_invalid_limits():
+    """Test unknown endpoint classes and invalid limits are rejected."""
+    with pytest.raises(ValueError):
+        Throttle(limits={"uploads": RateLimit()})
+    with pytest.raises(ValueError):
+        RateLimit(rate=0)
+
+
+@patch("qiboconnection.connection.requests.get", autospec=True)
+def test_connection_retries_throttled_calls(mocked_rest_call: MagicMock, mocked_connection: Connection):
+    """Test the connection retries the calls throttled by the server when it has a throttle, and reports the retries
+    to the request hooks."""
+    ok = MagicMock(status_code=codes.ok, headers={}, text="{}", json=MagicMock(return_value={}))
+    mocked_rest_call.side_effect = [_response(codes.too_many_requests, **{"Retry-After": "0"}), ok]
+    mocked_connection._throttle = Throttle()
+    events: List["RequestEvent"] = []
+    mocked_connection.add_request_hook(events.append)
+    try:
+        response, status_code = mocked_connection.send_get_auth_remote_api_call(path="/jobs/1")
+    finally:
+        mocked_connection._throttle = None
+        mocked_connection.remove_request_hook(events.append)
+    assert (response, status_code) == ({}, codes.ok)
+    assert mocked_rest_call.call_count == 2
+    assert [event.retries for event in events] == [1]
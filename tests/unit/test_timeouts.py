@@ -0,0 +1,127 @@
+"""Tests for the timeout policy and deadlines of the calls"""
+
+from time import perf_counter
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import HTTPError, codes
+
+from qiboconnection import connection
+from qiboconnection.api import API
+from qiboconnection.connection import Connection
+from qiboconnection.throttling import Throttle
+from qiboconnection.timeouts import Timeout, TimeoutPolicy, deadline, remaining_time
+from qiboconnection.typings.enums import EndpointClass, JobStatus
+
+
+def _ok() -> MagicMock:
+    """Builds a successful response"""
+    return MagicMock(status_code=codes.ok, headers={}, text="{}", json=MagicMock(return_value={}))
+
+
+def test_policy_defaults_by_endpoint_class(monkeypatch: pytest.MonkeyPatch):
+    """Test the default policy reads the environment once and waits longer for submissions and downloads."""
+    monkeypatch.setenv("QIBOCONNECTION_TIMEOUT", "20")
+    policy = TimeoutPolicy()
+    monkeypatch.setenv("QIBOCONNECTION_TIMEOUT", "1")
+
+    assert policy.get(EndpointClass.LISTING) == Timeout(connect=20, read=20)
+    assert policy.get(EndpointClass.SUBMISSION) == Timeout(connect=20, read=60)
+    assert policy.get(EndpointClass.POLLING) == Timeout(connect=5, read=20)
+    assert policy.download == Timeout(connect=20, read=300)
+
+
+def test_policy_with_custom_timeouts():
+    """Test a custom default applies to every endpoint class without its own timeout, and unknown ones are rejected."""
+    default = Timeout(connect=1, read=2, total=3)
+    policy = TimeoutPolicy(default=default, endpoints={"download": Timeout(read=600)})
+    assert policy.get(EndpointClass.SUBMISSION) == default
+    assert policy.download == Timeout(read=600)
+    with pytest.raises(ValueError):
+        TimeoutPolicy(endpoints={"uploads": default})
+
+
+def test_deadlines_cap_the_timeouts():
+    """Test the timeouts of a call are capped by the current deadline, which nested ones can only shorten."""
+    timeout = Timeout(connect=5, read=30)
+    assert timeout.for_requests() == (5, 30)
+    assert Timeout(connect=5, read=5).for_requests() == 5
+    assert remaining_time() is None
+
+    with deadline(10):
+        with deadline(60):
+            assert 9 < remaining_time() <= 10
+            connect, read = timeout.for_requests()
+        assert connect == 5
+        assert 9 < read <= 10
+    assert remaining_time() is None
+
+    with deadline(0), pytest.raises(TimeoutError):
+        timeout.for_requests()
+
+
+@patch("qiboconnection.connection.requests.post", autospec=True)
+@patch("qiboconnection.connection.requests.get", autospec=True)
+def test_connection_uses_the_timeouts_of_each_endpoint_class(
+    mocked_get: MagicMock, mocked_post: MagicMock, mocked_connection: Connection
+):
+    """Test calls get the timeouts of their endpoint class unless given their own."""
+    mocked_get.return_value = mocked_post.return_value = _ok()
+    policy = mocked_connection.timeouts
+
+    mocked_connection.send_post_auth_remote_api_call(path="/circuits", data={})
+    assert mocked_post.call_args.kwargs["timeout"] == policy.get(EndpointClass.SUBMISSION).for_requests()
+
+    mocked_connection.send_get_auth_remote_api_call(path="/jobs/1")
+    assert mocked_get.call_args.kwargs["timeout"] == policy.get(EndpointClass.POLLING).for_requests()
+
+    mocked_connection.send_get_auth_remote_api_call(path="/jobs/1", timeout=Timeout(connect=1, read=2))
+    assert mocked_get.call_args.kwargs["timeout"] == (1, 2)
+
+
+@patch("qiboconnection.connection.requests.get", autospec=True)
+def test_throttled_calls_are_not_retried_past_their_total_timeout(mocked_get: MagicMock, mocked_connection: Connection):
+    """Test a throttled call is given up when waiting as asked would exceed its total timeout."""
+    throttled = MagicMock(status_code=codes.too_many_requests, headers={"Retry-After": "5"}, text="{}")
+    mocked_get.return_value = throttled
+    mocked_connection._throttle = Throttle()
+    start = perf_counter()
+    try:
+        with pytest.raises(HTTPError):
+            mocked_connection.send_get_auth_remote_api_call(path="/jobs/1", timeout=Timeout(connect=1, read=1, total=1))
+    finally:
+        mocked_connection._throttle = None
+    assert mocked_get.call_count == 1
+    assert perf_counter() - start < 1
+
+
+@patch("qiboconnection.api.API.execute", autospec=True, return_value=[1])
+@patch("qiboconnection.api.API._get_job", autospec=True)
+def test_execute_and_return_results_bounds_every_poll(mocked_get_job: MagicMock, _: MagicMock, mocked_api: API):
+    """Test the polls made while waiting for results are bounded by the overall timeout, and so is the last wait."""
+    remaining: List[float | None] = []
+
+    def get_job(*_, **__) -> MagicMock:
+        remaining.append(remaining_time())
+        return MagicMock(status=JobStatus.PENDING)
+
+    mocked_get_job.side_effect = get_job
+
+    start = perf_counter()
+    with pytest.raises(TimeoutError, match="Server did not execute the jobs in time."):
+        mocked_api.execute_and_return_results(circuit=[], timeout=0.2, interval=10)
+
+    assert perf_counter() - start < 1
+    assert remaining
+    assert all(0 < seconds <= 0.2 for seconds in remaining)
+    assert remaining_time() is None
+
+
+def test_deprecated_timeout(monkeypatch: pytest.MonkeyPatch):
+    """Test the deprecated `connection.TIMEOUT` still returns the default timeout, warning about it."""
+    monkeypatch.setenv("QIBOCONNECTION_TIMEOUT", "20")
+    with pytest.warns(DeprecationWarning, match="connection.TIMEOUT is deprecated"):
+        assert connection.TIMEOUT() == 20
+    with pytest.raises(AttributeError):
+        _ = connection.UNKNOWN
@@ -0,0 +1,82 @@
+"""Tests for the pluggable tracing"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from qiboconnection.tracing import (
+    OpenTelemetryTracer,
+    RecordingTracer,
+    Tracer,
+    get_tracer,
+    set_tracer,
+    span,
+    traced,
+)
+
+
+@pytest.fixture(name="tracer")
+def fixture_tracer():
+    """Records the spans during a test"""
+    tracer = RecordingTracer()
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(None)
+
+
+@traced("outer")
+def _outer(fail: bool = False):
+    """Function traced with a decorator"""
+    with span("inner", fail=fail):
+        if fail:
+            raise ValueError("failed")
+
+
+def test_spans_are_discarded_by_default():
+    """Test the default tracer records nothing."""
+    assert type(get_tracer()) is Tracer
+    with span("operation", key="value") as current_span:
+        current_span.set_attribute("other", 1)
+
+
+def test_recording_tracer_nests_spans(tracer: RecordingTracer):
+    """Test spans are nested in the span that was running when they started, and errors are recorded."""
+    _outer()
+    with pytest.raises(ValueError, match="failed"):
+        _outer(fail=True)
+
+    inner, outer, failed_inner, failed_outer = tracer.spans
+    assert (inner.name, outer.name) == ("inner", "outer")
+    assert inner.parent is outer
+    assert outer.parent is None
+    assert tracer.children(outer) == [inner]
+    assert inner.attributes == {"fail": False}
+    assert outer.duration >= inner.duration >= 0
+    assert isinstance(failed_inner.error, ValueError)
+    assert isinstance(failed_outer.error, ValueError)
+
+
+def test_recording_tracer_keeps_latest_spans():
+    """Test the oldest spans are discarded once the maximum is reached."""
+    tracer = RecordingTracer(max_spans=2)
+    for number in range(3):
+        with tracer.start_span(name=f"span {number}", attributes={}):
+            pass
+
+    assert [recorded_span.name for recorded_span in tracer.spans] == ["span 1", "span 2"]
+    tracer.clear()
+    assert not tracer.spans
+
+
+def test_opentelemetry_tracer():
+    """Test spans are created with the OpenTelemetry tracer, with attributes OpenTelemetry accepts."""
+    otel_tracer = MagicMock()
+    tracer = OpenTelemetryTracer(tracer=otel_tracer)
+
+    with tracer.start_span(name="operation", attributes={"job_id": 1, "device": [1, 2], "missing": None}) as otel_span:
+        otel_span.set_attribute("bytes", 10)
+
+    otel_tracer.start_as_current_span.assert_called_once_with("operation", attributes={"job_id": 1, "device": "[1, 2]"})
+    otel_tracer.start_as_current_span.return_value.__enter__.return_value.set_attribute.assert_called_once_with(
+        "bytes", 10
+    )
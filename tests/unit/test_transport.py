@@ -0,0 +1,220 @@
+"""Tests for the transports recording and replaying the HTTP calls"""
+
+import base64
+import gzip
+import json
+from dataclasses import asdict
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from qiboconnection.connection import Connection
+from qiboconnection.errors import ConnectionException
+from qiboconnection.transport import (
+    RecordedExchange,
+    RecordingTransport,
+    ReplayTransport,
+    Transport,
+    _build_response,
+    read_recording,
+)
+
+ACCESS_TOKEN = jwt.encode({"user_id": 7, "email": "someone@qilimanjaro.tech"}, "secret", algorithm="HS256")
+
+
+class FakeServerTransport(Transport):
+    """Transport answering a login and the polling of a job, which completes on the second call"""
+
+    def __init__(self):
+        self.polls = 0
+
+    def request(self, method: str, url: str, **kwargs):
+        content: dict
+        if url.endswith("/authorisation-tokens"):
+            content = {"accessToken": ACCESS_TOKEN, "refreshToken": ACCESS_TOKEN, "tokenType": "bearer"}
+        else:
+            self.polls += 1
+            content = {"job_id": 1, "status": "completed" if self.polls > 1 else "pending"}
+        exchange = RecordedExchange(
+            method=method,
+            path=url,
+            status_code=200,
+            reason="OK",
+            headers={"Content-Type": "application/json", "Set-Cookie": "session=secret"},
+            content=json.dumps(content),
+            started=0.0,
+            duration=0.25,
+        )
+        return _build_response(exchange=exchange, method=method, url=url, **kwargs)
+
+
+def _record(path: str) -> None:
+    """Records a login and two polls of a job"""
+    with RecordingTransport(path, transport=FakeServerTransport()) as transport:
+        transport.request("post", "https://server/api/v1/authorisation-tokens", json={"assertion": "my-api-key"})
+        for _ in range(2):
+            transport.request("get", "https://server/api/v1/jobs/1", headers={"Authorization": "Bearer token"})
+
+
+def test_recording_redacts_secrets(tmp_path):
+    """Test neither the api key, the tokens nor the secret headers are written, but tokens can still be decoded."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    _record(path)
+
+    with gzip.open(path, "rt", encoding="utf-8") as recording:
+        raw = recording.read()
+    assert not any(secret in raw for secret in ("my-api-key", ACCESS_TOKEN, "someone@", "session=secret", "Bearer"))
+
+    login, *polls = read_recording(path)
+    assert login.request == {"assertion": "***"}
+    token = json.loads(login.content)["accessToken"]
+    assert jwt.decode(token, options={"verify_signature": False}) == {"user_id": 7}
+    assert [poll.path for poll in polls] == ["/api/v1/jobs/1"] * 2
+    assert polls[1].started >= polls[0].started
+
+
+def test_recording_redacts_raw_bodies(tmp_path):
+    """Test json bodies sent as raw data are recorded redacted, binary ones base64 encoded, and responses are redacted
+    whatever their content type."""
+
+    class PlainTextTransport(Transport):
+        """Transport answering tokens without a json content type"""
+
+        def request(self, method: str, url: str, **kwargs):
+            exchange = RecordedExchange(
+                method=method,
+                path=url,
+                status_code=200,
+                reason="OK",
+                headers={"Content-Type": "text/plain"},
+                content=json.dumps({"accessToken": ACCESS_TOKEN}),
+                started=0.0,
+                duration=0.1,
+            )
+            return _build_response(exchange=exchange, method=method, url=url, **kwargs)
+
+    path = str(tmp_path / "traffic.jsonl.gz")
+    with RecordingTransport(path, transport=PlainTextTransport()) as transport:
+        transport.request("post", "https://server/api/v1/circuits", data=b'{"description": "{}", "apiKey": "secret"}')
+        transport.request("post", "https://server/api/v1/files", data=b"\x89PNG")
+
+    submission, upload = read_recording(path)
+    assert submission.request == {"description": "{}", "apiKey": "***"}
+    assert ACCESS_TOKEN not in submission.content
+    assert upload.base64_request
+    assert base64.b64decode(upload.request) == b"\x89PNG"
+
+
+def test_transports_implement_request():
+    """Test transports cannot be built without implementing how calls are made."""
+    with pytest.raises(TypeError):
+        Transport()  # type: ignore[abstract]
+
+
+def test_replay_serves_the_recorded_responses_in_order(tmp_path):
+    """Test calls get the recorded responses in order, the last one being repeated once they run out."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    _record(path)
+    transport = ReplayTransport(path)
+    assert transport.pending == 3
+
+    login = transport.request("post", "http://localhost:8080/api/v1/authorisation-tokens", json={})
+    assert login.status_code == 200
+    assert jwt.decode(login.json()["accessToken"], options={"verify_signature": False}) == {"user_id": 7}
+    statuses = [transport.request("get", "http://localhost:8080/api/v1/jobs/1").json()["status"] for _ in range(3)]
+    assert statuses == ["pending", "completed", "completed"]
+    assert transport.pending == 0
+    with pytest.raises(ConnectionException):
+        transport.request("get", "http://localhost:8080/api/v1/jobs/2")
+
+
+def _write_recording(path: str, exchanges: list) -> None:
+    """Writes a recording with the given exchanges"""
+    with gzip.open(path, "wt", encoding="utf-8") as recording:
+        recording.writelines(json.dumps(asdict(exchange)) + "\n" for exchange in exchanges)
+
+
+def test_replay_speed(tmp_path):
+    """Test responses are delayed by their recorded duration, compressed by the speed, and only when replaying with a
+    speed."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    _write_recording(
+        path,
+        [
+            RecordedExchange(
+                method="get",
+                path="/api/v1/jobs/1",
+                status_code=200,
+                reason="OK",
+                headers={},
+                content="{}",
+                started=0.0,
+                duration=0.5,
+            )
+        ],
+    )
+    with pytest.raises(ValueError):
+        ReplayTransport(path, speed=0)
+
+    with (
+        patch("qiboconnection.transport.perf_counter", return_value=100.0),
+        patch("qiboconnection.transport.sleep") as mocked_sleep,
+    ):
+        ReplayTransport(path, speed=10).request("get", "https://server/api/v1/jobs/1")
+        ReplayTransport(path).request("get", "https://server/api/v1/jobs/1")
+    mocked_sleep.assert_called_once()
+    assert mocked_sleep.call_args.args[0] == pytest.approx(0.05)
+
+
+def test_replay_reproduces_the_time_between_calls(tmp_path):
+    """Test responses are not served before the time they were received since the recording started, nor faster than
+    their recorded duration."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    _write_recording(
+        path,
+        [
+            RecordedExchange(
+                method="get", path="/api/v1/jobs/1", status_code=200, reason="OK", headers={}, content="{}", **timing
+            )
+            for timing in ({"started": 0.0, "duration": 0.5}, {"started": 2.0, "duration": 0.5})
+        ],
+    )
+    with (
+        patch("qiboconnection.transport.perf_counter", side_effect=[100.0, 100.0, 100.6, 103.0]),
+        patch("qiboconnection.transport.sleep") as mocked_sleep,
+    ):
+        transport = ReplayTransport(path, speed=1)
+        for _ in range(3):
+            transport.request("get", "https://server/api/v1/jobs/1")
+
+    assert [call.args[0] for call in mocked_sleep.call_args_list] == pytest.approx([0.5, 1.9, 0.5])
+
+
+def test_replay_matches_the_query_parameters(tmp_path):
+    """Test the parameters of the calls are part of the recorded paths, whatever their order."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    with RecordingTransport(path, transport=FakeServerTransport()) as transport:
+        transport.request("get", "https://server/api/v1/jobs", params={"page": 2, "favourites": True})
+
+    (listing,) = read_recording(path)
+    assert listing.path == "/api/v1/jobs?favourites=True&page=2"
+    transport = ReplayTransport(path)
+    assert transport.request("get", "https://server/api/v1/jobs?page=2", params={"favourites": True}).ok
+    with pytest.raises(ConnectionException):
+        transport.request("get", "https://server/api/v1/jobs", params={"page": 3, "favourites": True})
+
+
+def test_connection_calls_go_through_the_transport(tmp_path, mocked_connection: Connection):
+    """Test the connection makes its calls through its transport."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    _record(path)
+    transport, api_url = mocked_connection._transport, mocked_connection._remote_server_api_url
+    mocked_connection._transport = ReplayTransport(path)
+    mocked_connection._remote_server_api_url = "https://server/api/v1"
+    try:
+        response, _ = mocked_connection.send_get_auth_remote_api_call(path="/jobs/1")
+    finally:
+        mocked_connection._transport = transport
+        mocked_connection._remote_server_api_url = api_url
+    assert response == {"job_id": 1, "status": "pending"}
@@ -0,0 +1,80 @@
+"""Tests for the configurable runtime type checking"""
+
+import os
+import subprocess
+import sys
+from types import MappingProxyType
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from qibo.models import Circuit
+from typeguard import TypeCheckError
+
+from qiboconnection.api import API
+from qiboconnection.models.devices import create_device
+from qiboconnection.typechecking import set_typechecking, typechecked, typechecking_enabled
+
+
+@typechecked
+def _submit(circuits: List[Circuit], payload: dict, nshots: int = 10) -> int:
+    """Function with a signature like the ones in the submission path"""
+    return len(circuits) * nshots + len(payload)
+
+
+@pytest.fixture(name="restore_typechecking", autouse=True)
+def fixture_restore_typechecking():
+    """Makes sure every test leaves the type checks enabled"""
+    yield
+    set_typechecking(True)
+
+
+def test_typechecking_can_be_disabled():
+    """Test wrong arguments are only rejected while type checks are enabled."""
+    assert typechecking_enabled()
+    with pytest.raises(TypeCheckError):
+        _submit(circuits=["not a circuit"], payload={})
+
+    set_typechecking(False)
+    assert not typechecking_enabled()
+    assert _submit(circuits=["not a circuit"], payload={}) == 10
+    assert _submit.__name__ == "_submit"
+
+
+def test_typechecking_removed_through_environment_variable():
+    """Test the environment variable leaves the functions undecorated, and type checks cannot be enabled then."""
+    code = (
+        "from qiboconnection.models.devices import Devices\n"
+        "from qiboconnection.typechecking import set_typechecking\n"
+        "assert not hasattr(Devices.add, '__wrapped__')\n"
+        "try:\n"
+        "    set_typechecking(True)\n"
+        "except ValueError:\n"
+        "    print('removed')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "QIBOCONNECTION_TYPECHECKING": "off"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "removed"
+
+
+def test_typechecking_switch_applies_to_every_decorated_function():
+    """Test the switch applies to every decorated function, e.g. to building the devices retrieved when polling."""
+    device_input = MappingProxyType({"id": 1, "name": "dev", "status": "online", "number_pending_jobs": 3})
+    with pytest.raises(TypeCheckError):
+        create_device(device_input=device_input)
+
+    set_typechecking(False)
+    assert create_device(device_input=device_input).id == 1
+
+
+def test_annotations_with_lazily_imported_types_are_checked():
+    """Test the annotations naming qibo or numpy, only imported for type checking, are still checked."""
+    with pytest.raises(TypeCheckError, match='argument "circuit"'):
+        API.execute(MagicMock(spec=API), circuit=123)
+    with pytest.raises(TypeCheckError, match='argument "parameters"'):
+        API.execute(MagicMock(spec=API), circuit=Circuit(1), parameters="not parameters")
@@ -1,14 +1,33 @@
 """Tests util functions"""
 
 import json
+import sys
+from inspect import signature
+from unittest.mock import patch
 
 import pytest
 from requests.models import Response
 
-from qiboconnection.api_utils import deserialize_job_description
-from qiboconnection.typings.enums import JobType
+from qiboconnection.api_utils import (
+    deserialize_job_description,
+    merge_circuit_results,
+    parse_job_responses_to_results,
+    split_shots,
+)
+from qiboconnection.typings.enums import JobStatus, JobType
+from qiboconnection.typings.responses import JobListingItemResponse
 from qiboconnection.typings.responses.job_response import JobResponse
-from qiboconnection.util import base64_decode, base64url_encode, from_kwargs, process_response
+from qiboconnection.util import (
+    _kwargs_builder,
+    _zstd,
+    base64_decode,
+    base64url_encode,
+    compress_any,
+    compressed_envelope,
+    decompress_any,
+    from_kwargs,
+    process_response,
+)
 
 
 def test_base64url_encode():
@@ -127,3 +146,139 @@ def test_from_kwargs():
             from_kwargs(JobResponse, user_id=1, device_id=2, number_shots=10, extra_arg="Extra Argument"),
             JobResponse,
         )
+
+
+def test_parse_job_responses_to_results_in_process_pool():
+    """Test that decoding results in a process pool returns the same as decoding them serially, keeping the order and
+    the None placeholders of the non-completed jobs."""
+    job_responses = [
+        JobResponse(
+            user_id=1,
+            device_id=1,
+            number_shots=10,
+            job_type=JobType.QPROGRAM,
+            description="",
+            job_id=job_id,
+            queue_position=0,
+            status=JobStatus.PENDING if job_id == 2 else JobStatus.COMPLETED,
+            result=json.dumps(compress_any({"job": job_id, "values": list(range(job_id))})),
+            name="test",
+            summary="test",
+        )
+        for job_id in range(5)
+    ]
+
+    serial_results = parse_job_responses_to_results(job_responses=job_responses)
+    parallel_results = parse_job_responses_to_results(job_responses=job_responses, max_workers=2)
+
+    assert parallel_results == serial_results
+    assert parallel_results[2] is None
+    assert parallel_results[3] == {"job": 3, "values": [0, 1, 2]}
+
+
+@pytest.mark.parametrize(
+    "nshots, weights, expected",
+    [(1000, [1, 1], [500, 500]), (10, [1, 1, 1], [4, 3, 3]), (10, [0.5, 0.25, 0.25], [5, 3, 2]), (1, [1, 3], [0, 1])],
+)
+def test_split_shots(nshots: int, weights: list, expected: list):
+    """Test shots are split proportionally to the weights, without losing any."""
+    assert split_shots(nshots=nshots, weights=weights) == expected
+
+
+def test_split_shots_with_invalid_weights():
+    """Test weights must be non-negative and not all zero."""
+    with pytest.raises(ValueError, match="Weights should be non-negative and not all zero."):
+        split_shots(nshots=10, weights=[0, 0])
+    with pytest.raises(ValueError, match="Weights should be non-negative and not all zero."):
+        split_shots(nshots=10, weights=[1, -1])
+
+
+def test_merge_circuit_results():
+    """Test the counts of partial executions are added up and the probabilities recomputed."""
+    first = [{"probabilities": {"0": 0.25, "1": 0.75}, "counts": {"0": 1, "1": 3}, "samples": [[0], [1], [1], [1]]}]
+    second = [{"probabilities": {"0": 1.0}, "counts": {"0": 4}, "samples": [[0], [0], [0], [0]]}]
+
+    merged = merge_circuit_results(results=[first, second])
+
+    assert merged == [
+        {
+            "probabilities": {"0": 0.625, "1": 0.375},
+            "counts": {"0": 5, "1": 3},
+            "samples": [[0], [1], [1], [1], [0], [0], [0], [0]],
+        }
+    ]
+
+
+def test_merge_circuit_results_with_missing_results():
+    """Test results can only be merged when every job completed with the same circuits."""
+    result = [{"probabilities": {"0": 1.0}, "counts": {"0": 4}}]
+    with pytest.raises(ValueError, match="some job did not complete"):
+        merge_circuit_results(results=[result, None])
+    with pytest.raises(ValueError, match="different number of circuits"):
+        merge_circuit_results(results=[result, result * 2])
+
+
+def _uncached_from_kwargs(cls, **kwargs):
+    """Reference implementation of from_kwargs inspecting the signature of the class on every call"""
+    cls_fields = set(signature(cls).parameters)
+    ret = cls(**{name: val for name, val in kwargs.items() if name in cls_fields})
+    for name, val in kwargs.items():
+        if name not in cls_fields:
+            setattr(ret, name, val)
+    return ret
+
+
+@pytest.mark.parametrize("extra_fields", [{}, {"name": "job", "summary": "-"}])
+def test_from_kwargs_inspects_each_class_once(extra_fields: dict):
+    """Test from_kwargs builds the same objects as inspecting the class signature on every call, which is what listings
+    used to spend most of their parsing time on, while only inspecting it the first time."""
+    kwargs: dict = {
+        "status": "completed",
+        "user_id": 1,
+        "device_id": 9,
+        "job_type": "circuit",
+        "number_shots": 10,
+        "id": 3,
+    }
+    kwargs |= extra_fields
+    _kwargs_builder.cache_clear()
+
+    objects = [from_kwargs(JobListingItemResponse, **kwargs) for _ in range(3)]
+
+    assert all(built.__dict__ == _uncached_from_kwargs(JobListingItemResponse, **kwargs).__dict__ for built in objects)
+    cache_info = _kwargs_builder.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 2)
+
+
+def test_compressed_envelope_detection():
+    """Tests compressed payloads are told apart from base64 ones and decompressed back."""
+    envelope = compress_any({"a": 0})
+    assert compressed_envelope(json.dumps(envelope)) == envelope
+    assert decompress_any(**envelope) == {"a": 0}
+    assert compressed_envelope("eyJhIjogMH0=") is None
+    assert compressed_envelope('{"a": 0}') is None
+    assert compressed_envelope("{not json") is None
+    assert compressed_envelope(None) is None
+    with pytest.raises(ValueError):
+        compress_any({"a": 0}, compression="lzma")
+
+
+def test_zstd_compression():
+    """Tests zstd envelopes round-trip when zstd is available, and explain how to install it otherwise."""
+    try:
+        envelope = compress_any({"a": [0] * 100}, compression="zstd")
+    except ImportError:
+        pass
+    else:
+        assert envelope["compression"] == "zstd"
+        assert decompress_any(**json.loads(json.dumps(envelope))) == {"a": [0] * 100}
+
+    _zstd.cache_clear()
+    try:
+        with (
+            patch.dict(sys.modules, {"compression": None, "zstandard": None}),
+            pytest.raises(ImportError, match="qiboconnection\\[zstd\\]"),
+        ):
+            compress_any({"a": 0}, compression="zstd")
+    finally:
+        _zstd.cache_clear()